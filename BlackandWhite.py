@@ -4,6 +4,8 @@ from PyQt6.QtWidgets import QApplication, QWidget, QPushButton, QFileDialog, QMe
 from PyQt6.QtGui import QIcon
 from PyQt6.QtCore import Qt
 
+from procesamiento import filtros
+
 
 class ImageConverter(QWidget):
     def __init__(self):
@@ -37,7 +39,7 @@ class ImageConverter(QWidget):
 
             image = cv2.imread(file_path)
 
-            grayscale_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            grayscale_image = filtros.grayscale(image)
 
             save_path, _ = QFileDialog.getSaveFileName(
                 self, "Guardar imagen en escala de grises", "", "Archivos PNG (*.png);;Archivos JPEG (*.jpg);;Archivos BMP (*.bmp)")
@@ -58,4 +60,5 @@ def main():
     sys.exit(app.exec())
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,14 @@
 import sys
 import cv2
-import numpy as np
 from PyQt6.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget, QHBoxLayout, QFileDialog, QPushButton
-from PyQt6.QtGui import QPixmap, QImage
 from PyQt6.QtCore import Qt
 
+from interfaz.imagenes import array_to_qpixmap
+from procesamiento.distorsion import undistort
+
 
 def convert_cv_to_qt(image):
-    height, width, channel = image.shape
-    bytes_per_line = 3 * width
-    q_image = QImage(image.data, width, height,
-                     bytes_per_line, QImage.Format.Format_RGB888)
-    return QPixmap.fromImage(q_image)
+    return array_to_qpixmap(image)
 
 
 class ImageComparisonWindow(QWidget):
@@ -48,22 +45,12 @@ class ImageComparisonWindow(QWidget):
         if file_name:
             image = cv2.imread(file_name)
             if image is not None:
-                image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
                 screen_width = self.width() // 2
                 screen_height = self.height() // 2
                 resized_image = cv2.resize(
                     image, (screen_width, screen_height))
 
-                h, w = resized_image.shape[:2]
-                focal_length = w
-                center = (w / 2, h / 2)
-                camera_matrix = np.array([[focal_length, 0, center[0]],
-                                          [0, focal_length, center[1]],
-                                          [0, 0, 1]])
-
-                dist_coeffs = np.array([-0.3, 0.1, 0, 0, 0])
-                undistorted_image = cv2.undistort(
-                    resized_image, camera_matrix, dist_coeffs)
+                undistorted_image = undistort(resized_image)
 
                 original_pixmap = convert_cv_to_qt(resized_image)
                 corrected_pixmap = convert_cv_to_qt(undistorted_image)
@@ -75,7 +62,12 @@ class ImageComparisonWindow(QWidget):
                 self.corrected_label.resize(corrected_pixmap.size())
 
 
-app = QApplication(sys.argv)
-window = ImageComparisonWindow()
-window.resize(1600, 900)
-sys.exit(app.exec())
+def main():
+    app = QApplication(sys.argv)
+    window = ImageComparisonWindow()
+    window.resize(1600, 900)
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
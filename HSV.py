@@ -1,8 +1,17 @@
 import cv2
 import numpy as np
-from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout, QSlider, QPushButton, QFileDialog
+from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout, QSlider, QPushButton, QFileDialog, QSizePolicy, QMessageBox
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtGui import QPixmap
+
+from interfaz.imagenes import array_to_qimage
+from interfaz.recalculo import RecalculoDiferido
+from procesamiento.hsv import AjusteHSV
+
+# Tamaño de la vista previa mientras la ventana no se ha mostrado
+PREVIEW_SIZE = (640, 480)
+# Espera sin cambios antes de procesar la resolución completa
+FULL_RES_DELAY_MS = 300
 
 
 class HSVAdjuster(QWidget):
@@ -10,11 +19,32 @@ class HSVAdjuster(QWidget):
         super().__init__()
         self.image = None
         self.hsv_image = None
+        self.preview_hsv = None
+        # Resultado en resolución completa; None si los sliders cambiaron
         self.current_image = None
+        # Cada uno solo se usa desde su hilo de recalculo
+        self.preview_adjuster = AjusteHSV()
+        self.export_adjuster = AjusteHSV()
+
+        # Los sliders solo actualizan la vista previa; la resolución
+        # completa se procesa al soltar el slider o tras una pausa.
+        # Ambas corren en segundo plano y solo se entrega la última.
+        self.preview_job = RecalculoDiferido(self.render_preview, parent=self)
+        self.preview_job.resultado.connect(self.set_preview)
+        self.preview_job.error.connect(self.show_error)
+        self.full_res_job = RecalculoDiferido(
+            self.render_full_image, FULL_RES_DELAY_MS, parent=self)
+        self.full_res_job.resultado.connect(self.set_full_image)
+        self.full_res_job.error.connect(self.show_error)
 
         self.setWindowTitle("HSV Adjuster")
         self.layout = QVBoxLayout()
         self.image_label = QLabel()
+        # El tamaño lo decide la ventana, no la imagen
+        self.image_label.setSizePolicy(
+            QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+        self.image_label.setMinimumSize(*PREVIEW_SIZE)
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.layout.addWidget(self.image_label)
 
         self.load_button = QPushButton("Load Image")
@@ -25,18 +55,21 @@ class HSVAdjuster(QWidget):
         self.hue_slider = QSlider(Qt.Orientation.Horizontal)
         self.hue_slider.setRange(0, 179)
         self.hue_slider.valueChanged.connect(self.update_image)
+        self.hue_slider.sliderReleased.connect(self.full_res_job.adelantar)
         self.layout.addWidget(self.hue_slider)
 
         # Barra deslizante para ajustar la saturación (Saturation) de la imagen
         self.saturation_slider = QSlider(Qt.Orientation.Horizontal)
         self.saturation_slider.setRange(0, 255)
         self.saturation_slider.valueChanged.connect(self.update_image)
+        self.saturation_slider.sliderReleased.connect(self.full_res_job.adelantar)
         self.layout.addWidget(self.saturation_slider)
 
         # Barra deslizante para ajustar el brillo (Value) de la imagen
         self.value_slider = QSlider(Qt.Orientation.Horizontal)
         self.value_slider.setRange(0, 255)
         self.value_slider.valueChanged.connect(self.update_image)
+        self.value_slider.sliderReleased.connect(self.full_res_job.adelantar)
         self.layout.addWidget(self.value_slider)
 
         self.save_button = QPushButton("Save Image")
@@ -51,40 +84,94 @@ class HSVAdjuster(QWidget):
         if file_path:
             self.image = cv2.imread(file_path)
             self.hsv_image = cv2.cvtColor(self.image, cv2.COLOR_BGR2HSV)
-            self.current_image = self.hsv_image.copy()
+            self.preview_hsv = None
             self.update_image()
 
+    def hsv_values(self):
+        return (self.hue_slider.value(), self.saturation_slider.value(),
+                self.value_slider.value())
+
+    def preview_shape(self):
+        height, width = self.image.shape[:2]
+        if self.image_label.isVisible():
+            target_width = self.image_label.width()
+            target_height = self.image_label.height()
+        else:
+            target_width, target_height = PREVIEW_SIZE
+        scale = min(target_width / width, target_height / height, 1.0)
+        return max(1, int(height * scale)), max(1, int(width * scale))
+
+    def build_preview(self):
+        # Se reduce en BGR y luego se convierte, para no promediar tonos
+        height, width = self.preview_shape()
+        preview = self.image
+        if (height, width) != self.image.shape[:2]:
+            preview = cv2.resize(self.image, (width, height),
+                                 interpolation=cv2.INTER_AREA)
+        self.preview_hsv = cv2.cvtColor(preview, cv2.COLOR_BGR2HSV)
+
     def update_image(self):
         if self.image is not None:
-            h = self.hue_slider.value()
-            s = self.saturation_slider.value()
-            v = self.value_slider.value()
-
-            modified_image = self.hsv_image.copy()
-            modified_image[:, :, 0] = np.clip(
-                modified_image[:, :, 0] + (h - modified_image[:, :, 0]), 0, 179)
-            modified_image[:, :, 1] = np.clip(
-                modified_image[:, :, 1] * (s / 255.0), 0, 255)
-            modified_image[:, :, 2] = np.clip(
-                modified_image[:, :, 2] * (v / 255.0), 0, 255)
-
-            bgr_image = cv2.cvtColor(modified_image, cv2.COLOR_HSV2BGR)
-            height, width, channel = bgr_image.shape
-            bytes_per_line = 3 * width
-            q_image = QImage(bgr_image.data, width, height,
-                             bytes_per_line, QImage.Format.Format_BGR888)
-            self.image_label.setPixmap(QPixmap.fromImage(q_image))
+            self.current_image = None
+            self.full_res_job.solicitar(self.hsv_image, self.hsv_values())
+            self.show_preview()
+
+    def show_preview(self):
+        if self.preview_hsv is None or self.preview_hsv.shape[:2] != self.preview_shape():
+            self.build_preview()
+        self.preview_job.solicitar(self.preview_hsv, self.hsv_values())
+
+    # Corre en el hilo de recalculo
+    def render_preview(self, preview_hsv, values):
+        bgr_image = self.preview_adjuster.escalar(preview_hsv, *values)
+        # Copia: el buffer del ajustador se reutiliza en la siguiente llamada
+        return array_to_qimage(bgr_image).copy()
+
+    def set_preview(self, q_image):
+        self.image_label.setPixmap(QPixmap.fromImage(q_image))
+
+    # Corre en el hilo de recalculo
+    def render_full_image(self, hsv_image, values):
+        return self.export_adjuster.escalar(
+            hsv_image, *values, out=np.empty_like(hsv_image))
+
+    def set_full_image(self, image):
+        self.current_image = image
+
+    def render_full_resolution(self):
+        if self.image is not None and self.current_image is None:
+            self.full_res_job.cancelar()
+            self.current_image = AjusteHSV().escalar(
+                self.hsv_image, *self.hsv_values())
+
+    def show_error(self, error):
+        QMessageBox.warning(self, "Error", f"No se pudo procesar la imagen: {error}")
+
+    def closeEvent(self, event):
+        self.preview_job.cerrar()
+        self.full_res_job.cerrar()
+        super().closeEvent(event)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.image is not None:
+            self.show_preview()
 
     def save_image(self):
         if self.image is not None:
             filename, _ = QFileDialog.getSaveFileName(
                 self, "Save Image", "", "Images (*.png *.xpm *.jpg)")
             if filename:
-                bgr_image = cv2.cvtColor(self.current_image, cv2.COLOR_HSV2BGR)
-                cv2.imwrite(filename, bgr_image)
+                self.render_full_resolution()
+                cv2.imwrite(filename, self.current_image)
+
+
+def main():
+    app = QApplication([])
+    window = HSVAdjuster()
+    window.show()
+    app.exec()
 
 
-app = QApplication([])
-window = HSVAdjuster()
-window.show()
-app.exec()
+if __name__ == "__main__":
+    main()
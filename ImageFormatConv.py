@@ -1,13 +1,13 @@
 import sys
 from PyQt6.QtWidgets import QApplication, QLabel, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, QFileDialog, QComboBox, QMessageBox
-from PyQt6.QtGui import QPixmap, QImage
+from PyQt6.QtGui import QPixmap
 from PyQt6.QtCore import Qt
 import cv2
-import numpy as np
-from colormath.color_objects import sRGBColor, CMYKColor
-from colormath.color_conversions import convert_color
 from PIL import Image
 
+from interfaz.imagenes import array_to_qimage
+from procesamiento.color import bgr_to_cmyk, cmyk_to_bgr
+
 
 class ImageConverter(QWidget):
     def __init__(self):
@@ -59,12 +59,10 @@ class ImageConverter(QWidget):
         label.setPixmap(QPixmap.fromImage(qimage))
 
     def convert_cv_qt(self, cv_img):
-        rgb_image = cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_image.shape
-        bytes_per_line = ch * w
-        convert_to_Qt_format = QImage(
-            rgb_image.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-        return convert_to_Qt_format.scaled(500, 500, Qt.AspectRatioMode.KeepAspectRatio)
+        # Las imágenes CMYK se muestran con sus tres primeros canales
+        if cv_img.shape[2] == 4:
+            cv_img = cv_img[:, :, :3]
+        return array_to_qimage(cv_img).scaled(500, 500, Qt.AspectRatioMode.KeepAspectRatio)
 
     def convert_image(self):
         if self.image is None:
@@ -91,36 +89,10 @@ class ImageConverter(QWidget):
             return img
 
     def convert_to_cmyk(self, img):
-        rgb_img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        h, w, _ = rgb_img.shape
-        cmyk_img = np.zeros((h, w, 4), dtype=np.uint8)
-
-        for i in range(h):
-            for j in range(w):
-                rgb = sRGBColor(
-                    rgb_img[i, j, 0] / 255.0, rgb_img[i, j, 1] / 255.0, rgb_img[i, j, 2] / 255.0)
-                cmyk = convert_color(rgb, CMYKColor)
-                cmyk_img[i, j, 0] = int(cmyk.get_value_tuple()[0] * 255)
-                cmyk_img[i, j, 1] = int(cmyk.get_value_tuple()[1] * 255)
-                cmyk_img[i, j, 2] = int(cmyk.get_value_tuple()[2] * 255)
-                cmyk_img[i, j, 3] = int(cmyk.get_value_tuple()[3] * 255)
-
-        return cmyk_img
+        return bgr_to_cmyk(img)
 
     def cmyk_to_rgb(self, img):
-        h, w, _ = img.shape
-        rgb_img = np.zeros((h, w, 3), dtype=np.uint8)
-
-        for i in range(h):
-            for j in range(w):
-                cmyk = CMYKColor(img[i, j, 0] / 255.0, img[i, j, 1] /
-                                 255.0, img[i, j, 2] / 255.0, img[i, j, 3] / 255.0)
-                rgb = convert_color(cmyk, sRGBColor)
-                rgb_img[i, j, 0] = int(rgb.clamped_rgb_r * 255)
-                rgb_img[i, j, 1] = int(rgb.clamped_rgb_g * 255)
-                rgb_img[i, j, 2] = int(rgb.clamped_rgb_b * 255)
-
-        return cv2.cvtColor(rgb_img, cv2.COLOR_RGB2BGR)
+        return cmyk_to_bgr(img)
 
     def save_image(self):
         if self.converted_image is None:
@@ -145,4 +117,5 @@ def main():
     sys.exit(app.exec())
 
 
-main()
+if __name__ == "__main__":
+    main()
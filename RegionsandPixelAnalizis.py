@@ -1,9 +1,10 @@
 import sys
 import cv2
-import numpy as np
 from PyQt6.QtWidgets import QApplication, QLabel, QMainWindow, QVBoxLayout, QPushButton, QFileDialog, QWidget
-from PyQt6.QtGui import QPixmap, QImage, QPainter, QColor
-from PyQt6.QtCore import Qt
+
+from interfaz.recalculo import RecalculoDiferido
+from interfaz.visor import VisorCapas
+from procesamiento.regiones import IndiceRegiones
 
 
 class ImageGrid(QMainWindow):
@@ -12,13 +13,18 @@ class ImageGrid(QMainWindow):
         self.setWindowTitle(
             'Seleccionar un Píxel y Detectar Regiones Conectadas')
         self.image = None
-        self.qimage = None
         self.grid_size = 10
         self.selected_pixel = None
-        self.connected_image = None
-
-        self.image_label = QLabel(self)
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.selected_label = None
+        self.region_index = None
+        # El índice de regiones se construye en segundo plano al cargar
+        self.index_job = RecalculoDiferido(IndiceRegiones, parent=self)
+        self.index_job.resultado.connect(self.set_region_index)
+        self.index_job.error.connect(self.show_index_error)
+
+        self.viewer = VisorCapas(self)
+        self.viewer.pixel_seleccionado.connect(self.get_pixel_position)
+        self.viewer.latencia.connect(self.show_latency)
         self.info_label = QLabel('Cargar una imagen para comenzar', self)
 
         self.load_button = QPushButton('Cargar Imagen', self)
@@ -28,11 +34,16 @@ class ImageGrid(QMainWindow):
         self.download_button.clicked.connect(self.download_image)
         self.download_button.setEnabled(False)
 
+        self.export_button = QPushButton('Exportar Regiones', self)
+        self.export_button.clicked.connect(self.export_regions)
+        self.export_button.setEnabled(False)
+
         self.main_layout = QVBoxLayout()
-        self.main_layout.addWidget(self.image_label)
+        self.main_layout.addWidget(self.viewer)
         self.main_layout.addWidget(self.info_label)
         self.main_layout.addWidget(self.load_button)
         self.main_layout.addWidget(self.download_button)
+        self.main_layout.addWidget(self.export_button)
 
         container = QWidget()
         container.setLayout(self.main_layout)
@@ -44,84 +55,90 @@ class ImageGrid(QMainWindow):
             self, 'Seleccionar Imagen', '', 'Imagenes (*.png *.jpg *.bmp)')
         if file_path:
             self.image = cv2.imread(file_path, cv2.IMREAD_GRAYSCALE)
+            # Todas las regiones se etiquetan una vez; los clics solo consultan.
+            # Hasta que el índice esté listo la imagen se ve pero no responde
+            self.region_index = None
+            self.selected_label = None
+            self.download_button.setEnabled(False)
+            self.export_button.setEnabled(False)
+            self.info_label.setText('Indexando regiones...')
+            self.index_job.solicitar(self.image)
             self.display_image()
 
+    def set_region_index(self, region_index):
+        self.region_index = region_index
+        self.export_button.setEnabled(True)
+        self.info_label.setText(
+            f'{len(region_index)} regiones; selecciona un píxel para ver su región')
+
+    def show_index_error(self, error):
+        self.info_label.setText(f'No se pudieron indexar las regiones: {error}')
+
     def display_image(self):
-        height, width = self.image.shape
-        bytes_per_line = width
-        self.qimage = QImage(self.image.data, width, height,
-                             bytes_per_line, QImage.Format.Format_Grayscale8)
-
-        pixmap = QPixmap.fromImage(self.qimage)
-        self.image_label.setPixmap(pixmap)
-        self.image_label.mousePressEvent = self.get_pixel_position
-        self.draw_grid()
-
-    def draw_grid(self):
-        painter = QPainter(self.qimage)
-        pen_color = QColor(0, 255, 0)
-        painter.setPen(pen_color)
-
-        height, width = self.image.shape
-        for x in range(0, width, self.grid_size):
-            painter.drawLine(x, 0, x, height)
-        for y in range(0, height, self.grid_size):
-            painter.drawLine(0, y, width, y)
-
-        pixmap = QPixmap.fromImage(self.qimage)
-        self.image_label.setPixmap(pixmap)
-
-    def get_pixel_position(self, event):
-        if self.image is not None:
-            x = event.position().x()
-            y = event.position().y()
-
-            grid_x = int(x // self.grid_size)
-            grid_y = int(y // self.grid_size)
+        self.viewer.set_grid(self.grid_size)
+        self.viewer.set_image(self.image)
 
+    def get_pixel_position(self, x, y):
+        if self.region_index is not None:
+            # El clic se ajusta a la esquina de su celda de la rejilla
             self.selected_pixel = (
-                grid_x * self.grid_size, grid_y * self.grid_size)
-
-            height, width = self.image.shape
-            if 0 <= self.selected_pixel[1] < height and 0 <= self.selected_pixel[0] < width:
-                pixel_value = self.image[self.selected_pixel[1],
-                                         self.selected_pixel[0]]
-                self.info_label.setText(f'Seleccionaste el píxel en coordenadas {
-                                        self.selected_pixel} con valor {pixel_value}')
-                self.find_connected_regions()
-            else:
-                self.info_label.setText(f'Píxel fuera de los límites: {
-                                        self.selected_pixel}')
+                x // self.grid_size * self.grid_size, y // self.grid_size * self.grid_size)
+            pixel_value = self.image[self.selected_pixel[1], self.selected_pixel[0]]
+            self.info_label.setText(
+                f'Seleccionaste el píxel en coordenadas {self.selected_pixel} '
+                f'con valor {pixel_value}')
+            self.find_connected_regions()
 
     def find_connected_regions(self):
         if self.selected_pixel is not None:
-            self.connected_image = np.zeros_like(self.image)
-            connectivity = 8
-
-            _, self.connected_image, _, _ = cv2.floodFill(self.image.copy(
-            ), None, self.selected_pixel, 255, loDiff=10, upDiff=10, flags=connectivity)
+            self.selected_label = self.region_index.etiqueta(*self.selected_pixel)
+            stats = self.region_index.estadisticas(self.selected_label)
+            self.info_label.setText(
+                f'{self.info_label.text()}\nRegión {self.selected_label}: área {stats["area"]} px, '
+                f'caja ({stats["x"]}, {stats["y"]}, {stats["ancho"]}x{stats["alto"]}), '
+                f'centroide ({stats["cx"]:.1f}, {stats["cy"]:.1f}), media {stats["media"]:.1f}')
 
-            height, width = self.connected_image.shape
-            bytes_per_line = width
-            qimage_result = QImage(self.connected_image.data, width,
-                                   height, bytes_per_line, QImage.Format.Format_Grayscale8)
-
-            pixmap = QPixmap.fromImage(qimage_result)
-            self.image_label.setPixmap(pixmap)
+            # Solo cambia la capa de resaltado, y solo se repinta su caja
+            caja, dentro = self.region_index.recorte(self.selected_label)
+            self.viewer.set_highlight(caja, dentro)
 
             self.download_button.setEnabled(True)
 
+    def show_latency(self, ms):
+        self.statusBar().showMessage(f'Clic a pantalla: {ms:.1f} ms')
+
     def download_image(self):
-        if self.connected_image is not None:
+        if self.selected_label is not None:
             file_dialog = QFileDialog()
             save_path, _ = file_dialog.getSaveFileName(
                 self, 'Guardar Imagen', '', 'Imagenes (*.png *.jpg *.bmp)')
             if save_path:
-                cv2.imwrite(save_path, self.connected_image)
+                # La imagen con la región pintada solo se arma al guardarla
+                cv2.imwrite(save_path, self.region_index.resaltar(self.image, self.selected_label))
                 self.info_label.setText(f'Imagen guardada en {save_path}')
 
+    def export_regions(self):
+        if self.region_index is not None:
+            file_dialog = QFileDialog()
+            save_path, _ = file_dialog.getSaveFileName(
+                self, 'Exportar Regiones', '', 'CSV (*.csv);;NumPy (*.npy)')
+            if save_path:
+                self.region_index.exportar(save_path)
+                self.info_label.setText(
+                    f'{len(self.region_index)} regiones exportadas a {save_path}')
+
+
+    def closeEvent(self, event):
+        self.index_job.cerrar()
+        super().closeEvent(event)
+
+
+def main():
+    app = QApplication(sys.argv)
+    window = ImageGrid()
+    window.show()
+    sys.exit(app.exec())
+
 
-app = QApplication(sys.argv)
-window = ImageGrid()
-window.show()
-sys.exit(app.exec())
+if __name__ == "__main__":
+    main()
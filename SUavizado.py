@@ -1,13 +1,15 @@
 import sys
 import cv2
-import numpy as np
 import matplotlib.pyplot as plt
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QVBoxLayout, QPushButton, QComboBox, QWidget, QFileDialog
+    QApplication, QMainWindow, QVBoxLayout, QPushButton, QComboBox, QWidget, QFileDialog, QMessageBox
 )
 from PyQt6.QtCore import Qt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
+from interfaz.recalculo import RecalculoDiferido
+from procesamiento.filtros import bordes_sobel, suavizado
+
 
 class ImageApp(QMainWindow):
     def __init__(self):
@@ -24,6 +26,10 @@ class ImageApp(QMainWindow):
         self.canvas = FigureCanvas(plt.Figure())
         self.layout.addWidget(self.canvas)
         self.ax1, self.ax2, self.ax3 = self.canvas.figure.subplots(1, 3)
+        # Los filtros corren en segundo plano; solo se dibuja el último resultado
+        self.filter_job = RecalculoDiferido(self.compute_filters, parent=self)
+        self.filter_job.resultado.connect(self.show_filters)
+        self.filter_job.error.connect(self.show_error)
         self.suavizado_dropdown = QComboBox(self)
         self.suavizado_dropdown.addItems([str(i) for i in range(1, 10)])
         self.suavizado_dropdown.currentIndexChanged.connect(self.update_image)
@@ -46,21 +52,31 @@ class ImageApp(QMainWindow):
     def update_image(self):
         if self.image is not None:
             suavizado_valor = int(self.suavizado_dropdown.currentText())
-            suavizado = np.ones((3, 3), np.float32) / suavizado_valor
-            self.image_suavizada = cv2.filter2D(self.image, -1, suavizado)
-            bordes_sobel = np.array(
-                [[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]], np.float32)
-            self.image_bordes = cv2.filter2D(self.image, -1, bordes_sobel)
-            self.ax1.clear()
-            self.ax2.clear()
-            self.ax3.clear()
-            self.ax1.imshow(self.image, cmap='gray')
-            self.ax1.set_title("Original")
-            self.ax2.imshow(self.image_suavizada, cmap='gray')
-            self.ax2.set_title("Suavizada")
-            self.ax3.imshow(self.image_bordes, cmap='gray')
-            self.ax3.set_title("Bordes")
-            self.canvas.draw()
+            self.filter_job.solicitar(self.image, suavizado_valor)
+
+    # Corre en el hilo de recalculo
+    def compute_filters(self, image, suavizado_valor):
+        return suavizado(image, suavizado_valor), bordes_sobel(image)
+
+    def show_filters(self, resultados):
+        self.image_suavizada, self.image_bordes = resultados
+        self.ax1.clear()
+        self.ax2.clear()
+        self.ax3.clear()
+        self.ax1.imshow(self.image, cmap='gray')
+        self.ax1.set_title("Original")
+        self.ax2.imshow(self.image_suavizada, cmap='gray')
+        self.ax2.set_title("Suavizada")
+        self.ax3.imshow(self.image_bordes, cmap='gray')
+        self.ax3.set_title("Bordes")
+        self.canvas.draw()
+
+    def show_error(self, error):
+        QMessageBox.warning(self, "Error", f"No se pudo procesar la imagen: {error}")
+
+    def closeEvent(self, event):
+        self.filter_job.cerrar()
+        super().closeEvent(event)
 
     def save_image(self):
         if self.image_suavizada is not None:
@@ -72,7 +88,12 @@ class ImageApp(QMainWindow):
                 cv2.imwrite(save_path, self.image_suavizada)
 
 
-app = QApplication(sys.argv)
-window = ImageApp()
-window.show()
-sys.exit(app.exec())
+def main():
+    app = QApplication(sys.argv)
+    window = ImageApp()
+    window.show()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Tiempo de carga en frío (decodificar) y en caliente (memmap) con AlmacenPixeles.
+
+Uso: python benchmarks/bench_almacen.py [megapixeles]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento.almacen import AlmacenPixeles  # noqa: E402
+from procesamiento.fuentes import FuenteSintetica  # noqa: E402
+
+
+def medir(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, (time.perf_counter() - inicio) * 1000
+
+
+def main():
+    mpx = float(sys.argv[1]) if len(sys.argv) > 1 else 24
+    ancho = int((mpx * 1e6 * 1.5) ** 0.5)
+    alto = int(ancho / 1.5)
+    imagen = FuenteSintetica(ancho, alto).read()[1]
+    with tempfile.TemporaryDirectory() as carpeta:
+        almacen = AlmacenPixeles(os.path.join(carpeta, 'cache'))
+        for extension in ('.jpg', '.png'):
+            ruta = os.path.join(carpeta, 'fuente' + extension)
+            cv2.imwrite(ruta, imagen)
+            _, t_imread = medir(lambda: cv2.imread(ruta))
+            _, t_frio = medir(lambda: almacen.imread(ruta))
+            caliente, t_caliente = medir(lambda: almacen.imread(ruta))
+            # Tocar todos los píxeles para incluir la lectura real del memmap
+            _, t_total = medir(lambda: int(np.asarray(caliente).sum(dtype=np.uint64)))
+            print(f'{extension} {ancho}x{alto}: cv2.imread {t_imread:7.1f} ms, '
+                  f'frío {t_frio:7.1f} ms, caliente {t_caliente:5.2f} ms '
+                  f'(+{t_total:6.1f} ms al recorrer los píxeles)')
+
+
+if __name__ == '__main__':
+    main()
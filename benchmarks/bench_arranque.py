@@ -0,0 +1,42 @@
+"""Mide el tiempo de arranque de un proceso nuevo al importar cada parte.
+
+Uso: python benchmarks/bench_arranque.py [repeticiones]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+CASOS = {
+    'interprete vacio': 'pass',
+    'import procesamiento': 'import procesamiento',
+    'procesamiento.filtros': 'import procesamiento.filtros',
+    'procesamiento.rostros + cascada': (
+        'from procesamiento.rostros import load_cascade; load_cascade()'),
+    'PyQt6 + matplotlib + cascada (antes)': (
+        'import cv2, PyQt6.QtWidgets, matplotlib.pyplot; '
+        'cv2.CascadeClassifier(cv2.data.haarcascades + '
+        '"haarcascade_frontalface_default.xml")'),
+}
+
+
+def medir(codigo, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ, check=True)
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos) * 1000
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for nombre, codigo in CASOS.items():
+        print(f'{nombre:>38}: {medir(codigo, repeticiones):7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
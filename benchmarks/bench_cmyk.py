@@ -0,0 +1,57 @@
+"""Mide la conversión BGR <-> CMYK y la compara con colormath.
+
+Uso: python benchmarks/bench_cmyk.py [megapixeles]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from colormath.color_objects import sRGBColor, CMYKColor
+from colormath.color_conversions import convert_color
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento.color import TOLERANCIA, bgr_to_cmyk, cmyk_to_bgr, convert_tiled  # noqa: E402
+
+
+def colormath_cmyk(img):
+    h, w, _ = img.shape
+    out = np.zeros((h, w, 4), dtype=np.uint8)
+    for i in range(h):
+        for j in range(w):
+            b, g, r = img[i, j] / 255.0
+            cmyk = convert_color(sRGBColor(r, g, b), CMYKColor)
+            out[i, j] = [int(v * 255) for v in cmyk.get_value_tuple()]
+    return out
+
+
+def main():
+    mpx = float(sys.argv[1]) if len(sys.argv) > 1 else 12
+    lado = int((mpx * 1e6) ** 0.5)
+    rng = np.random.default_rng(0)
+    img = rng.integers(0, 256, (lado, lado, 3), dtype=np.uint8)
+
+    muestra = img[:64, :64]
+    inicio = time.perf_counter()
+    referencia = colormath_cmyk(muestra)
+    por_pixel = (time.perf_counter() - inicio) / muestra[:, :, 0].size
+    diferencia = np.abs(bgr_to_cmyk(muestra).astype(int) - referencia).max()
+    print(f'diferencia maxima vs colormath: {diferencia} (tolerancia {TOLERANCIA})')
+    print(f'colormath estimado: {lado * lado * por_pixel:.1f} s para {mpx:g} MP')
+
+    cmyk = np.empty((lado, lado, 4), dtype=np.uint8)
+    print(f'bgr_to_cmyk en memoria: {convert_tiled(bgr_to_cmyk, img, cmyk):.1f} MP/s')
+    bgr = np.empty_like(img)
+    print(f'cmyk_to_bgr en memoria: {convert_tiled(cmyk_to_bgr, cmyk, bgr):.1f} MP/s')
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        src = np.memmap(os.path.join(carpeta, 'src.raw'), np.uint8, 'w+', shape=img.shape)
+        src[:] = img
+        dst = np.memmap(os.path.join(carpeta, 'dst.raw'), np.uint8, 'w+', shape=cmyk.shape)
+        print(f'bgr_to_cmyk con memmap: {convert_tiled(bgr_to_cmyk, src, dst):.1f} MP/s')
+        del src, dst
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Promedio de caja k x k: cv2.filter2D contra las rutas rápidas de convolucion.filtrar.
+
+También mide un promedio por imagen integral (cv2.integral y cuatro
+esquinas) y un kernel Gaussiano separable del mismo tamaño.
+
+Uso: python benchmarks/bench_convolucion.py [megapixeles]
+"""
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento.convolucion import filtrar  # noqa: E402
+from procesamiento.fuentes import FuenteSintetica  # noqa: E402
+
+TAMANOS = [3, 5, 9, 15, 25, 41, 61, 81, 101]
+
+
+def medir(funcion, repeticiones=3):
+    funcion()
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return resultado, (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def promedio_integral(image, k):
+    radio = k // 2
+    alto, ancho = image.shape[:2]
+    extendida = cv2.copyMakeBorder(image, radio, radio, radio, radio, cv2.BORDER_REFLECT_101)
+    integral = cv2.integral(extendida, sdepth=cv2.CV_64F)
+    suma = (integral[k:k + alto, k:k + ancho] - integral[:alto, k:k + ancho]
+            - integral[k:k + alto, :ancho] + integral[:alto, :ancho])
+    return np.clip(np.rint(suma / (k * k)), 0, 255).astype(np.uint8)
+
+
+def main():
+    mpx = float(sys.argv[1]) if len(sys.argv) > 1 else 2
+    ancho = int((mpx * 1e6 * 1.5) ** 0.5)
+    alto = int(ancho / 1.5)
+    imagen = FuenteSintetica(ancho, alto).read()[1]
+    print(f'{ancho}x{alto}, tiempos en ms (diferencia máxima con filter2D)')
+    print(f'{"k":>4} {"filter2D":>9} {"caja":>12} {"integral":>12} '
+          f'{"gauss 2D":>9} {"gauss sep":>12}')
+    for k in TAMANOS:
+        caja = np.ones((k, k), np.float32) / (k * k)
+        referencia, t_2d = medir(lambda: cv2.filter2D(imagen, -1, caja))
+        rapido, t_rapido = medir(lambda: filtrar(imagen, caja))
+        integral, t_integral = medir(lambda: promedio_integral(imagen, k))
+        g = cv2.getGaussianKernel(k, 0)
+        gauss = g @ g.T
+        ref_gauss, t_gauss_2d = medir(lambda: cv2.filter2D(imagen, -1, gauss))
+        sep, t_sep = medir(lambda: filtrar(imagen, gauss))
+
+        def diferencia(a, b):
+            return np.abs(a.astype(np.int16) - b).max()
+
+        print(f'{k:>4} {t_2d:9.1f} {t_rapido:8.1f} ({diferencia(referencia, rapido)}) '
+              f'{t_integral:8.1f} ({diferencia(referencia, integral)}) '
+              f'{t_gauss_2d:9.1f} {t_sep:8.1f} ({diferencia(ref_gauss, sep)})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Costo de mostrar un arreglo en Qt por megapíxel: conversión anterior vs array_to_qimage.
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_display.py [repeticiones]
+"""
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtWidgets import QApplication
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from interfaz.imagenes import array_to_qimage  # noqa: E402
+
+
+def anterior(img):
+    # Como fFiltros.mostrar_imagen: cvtColor a RGB y ancho calculado a mano
+    imagen_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    h, w, ch = imagen_rgb.shape
+    q_image = QImage(imagen_rgb.data, w, h, ch * w, QImage.Format.Format_RGB888)
+    return QPixmap.fromImage(q_image)
+
+
+def nuevo(img):
+    return QPixmap.fromImage(array_to_qimage(img))
+
+
+def medir(funcion, img, repeticiones):
+    funcion(img)
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion(img)
+    return (time.perf_counter() - inicio) / repeticiones * 1000
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    # QPixmap necesita que la aplicación siga viva
+    app = QApplication([])  # noqa: F841
+    rng = np.random.default_rng(0)
+    for ancho, alto in [(640, 480), (1920, 1080), (3840, 2160), (6000, 4000)]:
+        img = rng.integers(0, 256, (alto, ancho, 3), dtype=np.uint8)
+        mpx = ancho * alto / 1e6
+        t_anterior = medir(anterior, img, repeticiones)
+        t_nuevo = medir(nuevo, img, repeticiones)
+        t_qimage = medir(array_to_qimage, img, repeticiones)
+        print(f'{ancho}x{alto}: anterior {t_anterior / mpx:6.2f} ms/MP, '
+              f'nuevo {t_nuevo / mpx:6.2f} ms/MP, '
+              f'solo QImage {t_qimage * 1000:6.1f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""FPS de la corrección de distorsión: cv2.undistort por cuadro vs mapas en caché.
+
+Uso: python benchmarks/bench_distorsion.py [cuadros]
+"""
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento.distorsion import DIST_COEFFS, CacheCorreccion, camera_matrix  # noqa: E402
+from procesamiento.fuentes import FuenteSintetica  # noqa: E402
+
+
+def cuadros_de_prueba(cantidad, ancho, alto):
+    fuente = FuenteSintetica(ancho, alto, cantidad)
+    return [fuente.read()[1] for _ in range(cantidad)]
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    for ancho, alto in [(640, 480), (1920, 1080)]:
+        cuadros = cuadros_de_prueba(cantidad, ancho, alto)
+
+        inicio = time.perf_counter()
+        for cuadro in cuadros:
+            # Como Distorcion.py: matriz y coeficientes en cada llamada
+            anterior = cv2.undistort(cuadro, camera_matrix(ancho, alto), DIST_COEFFS)
+        fps_anterior = cantidad / (time.perf_counter() - inicio)
+
+        cache = CacheCorreccion()
+        salida = np.empty_like(cuadros[0])
+        inicio = time.perf_counter()
+        for cuadro in cuadros:
+            cache.undistort(cuadro, dst=salida)
+        fps_nuevo = cantidad / (time.perf_counter() - inicio)
+
+        assert np.array_equal(anterior, salida)
+        print(f'{ancho}x{alto}: cv2.undistort {fps_anterior:7.1f} FPS, '
+              f'remap en caché {fps_nuevo:7.1f} FPS ({fps_nuevo / fps_anterior:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""Filtro Gaussiano espacial contra FFT para varios sigma, y la elección automática.
+
+Uso: python benchmarks/bench_frecuencia.py [megapixeles]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento import frecuencia  # noqa: E402
+from procesamiento.fuentes import FuenteSintetica  # noqa: E402
+
+
+def medir(funcion, repeticiones=2):
+    funcion()
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return resultado, (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def main():
+    mpx = float(sys.argv[1]) if len(sys.argv) > 1 else 2
+    ancho = int((mpx * 1e6 * 1.5) ** 0.5)
+    alto = int(ancho / 1.5)
+    imagen = FuenteSintetica(ancho, alto).read()[1]
+    print(f'{ancho}x{alto}')
+    print(f'{"sigma":>6} {"ksize":>6} {"espacial":>10} {"fft":>10} {"auto":>9} {"dif. máx":>9}')
+    for sigma in (2, 4, 8, 12, 20, 40, 70, 100):
+        espacial, t_espacial = medir(
+            lambda: frecuencia.filtrar(imagen, 'bajas', sigma, metodo='espacial'))
+        fft, t_fft = medir(lambda: frecuencia.filtrar(imagen, 'bajas', sigma, metodo='fft'))
+        diferencia = np.abs(espacial.astype(np.int16) - fft).max()
+        ksize = frecuencia.ksize_gaussiano(sigma)
+        elegido = 'espacial' if ksize < frecuencia.KSIZE_FFT else 'fft'
+        print(f'{sigma:>6} {ksize:>6} {t_espacial:8.1f}ms {t_fft:8.1f}ms '
+              f'{elegido:>9} {diferencia:>9}')
+    for forma in ('ideal', 'butterworth'):
+        _, t = medir(lambda: frecuencia.filtrar(imagen, 'banda', 20, 60, forma=forma))
+        print(f'pasa banda {forma} sigma 20-60: {t:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
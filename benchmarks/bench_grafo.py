@@ -0,0 +1,53 @@
+"""Banco de filtros de filtros2.py: llamadas secuenciales contra el grafo compartido.
+
+Uso: python benchmarks/bench_grafo.py [megapixeles] [repeticiones]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento import filtros  # noqa: E402
+from procesamiento.fuentes import FuenteSintetica  # noqa: E402
+from procesamiento.grafo import banco_filtros2  # noqa: E402
+
+
+def secuencial(imagen):
+    return {
+        'pasa_altas': filtros.high_pass(imagen),
+        'pasa_bajas': filtros.low_pass(imagen),
+        'pasa_banda': filtros.band_pass(imagen),
+        'rechaza_banda': filtros.band_stop(imagen),
+    }
+
+
+def medir(funcion, imagen, repeticiones):
+    funcion(imagen)
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion(imagen)
+    return resultado, (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def main():
+    mpx = float(sys.argv[1]) if len(sys.argv) > 1 else 12
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    ancho = int((mpx * 1e6 * 1.5) ** 0.5)
+    alto = int(ancho / 1.5)
+    imagen = FuenteSintetica(ancho, alto).read()[1]
+    banco = banco_filtros2()
+
+    referencia, t_secuencial = medir(secuencial, imagen, repeticiones)
+    print(f'{ancho}x{alto}, {os.cpu_count()} núcleos')
+    print(f'{"secuencial":>18}: {t_secuencial:7.1f} ms')
+    for hilos in (1, 2, 4):
+        resultado, t = medir(lambda img: banco.ejecutar(img, hilos=hilos), imagen, repeticiones)
+        iguales = all(np.array_equal(resultado[n], referencia[n]) for n in referencia)
+        print(f'{f"grafo {hilos} hilos":>18}: {t:7.1f} ms  '
+              f'x{t_secuencial / t:4.2f}  {"idéntico" if iguales else "DIFERENTE"}')
+
+
+if __name__ == '__main__':
+    main()
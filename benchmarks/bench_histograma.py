@@ -0,0 +1,65 @@
+"""Histograma de transformaciones.py: matplotlib a PNG contra conteos y dibujo en memoria.
+
+También mide los conteos por canal de un lote de imágenes.
+
+Uso: python benchmarks/bench_histograma.py [megapixeles] [imagenes_lote]
+"""
+import io
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento.fuentes import FuenteSintetica  # noqa: E402
+from procesamiento.histograma import (  # noqa: E402
+    dibujar_histograma, histograma_grises, histogramas)
+
+
+def histograma_matplotlib(image):
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.figure import Figure
+
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    figure = Figure()
+    figure.add_subplot().hist(gray.ravel(), 256, range=(0, 256))
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format='png')
+    return cv2.imdecode(np.frombuffer(buffer.getvalue(), np.uint8), cv2.IMREAD_COLOR)
+
+
+def medir(funcion, repeticiones=3):
+    funcion()
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return resultado, (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def main():
+    mpx = float(sys.argv[1]) if len(sys.argv) > 1 else 4
+    lote = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    ancho = int((mpx * 1e6 * 1.5) ** 0.5)
+    alto = int(ancho / 1.5)
+    fuente = FuenteSintetica(ancho, alto)
+    imagen = fuente.read()[1]
+    print(f'{ancho}x{alto}')
+
+    _, t_mpl = medir(lambda: histograma_matplotlib(imagen))
+    conteos, t_conteos = medir(lambda: histograma_grises(imagen))
+    _, t_dibujo = medir(lambda: dibujar_histograma(conteos))
+    print(f'matplotlib + PNG: {t_mpl:8.1f} ms')
+    print(f'calcHist:         {t_conteos:8.1f} ms')
+    print(f'dibujo NumPy:     {t_dibujo:8.1f} ms')
+
+    imagenes = [fuente.read()[1] for _ in range(lote)]
+    resultado, t_lote = medir(lambda: histogramas(imagenes), repeticiones=1)
+    print(f'lote {resultado.shape}: {lote / t_lote * 1000:.1f} img/s '
+          f'({lote * mpx / t_lote * 1000:.0f} MP/s)')
+
+
+if __name__ == '__main__':
+    main()
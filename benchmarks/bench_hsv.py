@@ -0,0 +1,68 @@
+"""Compara el ajuste HSV con tablas contra el código anterior de HSV.py y proyectofinal.py.
+
+Uso: python benchmarks/bench_hsv.py [repeticiones]
+"""
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento.hsv import AjusteHSV  # noqa: E402
+
+
+def hsv_anterior(hsv_image, h, s, v):
+    modified_image = hsv_image.copy()
+    modified_image[:, :, 0] = np.clip(
+        modified_image[:, :, 0] + (h - modified_image[:, :, 0]), 0, 179)
+    modified_image[:, :, 1] = np.clip(
+        modified_image[:, :, 1] * (s / 255.0), 0, 255)
+    modified_image[:, :, 2] = np.clip(
+        modified_image[:, :, 2] * (v / 255.0), 0, 255)
+    return cv2.cvtColor(modified_image, cv2.COLOR_HSV2BGR)
+
+
+def tono_brillo_anterior(frame, hue_value, brightness_value):
+    hsv = cv2.cvtColor(frame, cv2.COLOR_RGB2HSV)
+    hue, sat, val = cv2.split(hsv)
+    hue[:] = hue_value
+    val = cv2.add(val, brightness_value)
+    modified_hsv = cv2.merge([hue, sat, val])
+    return cv2.cvtColor(modified_hsv, cv2.COLOR_HSV2RGB)
+
+
+def medir(funcion, repeticiones):
+    funcion()
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1000
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    rng = np.random.default_rng(0)
+    imagen = rng.integers(0, 256, (2160, 3840, 3), dtype=np.uint8)
+    hsv_image = cv2.cvtColor(imagen, cv2.COLOR_BGR2HSV)
+    ajuste = AjusteHSV()
+
+    for h, s, v in [(90, 128, 200), (0, 255, 255)]:
+        assert np.array_equal(hsv_anterior(hsv_image, h, s, v),
+                              ajuste.escalar(hsv_image, h, s, v))
+    for hue, brillo in [(90, 40), (10, -60)]:
+        assert np.array_equal(tono_brillo_anterior(imagen, hue, brillo),
+                              ajuste.tono_brillo(imagen, hue, brillo))
+    print('resultados idénticos al código anterior (4K)')
+
+    anterior = medir(lambda: hsv_anterior(hsv_image, 90, 128, 200), repeticiones)
+    nuevo = medir(lambda: ajuste.escalar(hsv_image, 90, 128, 200), repeticiones)
+    print(f'HSV.py:          {anterior:7.1f} ms -> {nuevo:7.1f} ms ({anterior / nuevo:.1f}x)')
+    anterior = medir(lambda: tono_brillo_anterior(imagen, 90, 40), repeticiones)
+    nuevo = medir(lambda: ajuste.tono_brillo(imagen, 90, 40), repeticiones)
+    print(f'proyectofinal.py: {anterior:7.1f} ms -> {nuevo:7.1f} ms ({anterior / nuevo:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
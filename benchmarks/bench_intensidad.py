@@ -0,0 +1,64 @@
+"""Transformaciones logarítmica y gamma: versión original por píxel contra tablas.
+
+Uso: python benchmarks/bench_intensidad.py [megapixeles]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento import intensidad  # noqa: E402
+from procesamiento.fuentes import FuenteSintetica  # noqa: E402
+
+
+def log_original(image):
+    img_float = np.float32(image) + 1
+    max_value = np.max(img_float)
+    c = 255 / np.log(1 + max_value)
+    log_image = c * (np.log(img_float + 1))
+    log_image[np.isnan(log_image)] = 0
+    log_image[np.isinf(log_image)] = 255
+    log_image = np.clip(log_image, 0, 255)
+    return np.array(log_image, dtype=np.uint8)
+
+
+def gamma_original(image, gamma=2.2):
+    return np.array(255 * (image / 255) ** gamma, dtype='uint8')
+
+
+def medir(funcion, repeticiones=3):
+    funcion()
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return resultado, (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def main():
+    mpx = float(sys.argv[1]) if len(sys.argv) > 1 else 12
+    ancho = int((mpx * 1e6 * 1.5) ** 0.5)
+    alto = int(ancho / 1.5)
+    imagen = FuenteSintetica(ancho, alto).read()[1]
+    imagen16 = imagen.astype(np.uint16) * 257
+    print(f'{ancho}x{alto}x3')
+
+    casos = [
+        ('log', lambda: log_original(imagen), lambda: intensidad.log_transform(imagen)),
+        ('gamma 2.2', lambda: gamma_original(imagen), lambda: intensidad.gamma_transform(imagen)),
+        ('gamma + log', lambda: log_original(gamma_original(imagen)),
+         lambda: intensidad.transformar(imagen, [('gamma', 2.2), ('log',)])),
+    ]
+    for nombre, original, tabla in casos:
+        esperado, t_original = medir(original)
+        resultado, t_tabla = medir(tabla)
+        print(f'{nombre:>12}: original {t_original:7.1f} ms, tabla {t_tabla:6.1f} ms '
+              f'(x{t_original / t_tabla:5.1f}), '
+              f'{"idéntico" if np.array_equal(esperado, resultado) else "DIFERENTE"}')
+    _, t16 = medir(lambda: intensidad.gamma_transform(imagen16))
+    print(f'{"gamma 16 bits":>12}: tabla {t16:6.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
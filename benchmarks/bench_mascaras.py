@@ -0,0 +1,84 @@
+"""Máscaras en uint8 contra ``MascaraBinaria`` empacada: operaciones, memoria y disco.
+
+Usa como máscaras los bordes Canny de la imagen, la mayor región de
+``IndiceRegiones`` y el rango de rojo de hsv.py.
+
+Uso: python benchmarks/bench_mascaras.py [imagen]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento import hsv  # noqa: E402
+from procesamiento.bordes import canny_automatico  # noqa: E402
+from procesamiento.mascaras import MascaraBinaria  # noqa: E402
+from procesamiento.regiones import IndiceRegiones  # noqa: E402
+
+RAIZ = os.path.join(os.path.dirname(__file__), '..')
+
+
+def medir(funcion, repeticiones=50):
+    funcion()
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return resultado, (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def main():
+    ruta = sys.argv[1] if len(sys.argv) > 1 else os.path.join(RAIZ, 'images', 'personas.jpg')
+    imagen = cv2.imread(ruta)
+    gray = cv2.cvtColor(imagen, cv2.COLOR_BGR2GRAY)
+    alto, ancho = gray.shape
+    indice = IndiceRegiones(gray)
+    mascaras = {
+        'canny': MascaraBinaria.desde_arreglo(canny_automatico(gray)),
+        'region': indice.mascara(int(np.argmax(indice.tabla['area']))),
+        'rojo': hsv.color_mask(cv2.cvtColor(imagen, cv2.COLOR_BGR2RGB)),
+    }
+    print(f'{ruta}: {ancho}x{alto}')
+
+    a, b = mascaras['canny'], mascaras['region']
+    a8, b8 = a.a_uint8(), b.a_uint8()
+    print(f'\n{"operación":<10} {"uint8 ms":>9} {"empacada ms":>12}')
+    casos = [
+        ('AND', lambda: cv2.bitwise_and(a8, b8), lambda: a & b),
+        ('OR', lambda: cv2.bitwise_or(a8, b8), lambda: a | b),
+        ('NOT', lambda: cv2.bitwise_not(a8), lambda: ~a),
+        ('área', lambda: cv2.countNonZero(a8), lambda: a.area()),
+    ]
+    for nombre, sin_empacar, empacada in casos:
+        esperado, t_uint8 = medir(sin_empacar)
+        resultado, t_empacada = medir(empacada)
+        if isinstance(resultado, MascaraBinaria):
+            assert np.array_equal(resultado.a_uint8(), esperado)
+        else:
+            assert resultado == esperado
+        print(f'{nombre:<10} {t_uint8:9.3f} {t_empacada:12.3f}')
+    _, t_desempacar = medir(a.a_uint8)
+    print(f'{"a_uint8":<10} {"":>9} {t_desempacar:12.3f}')
+
+    print(f'\n{"máscara":<8} {"área":>8} {"uint8 KB":>9} {"bits KB":>8} '
+          f'{".npz KB":>8} {"RLE KB":>7} {".pbm KB":>8}')
+    with tempfile.TemporaryDirectory() as directorio:
+        for nombre, mascara in mascaras.items():
+            tamanos = []
+            for archivo, guardar in (('m.npz', lambda r: mascara.guardar(r)),
+                                     ('rle.npz', lambda r: mascara.guardar(r, rle=True)),
+                                     ('m.pbm', mascara.guardar_pbm)):
+                destino = os.path.join(directorio, f'{nombre}_{archivo}')
+                guardar(destino)
+                tamanos.append(os.path.getsize(destino) / 1024)
+            assert MascaraBinaria.cargar(os.path.join(directorio, f'{nombre}_rle.npz')) == mascara
+            print(f'{nombre:<8} {mascara.area():8d} {alto * ancho / 1024:9.1f} '
+                  f'{mascara.nbytes / 1024:8.1f} {tamanos[0]:8.1f} {tamanos[1]:7.1f} '
+                  f'{tamanos[2]:8.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Apertura morfológica por tamaño de elemento: rectángulo, elipse y octágono descompuesto.
+
+Compara la versión original (kernel nuevo, erode y dilate por separado)
+con la cadena compilada, y el octágono con un solo kernel contra su
+descomposición en pasadas 3x3.
+
+Uso: python benchmarks/bench_morfologia.py [imagen]
+"""
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento import morfologia  # noqa: E402
+
+RAIZ = os.path.join(os.path.dirname(__file__), '..')
+TAMANOS = [3, 5, 11, 21, 31, 41, 51]
+
+
+def medir(funcion, repeticiones=3):
+    funcion()
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return resultado, (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def apertura_original(image, k):
+    kernel = np.ones((k, k), np.uint8)
+    return cv2.dilate(cv2.erode(image, kernel), kernel)
+
+
+def main():
+    ruta = sys.argv[1] if len(sys.argv) > 1 else os.path.join(RAIZ, 'images', 'imagenAnime.jpg')
+    imagen = cv2.imread(ruta, cv2.IMREAD_GRAYSCALE)
+    print(f'{ruta}: {imagen.shape[1]}x{imagen.shape[0]}, apertura, ms')
+    print(f'{"k":>3} {"original":>9} {"cadena":>9} {"elipse":>9} '
+          f'{"octágono":>9} {"oct. 3x3":>9}')
+    for k in TAMANOS:
+        cadena = morfologia.compilar(f'erosion:{k},dilatacion:{k}')
+        esperado, t_original = medir(lambda: apertura_original(imagen, k))
+        resultado, t_cadena = medir(lambda: cadena(imagen))
+        assert np.array_equal(esperado, resultado)
+        _, t_elipse = medir(lambda: morfologia.aplicar(imagen, 'apertura', k, 'elipse'))
+        octagono = morfologia.elemento(k, 'octagono')
+        completo, t_octagono = medir(
+            lambda: cv2.morphologyEx(imagen, cv2.MORPH_OPEN, octagono))
+        descompuesto, t_descompuesto = medir(
+            lambda: morfologia.aplicar(imagen, 'apertura', k, 'octagono'))
+        assert np.array_equal(completo, descompuesto)
+        print(f'{k:>3} {t_original:9.1f} {t_cadena:9.1f} {t_elipse:9.1f} '
+              f'{t_octagono:9.1f} {t_descompuesto:9.1f}')
+
+
+if __name__ == '__main__':
+    main()
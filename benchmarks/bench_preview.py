@@ -0,0 +1,58 @@
+"""Mide la latencia slider -> píxeles de HSV.py con una imagen de 24 MP.
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_preview.py [repeticiones]
+"""
+import os
+import statistics
+import sys
+import time
+
+import cv2
+import numpy as np
+from PyQt6.QtCore import QEventLoop
+from PyQt6.QtWidgets import QApplication
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from HSV import HSVAdjuster  # noqa: E402
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    app = QApplication([])
+    window = HSVAdjuster()
+    window.resize(1280, 960)
+    window.show()
+    app.processEvents()
+
+    rng = np.random.default_rng(0)
+    window.image = rng.integers(0, 256, (4000, 6000, 3), dtype=np.uint8)
+    window.hsv_image = cv2.cvtColor(window.image, cv2.COLOR_BGR2HSV)
+    window.update_image()
+    window.full_res_job.cancelar()
+
+    # Espera dentro del ciclo de eventos hasta que llega la vista previa
+    espera = QEventLoop()
+    window.preview_job.resultado.connect(espera.quit)
+
+    def esperar_vista_previa():
+        espera.exec()
+
+    esperar_vista_previa()
+    latencias = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        window.hue_slider.setValue((window.hue_slider.value() + 1) % 180)
+        esperar_vista_previa()
+        latencias.append((time.perf_counter() - inicio) * 1000)
+    print(f'vista previa {window.preview_hsv.shape[1]}x{window.preview_hsv.shape[0]}: '
+          f'mediana {statistics.median(latencias):.1f} ms, máximo {max(latencias):.1f} ms')
+
+    window.full_res_job.cancelar()
+    inicio = time.perf_counter()
+    window.render_full_resolution()
+    print(f'resolución completa (solo al soltar o guardar): '
+          f'{(time.perf_counter() - inicio) * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Región de un clic: floodFill por clic contra consulta en ``IndiceRegiones``.
+
+Mide lo que cuesta construir el índice y cuántos clics hacen falta para
+amortizarlo frente a inundar la imagen en cada clic.
+
+Uso: python benchmarks/bench_regiones.py [imagen] [clics]
+"""
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento.fuentes import FuenteSintetica  # noqa: E402
+from procesamiento.regiones import IndiceRegiones, connected_region  # noqa: E402
+
+RAIZ = os.path.join(os.path.dirname(__file__), '..')
+
+
+def medir(funcion, repeticiones=1):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return resultado, (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def comparar(nombre, imagen, clics):
+    alto, ancho = imagen.shape
+    rng = np.random.default_rng(0)
+    semillas = list(zip(rng.integers(0, ancho, clics).tolist(),
+                        rng.integers(0, alto, clics).tolist()))
+    _, t_flood = medir(lambda: [connected_region(imagen, s) for s in semillas])
+    indice, t_indice = medir(lambda: IndiceRegiones(imagen))
+    _, t_consulta = medir(lambda: [indice.estadisticas(indice.etiqueta(*s)) for s in semillas])
+    _, t_resaltar = medir(
+        lambda: [indice.resaltar(imagen, indice.etiqueta(*s)) for s in semillas])
+    por_clic = t_flood / clics
+    print(f'{nombre:<22} {len(indice):>8} {t_indice:>9.1f} {por_clic:>10.2f} '
+          f'{t_consulta / clics * 1000:>11.1f} {t_resaltar / clics:>11.2f} '
+          f'{t_indice / max(por_clic - t_consulta / clics, 1e-9):>9.0f}')
+
+
+def main():
+    ruta = sys.argv[1] if len(sys.argv) > 1 else os.path.join(RAIZ, 'images', 'personas.jpg')
+    clics = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    print(f'{clics} clics por imagen')
+    print(f'{"imagen":<22} {"regiones":>8} {"índice ms":>9} {"flood ms":>10} '
+          f'{"consulta µs":>11} {"resaltar ms":>11} {"amortiza":>9}')
+    comparar(os.path.basename(ruta), cv2.imread(ruta, cv2.IMREAD_GRAYSCALE), clics)
+    for ancho, alto in [(1920, 1080), (4000, 3000)]:
+        imagen = cv2.cvtColor(FuenteSintetica(ancho, alto).read()[1], cv2.COLOR_BGR2GRAY)
+        comparar(f'sintética {ancho}x{alto}', imagen, clics)
+
+
+if __name__ == '__main__':
+    main()
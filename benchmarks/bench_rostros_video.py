@@ -0,0 +1,84 @@
+"""FPS de detección de rostros por perfil de SeguidorRostros sobre un video grabado.
+
+Sin video se genera un clip de 1280x720 que desplaza y acerca
+images/personas.jpg. La coincidencia es la fracción de rostros del
+perfil 'preciso' que cada perfil encuentra (IoU >= 0.5).
+
+Uso: python benchmarks/bench_rostros_video.py [video] [cuadros]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento.fuentes import FuenteArchivo  # noqa: E402
+from procesamiento.seguimiento import PERFILES, SeguidorRostros  # noqa: E402
+
+RAIZ = os.path.join(os.path.dirname(__file__), '..')
+
+
+def crear_clip(ruta, cuadros, ancho=1280, alto=720):
+    foto = cv2.imread(os.path.join(RAIZ, 'images', 'personas.jpg'))
+    escritor = cv2.VideoWriter(ruta, cv2.VideoWriter_fourcc(*'MJPG'), 30, (ancho, alto))
+    for i in range(cuadros):
+        fase = 2 * np.pi * i / cuadros
+        zoom = 1.9 + 0.3 * np.sin(fase)
+        matriz = np.float32([[zoom, 0, 60 + 80 * np.sin(fase)],
+                             [0, zoom, 20 + 30 * np.cos(fase)]])
+        escritor.write(cv2.warpAffine(foto, matriz, (ancho, alto),
+                                      borderMode=cv2.BORDER_REFLECT))
+    escritor.release()
+
+
+def iou(a, b):
+    x0, y0 = max(a[0], b[0]), max(a[1], b[1])
+    x1 = min(a[0] + a[2], b[0] + b[2])
+    y1 = min(a[1] + a[3], b[1] + b[3])
+    interseccion = max(0, x1 - x0) * max(0, y1 - y0)
+    return interseccion / (a[2] * a[3] + b[2] * b[3] - interseccion)
+
+
+def leer_grises(ruta):
+    fuente = FuenteArchivo(ruta, tiempo_real=False)
+    cuadros = []
+    while True:
+        ok, frame = fuente.read()
+        if not ok:
+            break
+        cuadros.append(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+    fuente.release()
+    return cuadros
+
+
+def main():
+    with tempfile.TemporaryDirectory() as carpeta:
+        if len(sys.argv) > 1:
+            ruta = sys.argv[1]
+        else:
+            ruta = os.path.join(carpeta, 'clip.avi')
+            crear_clip(ruta, int(sys.argv[2]) if len(sys.argv) > 2 else 60)
+        cuadros = leer_grises(ruta)
+
+    print(f'{len(cuadros)} cuadros de {cuadros[0].shape[1]}x{cuadros[0].shape[0]}')
+    referencia = None
+    for nombre in PERFILES:
+        seguidor = SeguidorRostros.perfil(nombre)
+        inicio = time.perf_counter()
+        resultados = [seguidor.procesar(gray) for gray in cuadros]
+        fps = len(cuadros) / (time.perf_counter() - inicio)
+        if referencia is None:
+            referencia = resultados
+        total = sum(len(r) for r in referencia)
+        encontrados = sum(
+            any(iou(a, b) >= 0.5 for b in propios)
+            for esperados, propios in zip(referencia, resultados) for a in esperados)
+        print(f'{nombre:>12}: {fps:7.1f} FPS, coincidencia {encontrados / max(total, 1):6.1%}, '
+              f'{seguidor.detecciones_completas} completas, {seguidor.busquedas} seguimientos')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Procesa una imagen .npy grande por teselas y reporta MP/s y memoria máxima.
+
+La memoria se mide con tracemalloc, que registra los arreglos de NumPy y
+los resultados de OpenCV; las páginas del memmap no cuentan porque el
+sistema las puede liberar.
+
+Uso: python benchmarks/bench_teselas.py [lado] [memoria_mb]
+"""
+import os
+import sys
+import tempfile
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento.teselas import aplicar_operacion  # noqa: E402
+
+
+def crear_entrada(ruta, lado):
+    imagen = np.lib.format.open_memmap(ruta, 'w+', np.uint8, (lado, lado, 3))
+    rng = np.random.default_rng(0)
+    for y in range(0, lado, 1024):
+        imagen[y:y + 1024] = rng.integers(0, 256, imagen[y:y + 1024].shape, dtype=np.uint8)
+    imagen.flush()
+    del imagen
+
+
+def main():
+    lado = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    memoria = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, 'entrada.npy')
+        crear_entrada(ruta, lado)
+        print(f'entrada {lado}x{lado}x3: {lado * lado * 3 / 2**20:.0f} MB, '
+              f'presupuesto {memoria} MB')
+        for operacion in ['promedio', 'gradiente', 'pasa_banda']:
+            entrada = np.load(ruta, mmap_mode='r')
+            tracemalloc.start()
+            salida, mpx = aplicar_operacion(
+                operacion, entrada, os.path.join(carpeta, f'{operacion}.npy'), memoria * 2**20)
+            _, pico = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f'{operacion:>12}: {mpx:6.1f} MP/s, memoria máxima {pico / 2**20:6.1f} MB')
+            del salida, entrada
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""Mide el pipeline de proyectofinal.py sin cámara ni ventana.
+
+El modo rapido lee la fuente sin pausas y reporta FPS sostenidos; el modo
+tiempo_real entrega los cuadros al ritmo de la fuente y reporta latencia.
+
+Uso: python benchmarks/bench_video.py [--fuente F] [--modo rapido|tiempo_real]
+"""
+import argparse
+import os
+import sys
+import time
+
+import cv2
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from procesamiento import hsv  # noqa: E402
+from procesamiento.filtros import apply_video_filter  # noqa: E402
+from procesamiento.fuentes import FuenteSintetica, abrir_fuente  # noqa: E402
+from procesamiento.rostros import detect_faces, draw_faces  # noqa: E402
+from procesamiento.video import PipelineVideo  # noqa: E402
+
+
+def rostros(frame):
+    gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+    return draw_faces(frame, detect_faces(gray))
+
+
+ETAPAS = [
+    ('color', lambda f: cv2.cvtColor(f, cv2.COLOR_BGR2RGB)),
+    ('rostros', rostros),
+    ('segmentacion', lambda f: cv2.bitwise_and(f, f, mask=hsv.color_mask(f).a_uint8())),
+    ('hsv', lambda f: hsv.set_hue_brightness(f, 90, 0)),
+    ('filtro', lambda f: apply_video_filter(f, 'gaussian_blur')),
+    ('redimension', lambda f: cv2.resize(f, (640, 480), interpolation=cv2.INTER_AREA)),
+]
+
+
+def secuencial(fuente):
+    cuadros = 0
+    inicio = time.perf_counter()
+    while True:
+        ok, frame = fuente.read()
+        if not ok:
+            break
+        for _, funcion in ETAPAS:
+            frame = funcion(frame)
+        cuadros += 1
+    return cuadros / (time.perf_counter() - inicio)
+
+
+def rendimiento(fuente, trabajadores, cuadros):
+    # capacidad alta para no descartar y medir el rendimiento sostenido
+    video = PipelineVideo(fuente, ETAPAS, trabajadores=trabajadores, capacidad=cuadros)
+    inicio = time.perf_counter()
+    video.iniciar()
+    video.esperar()
+    transcurrido = time.perf_counter() - inicio
+    video.resultado()
+    return video.estadisticas.cuadros['procesado'] / transcurrido, video.estadisticas
+
+
+def latencia(fuente, trabajadores):
+    # colas cortas y consumo continuo, como en la interfaz
+    video = PipelineVideo(fuente, ETAPAS, trabajadores=trabajadores)
+    video.iniciar()
+    while video.activo:
+        video.resultado()
+        time.sleep(0.005)
+    video.resultado()
+    return video.estadisticas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--fuente', default=None,
+                        help='Especificación de abrir_fuente (por defecto, sintética 720p)')
+    parser.add_argument('--cuadros', type=int, default=200)
+    parser.add_argument('--trabajadores', type=int, default=os.cpu_count())
+    parser.add_argument('--modo', choices=['rapido', 'tiempo_real'], default='rapido')
+    args = parser.parse_args()
+    tiempo_real = args.modo == 'tiempo_real'
+
+    def crear_fuente():
+        if args.fuente is None:
+            return FuenteSintetica(1280, 720, args.cuadros, tiempo_real=tiempo_real)
+        return abrir_fuente(args.fuente, tiempo_real=tiempo_real)
+
+    if tiempo_real:
+        estadisticas = latencia(crear_fuente(), args.trabajadores)
+        print(f'ritmo real con {args.trabajadores} hilos')
+    else:
+        print(f'secuencial (como update_frame): {secuencial(crear_fuente()):.1f} FPS')
+        fps, estadisticas = rendimiento(crear_fuente(), args.trabajadores, args.cuadros)
+        print(f'pipeline con {args.trabajadores} hilos: {fps:.1f} FPS')
+    print(estadisticas.texto())
+    print(f'descartados: {dict(estadisticas.descartados)}')
+
+
+if __name__ == '__main__':
+    main()
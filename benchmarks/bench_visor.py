@@ -0,0 +1,113 @@
+"""Latencia por clic en RegionsandPixelAnalizis: ventana anterior contra visor por capas.
+
+Anterior: rejilla pintada sobre la QImage a resolución completa al cargar
+y, en cada clic, floodFill y un QPixmap nuevo de la imagen entera.
+Visor: consulta en ``IndiceRegiones`` y repintado de la caja de la región.
+Se mide desde el clic hasta terminar de pintar el widget.
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_visor.py [clics]
+"""
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
+from PyQt6.QtWidgets import QApplication, QLabel
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from interfaz.visor import VisorCapas  # noqa: E402
+from procesamiento.fuentes import FuenteSintetica  # noqa: E402
+from procesamiento.regiones import IndiceRegiones, connected_region  # noqa: E402
+
+VISTA = (1280, 800)
+REJILLA = 10
+
+
+def medir(funcion):
+    inicio = time.perf_counter()
+    funcion()
+    return (time.perf_counter() - inicio) * 1000
+
+
+def anterior(imagen, semillas):
+    etiqueta = QLabel()
+    etiqueta.show()
+    QApplication.processEvents()
+
+    def cargar():
+        alto, ancho = imagen.shape
+        qimage = QImage(imagen.data, ancho, alto, ancho, QImage.Format.Format_Grayscale8)
+        painter = QPainter(qimage)
+        painter.setPen(QColor(0, 255, 0))
+        for x in range(0, ancho, REJILLA):
+            painter.drawLine(x, 0, x, alto)
+        for y in range(0, alto, REJILLA):
+            painter.drawLine(0, y, ancho, y)
+        painter.end()
+        etiqueta.setPixmap(QPixmap.fromImage(qimage))
+        etiqueta.repaint()
+
+    def clic(semilla):
+        resultado = connected_region(imagen, semilla)
+        alto, ancho = resultado.shape
+        qimage = QImage(resultado.data, ancho, alto, ancho, QImage.Format.Format_Grayscale8)
+        etiqueta.setPixmap(QPixmap.fromImage(qimage))
+        etiqueta.repaint()
+
+    # La ventana anterior pintaba la rejilla sobre la imagen: se trabaja sobre una copia
+    imagen = imagen.copy()
+    t_carga = medir(cargar)
+    tiempos = [medir(lambda: clic(semilla)) for semilla in semillas]
+    etiqueta.close()
+    return t_carga, tiempos
+
+
+def por_capas(imagen, semillas, app):
+    visor = VisorCapas()
+    visor.resize(*VISTA)
+    visor.show()
+    app.processEvents()
+
+    indices = []
+
+    def cargar():
+        indices.append(IndiceRegiones(imagen))
+        visor.set_image(imagen)
+        visor.repaint()
+
+    def clic(semilla):
+        indice = indices[0]
+        caja, dentro = indice.recorte(indice.etiqueta(*semilla))
+        visor.set_highlight(caja, dentro)
+        app.processEvents()
+
+    t_carga = medir(cargar)
+    repintados = visor.repintados
+    tiempos = [medir(lambda: clic(semilla)) for semilla in semillas]
+    assert visor.repintados > repintados
+    visor.close()
+    return t_carga, tiempos
+
+
+def main():
+    clics = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    app = QApplication([])
+    rng = np.random.default_rng(0)
+    print(f'Vista {VISTA[0]}x{VISTA[1]}, {clics} clics; ms (mediana / máximo por clic)')
+    print(f'{"imagen":<12} {"carga ant.":>10} {"clic ant.":>15} {"carga capas":>11} '
+          f'{"clic capas":>15}')
+    for ancho, alto in [(1920, 1080), (4000, 3000), (8000, 6000)]:
+        imagen = cv2.cvtColor(FuenteSintetica(ancho, alto).read()[1], cv2.COLOR_BGR2GRAY)
+        semillas = list(zip(rng.integers(0, ancho, clics).tolist(),
+                            rng.integers(0, alto, clics).tolist()))
+        carga_a, clics_a = anterior(imagen, semillas)
+        carga_c, clics_c = por_capas(imagen, semillas, app)
+        print(f'{ancho}x{alto:<6} {carga_a:10.0f} '
+              f'{np.median(clics_a):7.1f} / {max(clics_a):5.0f} {carga_c:11.0f} '
+              f'{np.median(clics_c):7.2f} / {max(clics_c):5.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -6,12 +6,14 @@ Created on Fri Nov  8 05:38:51 2024
 """
 
 import cv2
-import numpy as np
-import matplotlib.pyplot as plt
-from PyQt6 import QtWidgets, QtGui
-from PyQt6.QtWidgets import QFileDialog, QLabel, QVBoxLayout, QPushButton, QWidget, QApplication
+from PyQt6.QtWidgets import QFileDialog, QLabel, QVBoxLayout, QPushButton, QWidget, QApplication, QComboBox
+from PyQt6.QtGui import QPixmap
 import sys
 
+from interfaz.imagenes import array_to_qpixmap, mask_to_qimage
+from procesamiento.bordes import METODOS, canny_automatico
+from procesamiento.mascaras import MascaraBinaria
+
 
 class ImageProcessorApp(QWidget):
     def __init__(self):
@@ -32,12 +34,21 @@ class ImageProcessorApp(QWidget):
         self.select_button = QPushButton('Seleccionar Imagen')
         self.select_button.clicked.connect(self.select_image)
 
+        # Umbrales fijos (100/200) o elegidos por imagen
+        self.threshold_selector = QComboBox(self)
+        self.threshold_selector.addItems(METODOS)
+        self.threshold_selector.setCurrentText('fijo')
+
         # Agregar widgets al layout
         layout.addWidget(self.select_button)
+        layout.addWidget(self.threshold_selector)
         layout.addWidget(self.original_label)
         layout.addWidget(self.bordes_label)
         self.setLayout(layout)
 
+        # Último mapa de bordes, empacado a un bit por píxel
+        self.bordes = None
+
     def select_image(self):
         # Diálogo para seleccionar imagen
         file_dialog = QFileDialog()
@@ -50,19 +61,15 @@ class ImageProcessorApp(QWidget):
     def apply_canny_filter(self, file_path):
         # Cargar y procesar la imagen
         imagen = cv2.imread(file_path, cv2.IMREAD_GRAYSCALE)
-        bordes = cv2.Canny(imagen, 100, 200)
-
-        # Convertir la imagen original y la de bordes para mostrar en PyQt
-        original_image = QtGui.QImage(
-            imagen.data, imagen.shape[1], imagen.shape[0], imagen.strides[0], QtGui.QImage.Format.Format_Grayscale8)
-        bordes_image = QtGui.QImage(
-            bordes.data, bordes.shape[1], bordes.shape[0], bordes.strides[0], QtGui.QImage.Format.Format_Grayscale8)
+        self.bordes = MascaraBinaria.desde_arreglo(
+            canny_automatico(imagen, self.threshold_selector.currentText()))
 
         # Mostrar las imágenes en las etiquetas
         self.original_label.setPixmap(
-            QtGui.QPixmap.fromImage(original_image).scaled(400, 300))
+            array_to_qpixmap(imagen).scaled(400, 300))
+        # Se muestra directamente desde los bits, sin desempacar
         self.bordes_label.setPixmap(
-            QtGui.QPixmap.fromImage(bordes_image).scaled(400, 300))
+            QPixmap.fromImage(mask_to_qimage(self.bordes)).scaled(400, 300))
 
 
 if __name__ == '__main__':
@@ -1,12 +1,14 @@
 import sys
 import cv2
-import numpy as np
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QLabel, QScrollArea, QVBoxLayout, QPushButton, QFileDialog, QWidget, QHBoxLayout
 )
 
+from interfaz.imagenes import array_to_qpixmap
+from procesamiento import filtros
+from procesamiento.almacen import AlmacenPixeles
+
 
 class InterfazFiltros(QMainWindow):
     def __init__(self):
@@ -31,40 +33,32 @@ class InterfazFiltros(QMainWindow):
 
         self.setCentralWidget(self.contenedor)
 
+        # Las imágenes ya abiertas se leen de la caché sin decodificarlas
+        self.almacen = AlmacenPixeles()
+
     def cargar_imagen(self):
         archivo, _ = QFileDialog.getOpenFileName(
             self, 'Seleccionar Imagen', '', 'Imagen (*.png *.jpg *.bmp)')
         if archivo:
-            self.imagen_original = cv2.imread(archivo)
+            self.imagen_original = self.almacen.imread(archivo)
             self.mostrar_filtros()
 
     def aplicar_filtro_promedio(self, imagen):
-        return cv2.blur(imagen, (5, 5))
+        return filtros.filtro_promedio(imagen)
 
     def aplicar_filtro_mediano(self, imagen):
-        return cv2.medianBlur(imagen, 5)
+        return filtros.filtro_mediano(imagen)
 
     def aplicar_filtro_laplaciano(self, imagen):
-        laplaciano = cv2.Laplacian(imagen, cv2.CV_64F)
-        return cv2.convertScaleAbs(laplaciano)
+        return filtros.filtro_laplaciano(imagen)
 
     def aplicar_filtro_gradiente(self, imagen):
-        grad_x = cv2.Sobel(imagen, cv2.CV_64F, 1, 0, ksize=5)
-        grad_y = cv2.Sobel(imagen, cv2.CV_64F, 0, 1, ksize=5)
-        grad_x = cv2.convertScaleAbs(grad_x)
-        grad_y = cv2.convertScaleAbs(grad_y)
-        return cv2.addWeighted(grad_x, 0.5, grad_y, 0.5, 0)
+        return filtros.filtro_gradiente(imagen)
 
     def mostrar_imagen(self, imagen, titulo):
-        imagen_rgb = cv2.cvtColor(imagen, cv2.COLOR_BGR2RGB)
-        h, w, ch = imagen_rgb.shape
-        bytes_per_line = ch * w
-        q_image = QImage(imagen_rgb.data, w, h, bytes_per_line,
-                         QImage.Format.Format_RGB888)
-        pixmap = QPixmap.fromImage(q_image)
         label_imagen = QLabel()
-        label_imagen.setPixmap(pixmap.scaled(
-            400, 400, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        label_imagen.setPixmap(array_to_qpixmap(
+            imagen, size=(400, 400), mode=Qt.TransformationMode.SmoothTransformation))
         label_titulo = QLabel(titulo)
         self.scroll_layout.addWidget(label_titulo)
         self.scroll_layout.addWidget(label_imagen)
@@ -94,7 +88,12 @@ class InterfazFiltros(QMainWindow):
             cv2.imwrite(archivo, imagen)
 
 
-app = QApplication(sys.argv)
-ventana = InterfazFiltros()
-ventana.show()
-sys.exit(app.exec())
+def main():
+    app = QApplication(sys.argv)
+    ventana = InterfazFiltros()
+    ventana.show()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
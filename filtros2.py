@@ -1,15 +1,21 @@
 import sys
-import cv2
-import numpy as np
 from PyQt6.QtWidgets import QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout, QFileDialog, QScrollArea
-from PyQt6.QtGui import QPixmap, QImage
 from PyQt6.QtCore import Qt
 
+from interfaz.imagenes import array_to_qpixmap
+from procesamiento import filtros
+from procesamiento.almacen import AlmacenPixeles
+from procesamiento.grafo import banco_filtros2
+
 
 class ImageFilterApp(QWidget):
     def __init__(self):
         super().__init__()
         self.original_image = None
+        # Las imágenes ya abiertas se leen de la caché sin decodificarlas
+        self.almacen = AlmacenPixeles()
+        # El Gaussiano de pasa banda y rechaza banda se calcula una sola vez
+        self.banco = banco_filtros2()
         self.initUI()
 
     def initUI(self):
@@ -54,46 +60,36 @@ class ImageFilterApp(QWidget):
         fname, _ = QFileDialog.getOpenFileName(
             self, 'Abrir imagen', '/home', 'Image files (*.jpg *.png)')
         if fname:
-            self.original_image = cv2.imread(fname)
+            self.original_image = self.almacen.imread(fname)
             self.displayImage(self.original_image, self.OriginalLabel)
             self.applyAndDisplayFilters()
 
     def applyAndDisplayFilters(self):
         if self.original_image is not None:
-            self.displayImage(self.applyHighPassFilter(),
+            resultados = self.banco.ejecutar(self.original_image)
+            self.displayImage(resultados['pasa_altas'],
                               self.HighPassFilterLabel)
-            self.displayImage(self.applyLowPassFilter(),
+            self.displayImage(resultados['pasa_bajas'],
                               self.LowPassFilterLabel)
-            self.displayImage(self.applyBandPassFilter(),
+            self.displayImage(resultados['pasa_banda'],
                               self.BandPassFilterLabel)
-            self.displayImage(self.applyBandStopFilter(),
+            self.displayImage(resultados['rechaza_banda'],
                               self.BandStopFilterLabel)
 
     def applyHighPassFilter(self):
-        kernel = np.array([[-1, -1, -1], [-1, 8, -1], [-1, -1, -1]])
-        return cv2.filter2D(self.original_image, -1, kernel)
+        return filtros.high_pass(self.original_image)
 
     def applyLowPassFilter(self):
-        kernel = np.ones((5, 5), np.float32) / 25
-        return cv2.filter2D(self.original_image, -1, kernel)
+        return filtros.low_pass(self.original_image)
 
     def applyBandPassFilter(self):
-        low = cv2.GaussianBlur(self.original_image, (17, 17), 0)
-        return cv2.subtract(self.original_image, low)
+        return filtros.band_pass(self.original_image)
 
     def applyBandStopFilter(self):
-        low = cv2.GaussianBlur(self.original_image, (17, 17), 0)
-        high = cv2.subtract(self.original_image, low)
-        return cv2.add(self.original_image, high)
+        return filtros.band_stop(self.original_image)
 
     def displayImage(self, img, label):
-        qformat = QImage.Format.Format_Grayscale8 if len(
-            img.shape) == 2 else QImage.Format.Format_RGB888
-        outImage = QImage(
-            img.data, img.shape[1], img.shape[0], img.strides[0], qformat)
-        outImage = outImage.rgbSwapped()
-        label.setPixmap(QPixmap.fromImage(outImage).scaled(
-            200, 200, Qt.AspectRatioMode.KeepAspectRatio))
+        label.setPixmap(array_to_qpixmap(img, size=(200, 200)))
 
     def downloadImage(self, pixmap, filter_name):
         if pixmap:
@@ -118,7 +114,12 @@ class ImageFilterApp(QWidget):
         self.downloadImage(pixmap, 'Band Stop Filter')
 
 
-app = QApplication(sys.argv)
-ex = ImageFilterApp()
-ex.show()
-sys.exit(app.exec())
+def main():
+    app = QApplication(sys.argv)
+    ex = ImageFilterApp()
+    ex.show()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,13 @@
+import os
 import sys
 import cv2
-import numpy as np
-from PyQt6.QtWidgets import QApplication, QMainWindow, QLabel, QPushButton, QVBoxLayout, QWidget, QFileDialog
-from PyQt6.QtGui import QPixmap, QImage
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QMainWindow, QLabel, QPushButton, QVBoxLayout, QWidget, QFileDialog, QLineEdit, QMessageBox
+from PyQt6.QtCore import Qt, QTimer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from interfaz.imagenes import array_to_qpixmap  # noqa: E402
+from procesamiento import morfologia  # noqa: E402
+from procesamiento.lote import EscritorFondo  # noqa: E402
 
 
 class ImageProcessor(QMainWindow):
@@ -20,12 +24,18 @@ class ImageProcessor(QMainWindow):
         self.clean_noise_btn = QPushButton(
             "Proceso de Limpieza de Ruido", self)
         self.edge_detection_btn = QPushButton("Detectar Bordes", self)
+        # Cadena declarativa, p. ej. "apertura:5,gradiente:3:elipse"
+        self.chain_input = QLineEdit("apertura:5,gradiente:3", self)
+        self.chain_btn = QPushButton("Aplicar Cadena", self)
+        self.save_btn = QPushButton("Guardar Resultado", self)
 
         self.load_btn.clicked.connect(self.load_image)
         self.erosion_btn.clicked.connect(self.apply_erosion)
         self.dilation_btn.clicked.connect(self.apply_dilation)
         self.clean_noise_btn.clicked.connect(self.clean_noise)
         self.edge_detection_btn.clicked.connect(self.edge_detection)
+        self.chain_btn.clicked.connect(self.apply_chain)
+        self.save_btn.clicked.connect(self.save_result)
 
         layout = QVBoxLayout()
         layout.addWidget(self.label)
@@ -34,12 +44,24 @@ class ImageProcessor(QMainWindow):
         layout.addWidget(self.dilation_btn)
         layout.addWidget(self.clean_noise_btn)
         layout.addWidget(self.edge_detection_btn)
+        layout.addWidget(self.chain_input)
+        layout.addWidget(self.chain_btn)
+        layout.addWidget(self.save_btn)
 
         container = QWidget()
         container.setLayout(layout)
         self.setCentralWidget(container)
 
         self.image = None
+        self.result = None
+        self.result_name = None
+        # Los resultados solo se escriben al pedirlo, en un hilo aparte
+        self.writer = EscritorFondo()
+        self.saved_path = None
+        # Revisa cuándo termina la escritura para informar el resultado
+        self.write_timer = QTimer(self)
+        self.write_timer.setInterval(100)
+        self.write_timer.timeout.connect(self.check_writes)
 
     def load_image(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -49,43 +71,75 @@ class ImageProcessor(QMainWindow):
             self.display_image(self.image)
 
     def display_image(self, img):
-        qformat = QImage.Format.Format_Grayscale8 if len(
-            img.shape) == 2 else QImage.Format.Format_RGB888
-        qimg = QImage(img.data, img.shape[1],
-                      img.shape[0], img.strides[0], qformat)
-        pixmap = QPixmap.fromImage(qimg)
+        pixmap = array_to_qpixmap(img)
         self.label.setPixmap(pixmap.scaled(self.label.size(
         ), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
 
+    def show_result(self, image, name):
+        self.result = image
+        self.result_name = name
+        self.display_image(image)
+
     def apply_erosion(self):
         if self.image is not None:
-            kernel = np.ones((5, 5), np.uint8)
-            eroded_image = cv2.erode(self.image, kernel, iterations=1)
-            self.display_image(eroded_image)
-            cv2.imwrite("erosion_result.png", eroded_image)
+            self.show_result(morfologia.erosion(self.image), "erosion_result.png")
 
     def apply_dilation(self):
         if self.image is not None:
-            kernel = np.ones((5, 5), np.uint8)
-            dilated_image = cv2.dilate(self.image, kernel, iterations=1)
-            self.display_image(dilated_image)
-            cv2.imwrite("dilation_result.png", dilated_image)
+            self.show_result(morfologia.dilation(self.image), "dilation_result.png")
 
     def clean_noise(self):
         if self.image is not None:
-            kernel = np.ones((5, 5), np.uint8)
-            eroded = cv2.erode(self.image, kernel, iterations=1)
-            cleaned_image = cv2.dilate(eroded, kernel, iterations=1)
-            self.display_image(cleaned_image)
-            cv2.imwrite("clean_noise_result.png", cleaned_image)
+            self.show_result(morfologia.clean_noise(self.image), "clean_noise_result.png")
 
     def edge_detection(self):
         if self.image is not None:
-            kernel = np.ones((5, 5), np.uint8)
-            dilated = cv2.dilate(self.image, kernel, iterations=1)
-            edge_image = cv2.erode(dilated, kernel, iterations=1)
-            self.display_image(edge_image)
-            cv2.imwrite("edge_detection_result.png", edge_image)
+            self.show_result(morfologia.edge_detection(self.image), "edge_detection_result.png")
+
+    def apply_chain(self):
+        if self.image is not None:
+            try:
+                chain = morfologia.compilar(self.chain_input.text())
+            except ValueError as e:
+                self.statusBar().showMessage(str(e))
+                return
+            self.show_result(chain(self.image), "chain_result.png")
+
+    def save_result(self):
+        if self.result is not None:
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, "Guardar Resultado", self.result_name, "Images (*.png *.jpg *.bmp)")
+            if file_path:
+                # El filtro del diálogo no agrega extensión y imwrite la necesita
+                if not os.path.splitext(file_path)[1]:
+                    file_path += ".png"
+                self.saved_path = os.path.abspath(file_path)
+                self.writer.guardar(self.saved_path, self.result)
+                self.statusBar().showMessage(f"Guardando {self.saved_path}...")
+                self.write_timer.start()
+
+    def write_errors_text(self, errors):
+        return "; ".join(f"No se pudo guardar {path}: {error.strip()}" for path, error in errors)
+
+    def check_writes(self):
+        if self.writer.pendientes():
+            return
+        self.write_timer.stop()
+        errors = self.writer.tomar_errores()
+        if errors:
+            self.statusBar().showMessage(self.write_errors_text(errors))
+        else:
+            self.statusBar().showMessage(f"Guardado en {self.saved_path}")
+
+    def closeEvent(self, event):
+        # Termina de escribir lo pendiente antes de salir
+        self.write_timer.stop()
+        self.writer.cerrar()
+        errors = self.writer.tomar_errores()
+        if errors:
+            self.statusBar().showMessage(self.write_errors_text(errors))
+            QMessageBox.warning(self, "Error al guardar", self.write_errors_text(errors))
+        super().closeEvent(event)
 
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+"""Utilidades de PyQt6 compartidas por las ventanas del proyecto."""
@@ -0,0 +1,77 @@
+"""Conversión de arreglos de NumPy a QImage/QPixmap sin copias ni cvtColor.
+
+Se elige el formato de Qt que coincide con la memoria del arreglo
+(Grayscale8, Grayscale16, BGR888, RGB888, ARGB32 para BGRA, RGBA8888),
+así que no hace falta convertir colores antes de mostrar. La QImage apunta
+directamente al buffer del arreglo y guarda una referencia a él para que
+no se libere mientras la imagen exista.
+"""
+import numpy as np
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage, QPixmap
+
+_FORMATOS_BGR = {
+    3: QImage.Format.Format_BGR888,
+    # En memoria, ARGB32 en little-endian es B, G, R, A
+    4: QImage.Format.Format_ARGB32,
+}
+_FORMATOS_RGB = {
+    3: QImage.Format.Format_RGB888,
+    4: QImage.Format.Format_RGBA8888,
+}
+
+
+def qimage_format(array, bgr=True):
+    """Formato de QImage que corresponde a la forma y tipo de ``array``."""
+    if array.ndim == 2 or (array.ndim == 3 and array.shape[2] == 1):
+        if array.dtype == np.uint8:
+            return QImage.Format.Format_Grayscale8
+        if array.dtype == np.uint16:
+            return QImage.Format.Format_Grayscale16
+    elif array.ndim == 3 and array.dtype == np.uint8:
+        formato = (_FORMATOS_BGR if bgr else _FORMATOS_RGB).get(array.shape[2])
+        if formato is not None:
+            return formato
+    raise ValueError(
+        f'No se puede mostrar un arreglo {array.dtype} con forma {array.shape}')
+
+
+def array_to_qimage(array, bgr=True):
+    """Envuelve ``array`` en una QImage sin copiar sus píxeles.
+
+    ``bgr`` indica el orden de canales de las imágenes de 3 o 4 canales
+    (el de OpenCV por defecto). Solo se copia si las filas no son
+    contiguas, por ejemplo al recortar columnas o con pasos negativos;
+    el paso entre filas se toma de ``array.strides``.
+    """
+    formato = qimage_format(array, bgr)
+    if not array.flags.c_contiguous:
+        array = np.ascontiguousarray(array)
+    height, width = array.shape[:2]
+    qimage = QImage(array.data, width, height, array.strides[0], formato)
+    # La QImage no es dueña de la memoria: el arreglo debe seguir vivo
+    qimage._array = array
+    return qimage
+
+
+def mask_to_qimage(mascara, color=(255, 255, 255)):
+    """Muestra una ``MascaraBinaria`` sin desempacarla (QImage Format_Mono).
+
+    Los bits en 1 se pintan con ``color`` y los 0 en negro.
+    """
+    alto, ancho = mascara.forma
+    datos = np.ascontiguousarray(mascara.datos)
+    qimage = QImage(datos.data, ancho, alto, datos.strides[0], QImage.Format.Format_Mono)
+    qimage.setColorTable([0xFF000000, 0xFF000000 | (color[0] << 16) | (color[1] << 8) | color[2]])
+    qimage._array = datos
+    return qimage
+
+
+def array_to_qpixmap(array, bgr=True, size=None,
+                     mode=Qt.TransformationMode.FastTransformation):
+    """QPixmap de ``array``, opcionalmente escalado a ``size`` (ancho, alto)."""
+    pixmap = QPixmap.fromImage(array_to_qimage(array, bgr))
+    if size is not None:
+        pixmap = pixmap.scaled(size[0], size[1],
+                               Qt.AspectRatioMode.KeepAspectRatio, mode)
+    return pixmap
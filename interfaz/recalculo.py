@@ -0,0 +1,86 @@
+"""Recalculo en segundo plano para vistas previas controladas por sliders o combos.
+
+``RecalculoDiferido`` junta los cambios rápidos de parámetros: cada
+``solicitar`` reemplaza a la solicitud pendiente y reinicia la espera, y
+solo la última se ejecuta en un hilo de trabajo. Si llega una solicitud
+nueva mientras otra corre, el resultado viejo se descarta al terminar y
+nunca llega a la interfaz. Los resultados se entregan en el hilo de la GUI
+mediante la señal ``resultado``.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+
+class RecalculoDiferido(QObject):
+    resultado = pyqtSignal(object)
+    error = pyqtSignal(object)
+    # Uso interno: lleva (generación, resultado, error) del hilo de trabajo a la GUI
+    _terminado = pyqtSignal(int, object, object)
+
+    def __init__(self, funcion, espera_ms=0, parent=None):
+        super().__init__(parent)
+        self._funcion = funcion
+        self._generacion = 0
+        self._pendiente = None
+        self._ocupado = False
+        self._hilo = ThreadPoolExecutor(max_workers=1)
+        self._terminado.connect(self._recibir)
+
+        self._espera = QTimer(self)
+        self._espera.setSingleShot(True)
+        self._espera.setInterval(espera_ms)
+        self._espera.timeout.connect(self._lanzar)
+
+    @property
+    def ocupado(self):
+        return self._ocupado or self._pendiente is not None
+
+    def solicitar(self, *args):
+        """Programa ``funcion(*args)`` y cancela cualquier solicitud anterior."""
+        self._generacion += 1
+        self._pendiente = (self._generacion, args)
+        self._espera.start()
+
+    def adelantar(self):
+        """Lanza la solicitud pendiente sin esperar a que venza la pausa."""
+        self._espera.stop()
+        self._lanzar()
+
+    def cancelar(self):
+        """Descarta la solicitud pendiente y el resultado de la que esté corriendo."""
+        self._generacion += 1
+        self._pendiente = None
+        self._espera.stop()
+
+    def cerrar(self):
+        self.cancelar()
+        self._hilo.shutdown(wait=False)
+
+    def _lanzar(self):
+        # Si hay un trabajo en curso, la solicitud espera a que termine
+        if self._ocupado or self._pendiente is None:
+            return
+        generacion, args = self._pendiente
+        self._pendiente = None
+        self._ocupado = True
+        self._hilo.submit(self._ejecutar, generacion, args)
+
+    def _ejecutar(self, generacion, args):
+        if generacion != self._generacion:
+            self._terminado.emit(generacion, None, None)
+            return
+        try:
+            self._terminado.emit(generacion, self._funcion(*args), None)
+        except Exception as e:
+            self._terminado.emit(generacion, None, e)
+
+    def _recibir(self, generacion, resultado, error):
+        self._ocupado = False
+        if generacion == self._generacion:
+            if error is not None:
+                self.error.emit(error)
+            else:
+                self.resultado.emit(resultado)
+        if not self._espera.isActive():
+            self._lanzar()
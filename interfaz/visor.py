@@ -0,0 +1,192 @@
+"""Visor por capas para imágenes grandes: base, rejilla y resaltado.
+
+La imagen se reduce una vez a la resolución de la vista con
+``cv2.resize`` (INTER_AREA); ese pixmap es la capa base y solo se rehace
+al cambiar de imagen o de tamaño. La rejilla se dibuja en cada
+``paintEvent`` en coordenadas de la vista, solo dentro del área a
+repintar, sin tocar el arreglo. El resaltado es una imagen ARGB del
+tamaño de la caja de la región (reducida a la escala de la vista) y al
+cambiarlo se repintan únicamente la caja anterior y la nueva.
+"""
+import math
+import time
+
+import cv2
+import numpy as np
+from PyQt6.QtCore import QPointF, QRectF, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter, QPixmap
+from PyQt6.QtWidgets import QSizePolicy, QWidget
+
+from interfaz.imagenes import array_to_qimage
+
+# Separación mínima en píxeles de vista entre líneas de la rejilla
+SEPARACION_MINIMA = 4
+TAMANO_INICIAL_MAXIMO = QSize(1280, 800)
+
+
+class VisorCapas(QWidget):
+    # Coordenadas (x, y) en la imagen del píxel bajo el clic
+    pixel_seleccionado = pyqtSignal(int, int)
+    # Milisegundos entre el clic y el final del repintado que provocó
+    latencia = pyqtSignal(float)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.grid_size = 10
+        self.grid_color = QColor(0, 255, 0)
+        self.highlight_color = QColor(255, 255, 255)
+        self._array = None
+        self._qimage = None
+        self._base = None
+        self._destino = QRectF()
+        self._caja = None
+        self._dentro = None
+        self._resaltado = None
+        # Momento del clic en curso y del que espera su repintado
+        self._presionado = None
+        self._clic = None
+        self.repintados = 0
+
+    def set_image(self, array):
+        self._array = array
+        self._qimage = array_to_qimage(array)
+        self._base = None
+        self.clear_highlight()
+        self.updateGeometry()
+        self.update()
+
+    def sizeHint(self):
+        if self._qimage is None:
+            return QSize(640, 480)
+        return self._qimage.size().boundedTo(TAMANO_INICIAL_MAXIMO)
+
+    def set_grid(self, grid_size):
+        self.grid_size = grid_size
+        self.update()
+
+    def set_highlight(self, caja, dentro):
+        """Resalta los píxeles ``dentro`` (booleano) de la caja (x, y, ancho, alto)."""
+        anterior = self._rect_resaltado()
+        # Solo se mide la latencia si el cambio lo pidió un clic
+        self._clic = self._presionado
+        self._caja, self._dentro = caja, dentro
+        self._resaltado = None
+        self._actualizar_zona(anterior)
+
+    def clear_highlight(self):
+        anterior = self._rect_resaltado()
+        self._caja = self._dentro = self._resaltado = None
+        self._actualizar_zona(anterior)
+
+    def _actualizar_zona(self, anterior):
+        zona = self._rect_resaltado()
+        if anterior is not None:
+            zona = anterior if zona is None else zona.united(anterior)
+        if zona is not None:
+            self.update(zona)
+
+    def _escala(self):
+        ancho, alto = self._qimage.width(), self._qimage.height()
+        escala = min(self.width() / ancho, self.height() / alto)
+        return escala, QRectF((self.width() - ancho * escala) / 2,
+                              (self.height() - alto * escala) / 2,
+                              ancho * escala, alto * escala)
+
+    def _rect_resaltado(self):
+        if self._caja is None or self._qimage is None:
+            return None
+        escala, destino = self._escala()
+        x, y, ancho, alto = self._caja
+        rect = QRectF(destino.x() + x * escala, destino.y() + y * escala,
+                      ancho * escala, alto * escala)
+        return rect.toAlignedRect().adjusted(-1, -1, 1, 1)
+
+    def _preparar_base(self):
+        escala, self._destino = self._escala()
+        tamano = self._destino.toAlignedRect().size()
+        # INTER_AREA promedia al reducir; al ampliar se ven los píxeles tal cual
+        reducida = cv2.resize(self._array, (max(tamano.width(), 1), max(tamano.height(), 1)),
+                              interpolation=cv2.INTER_AREA if escala < 1 else cv2.INTER_NEAREST)
+        self._base = QPixmap.fromImage(array_to_qimage(reducida))
+
+    def _preparar_resaltado(self):
+        rect = self._rect_resaltado().adjusted(1, 1, -1, -1)
+        dentro = self._dentro.view(np.uint8)
+        # Nunca más píxeles que los que se ven: la región se reduce a la vista
+        if rect.width() < dentro.shape[1] or rect.height() < dentro.shape[0]:
+            dentro = cv2.resize(dentro, (max(rect.width(), 1), max(rect.height(), 1)),
+                                interpolation=cv2.INTER_NEAREST)
+        capa = np.zeros(dentro.shape + (4,), np.uint8)
+        color = self.highlight_color
+        capa[dentro != 0] = (color.blue(), color.green(), color.red(), 255)
+        self._resaltado = array_to_qimage(capa)
+
+    def resizeEvent(self, event):
+        self._base = None
+        self._resaltado = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        if self._qimage is None:
+            return
+        if self._base is None:
+            self._preparar_base()
+        zona = event.rect()
+        painter = QPainter(self)
+        painter.drawPixmap(self._destino.topLeft(), self._base)
+        if self._caja is not None:
+            if self._resaltado is None:
+                self._preparar_resaltado()
+            escala, _ = self._escala()
+            x, y, ancho, alto = self._caja
+            painter.drawImage(QRectF(self._destino.x() + x * escala,
+                                     self._destino.y() + y * escala,
+                                     ancho * escala, alto * escala),
+                              self._resaltado)
+        self._dibujar_rejilla(painter, zona)
+        painter.end()
+        self.repintados += 1
+        if self._clic is not None:
+            self.latencia.emit((time.perf_counter() - self._clic) * 1000)
+            self._clic = None
+
+    def _dibujar_rejilla(self, painter, zona):
+        if self.grid_size <= 0:
+            return
+        escala, destino = self._escala()
+        # Con mucha reducción se omiten líneas para no llenar la vista de verde
+        paso = self.grid_size * math.ceil(SEPARACION_MINIMA / (self.grid_size * escala))
+        visible = QRectF(zona).intersected(destino)
+        if visible.isEmpty():
+            return
+        painter.setPen(self.grid_color)
+        ancho, alto = self._qimage.width(), self._qimage.height()
+        inicio_x = int((visible.left() - destino.x()) / escala) // paso * paso
+        fin_x = min(ancho, int((visible.right() - destino.x()) / escala) + 1)
+        for x in range(inicio_x, fin_x, paso):
+            vista_x = destino.x() + x * escala
+            painter.drawLine(QPointF(vista_x, visible.top()), QPointF(vista_x, visible.bottom()))
+        inicio_y = int((visible.top() - destino.y()) / escala) // paso * paso
+        fin_y = min(alto, int((visible.bottom() - destino.y()) / escala) + 1)
+        for y in range(inicio_y, fin_y, paso):
+            vista_y = destino.y() + y * escala
+            painter.drawLine(QPointF(visible.left(), vista_y), QPointF(visible.right(), vista_y))
+
+    def a_imagen(self, posicion):
+        """Coordenadas (x, y) en la imagen de un punto de la vista, o None si cae fuera."""
+        escala, destino = self._escala()
+        x = math.floor((posicion.x() - destino.x()) / escala)
+        y = math.floor((posicion.y() - destino.y()) / escala)
+        if 0 <= x < self._qimage.width() and 0 <= y < self._qimage.height():
+            return x, y
+        return None
+
+    def mousePressEvent(self, event):
+        if self._qimage is None:
+            return
+        pixel = self.a_imagen(event.position())
+        if pixel is not None:
+            self._presionado = time.perf_counter()
+            self.pixel_seleccionado.emit(*pixel)
+            self._presionado = None
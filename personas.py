@@ -1,12 +1,14 @@
 import sys
 import cv2
-import numpy as np
 import matplotlib.pyplot as plt
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QPushButton, QWidget, QFileDialog
 )
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
+from procesamiento.cache_rostros import CacheRostros
+from procesamiento.rostros import draw_faces
+
 
 class ImageApp(QMainWindow):
     def __init__(self):
@@ -16,6 +18,8 @@ class ImageApp(QMainWindow):
         self.image_path = None
         self.image = None
         self.image_rostros = None
+        # Las imágenes ya vistas no vuelven a pasar por el clasificador
+        self.cache = CacheRostros()
         self.central_widget = QWidget(self)
         self.setCentralWidget(self.central_widget)
         self.layout = QVBoxLayout(self.central_widget)
@@ -29,8 +33,6 @@ class ImageApp(QMainWindow):
             'Guardar Imagen con Rostros Detectados', self)
         self.save_button.clicked.connect(self.save_image)
         self.layout.addWidget(self.save_button)
-        self.face_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
 
     def load_image(self):
         file_dialog = QFileDialog(self)
@@ -42,14 +44,8 @@ class ImageApp(QMainWindow):
 
     def apply_face_detection(self):
         if self.image is not None:
-            gray = cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY)
-            rostros = self.face_cascade.detectMultiScale(
-                gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30))
-
-            self.image_rostros = self.image.copy()
-            for (x, y, w, h) in rostros:
-                cv2.rectangle(self.image_rostros, (x, y),
-                              (x+w, y+h), (255, 0, 0), 2)
+            rostros, _, _ = self.cache.detectar(self.image, minSize=(30, 30))
+            self.image_rostros = draw_faces(self.image.copy(), rostros)
 
             self.ax1.clear()
             self.ax2.clear()
@@ -70,7 +66,12 @@ class ImageApp(QMainWindow):
                 cv2.imwrite(save_path, self.image_rostros)
 
 
-app = QApplication(sys.argv)
-window = ImageApp()
-window.show()
-sys.exit(app.exec())
+def main():
+    app = QApplication(sys.argv)
+    window = ImageApp()
+    window.show()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
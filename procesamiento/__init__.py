@@ -0,0 +1,38 @@
+"""Operaciones de procesamiento de imágenes sin dependencias de interfaz gráfica.
+
+Los submódulos se importan al primer acceso (``procesamiento.filtros``,
+``procesamiento.rostros``, ...), de modo que importar el paquete no carga
+OpenCV, matplotlib ni el clasificador Haar hasta que se necesitan.
+"""
+import importlib
+
+__all__ = [
+    'almacen',
+    'bordes',
+    'cache_rostros',
+    'color',
+    'convolucion',
+    'deteccion',
+    'distorsion',
+    'filtros',
+    'frecuencia',
+    'fuentes',
+    'grafo',
+    'histograma',
+    'hsv',
+    'intensidad',
+    'lote',
+    'mascaras',
+    'morfologia',
+    'regiones',
+    'rostros',
+    'seguimiento',
+    'teselas',
+    'video',
+]
+
+
+def __getattr__(nombre):
+    if nombre in __all__:
+        return importlib.import_module(f'{__name__}.{nombre}')
+    raise AttributeError(f'module {__name__!r} has no attribute {nombre!r}')
@@ -0,0 +1,141 @@
+"""Caché en disco de píxeles ya decodificados.
+
+Decodificar un JPEG o PNG grande cuesta mucho más que leer los mismos
+píxeles en crudo. ``AlmacenPixeles`` guarda cada imagen decodificada como
+``.npy`` con una clave que depende de la ruta, la fecha de modificación,
+el tamaño y los flags de lectura, y en las siguientes lecturas la abre
+mapeada en memoria, sin copiar. Si el directorio supera el límite de
+tamaño se borran primero las entradas usadas hace más tiempo.
+
+El tamaño del directorio se lleva como una cuenta que suma cada
+escritura; solo se vuelve a medir el directorio (para incluir lo que
+escriben otros procesos) cada ``ESCRITURAS_POR_MEDICION`` escrituras o
+al recortar, y el recorte baja hasta ``FRACCION_RECORTE`` del límite para
+no repetirse en cada escritura.
+
+Los arreglos que devuelve desde la caché son de solo lectura.
+"""
+import hashlib
+import os
+import tempfile
+
+import cv2
+import numpy as np
+
+DIRECTORIO_POR_DEFECTO = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+    'procesamiento', 'pixeles')
+LIMITE_POR_DEFECTO = 2 * 2**30
+ESCRITURAS_POR_MEDICION = 256
+FRACCION_RECORTE = 0.9
+
+
+class AlmacenPixeles:
+    def __init__(self, directorio=DIRECTORIO_POR_DEFECTO, limite_bytes=LIMITE_POR_DEFECTO):
+        self.directorio = directorio
+        self.limite_bytes = limite_bytes
+        os.makedirs(directorio, exist_ok=True)
+        self.aciertos = 0
+        self.fallos = 0
+        self.errores_escritura = 0
+        # Tamaño estimado del directorio; None hasta la primera medición
+        self._estimado = None
+        self._escrituras = 0
+
+    def _ruta_cache(self, ruta, flags):
+        info = os.stat(ruta)
+        clave = f'{os.path.abspath(ruta)}\0{info.st_mtime_ns}\0{info.st_size}\0{flags}'
+        return os.path.join(self.directorio, hashlib.sha1(clave.encode()).hexdigest() + '.npy')
+
+    def imread(self, ruta, flags=cv2.IMREAD_COLOR):
+        """Como ``cv2.imread``, pero sirve los píxeles desde la caché si existen."""
+        try:
+            ruta_cache = self._ruta_cache(ruta, flags)
+        except FileNotFoundError:
+            return None
+        try:
+            imagen = np.load(ruta_cache, mmap_mode='r')
+            # La fecha de modificación marca el último uso para el LRU
+            os.utime(ruta_cache)
+            self.aciertos += 1
+            return imagen
+        except (FileNotFoundError, ValueError):
+            # No existe, otro proceso la borró, o quedó incompleta
+            pass
+
+        self.fallos += 1
+        imagen = cv2.imread(ruta, flags)
+        if imagen is not None:
+            try:
+                self._guardar(ruta_cache, imagen)
+            except OSError:
+                # Sin caché (disco lleno, permisos) la imagen decodificada sigue sirviendo
+                self.errores_escritura += 1
+        return imagen
+
+    def _guardar(self, ruta_cache, imagen):
+        # Escritura atómica para que otros procesos nunca lean un archivo a medias
+        descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix='.parcial')
+        try:
+            with os.fdopen(descriptor, 'wb') as archivo:
+                np.save(archivo, imagen)
+            os.replace(temporal, ruta_cache)
+        except BaseException:
+            # entradas() solo ve los .npy: un .parcial olvidado nunca se recortaría
+            try:
+                os.remove(temporal)
+            except FileNotFoundError:
+                pass
+            raise
+        if self._estimado is None or self._escrituras >= ESCRITURAS_POR_MEDICION:
+            self._estimado = self.tamano()
+            self._escrituras = 0
+        else:
+            self._estimado += os.path.getsize(ruta_cache)
+        self._escrituras += 1
+        if self._estimado > self.limite_bytes:
+            self._estimado = self.recortar(int(self.limite_bytes * FRACCION_RECORTE))
+            self._escrituras = 0
+
+    def entradas(self):
+        """(ruta, bytes, último uso) de cada entrada, de la más vieja a la más nueva."""
+        entradas = []
+        for entrada in os.scandir(self.directorio):
+            if entrada.name.endswith('.npy'):
+                try:
+                    info = entrada.stat()
+                except FileNotFoundError:
+                    continue
+                entradas.append((entrada.path, info.st_size, info.st_mtime))
+        return sorted(entradas, key=lambda e: e[2])
+
+    def tamano(self):
+        return sum(bytes_ for _, bytes_, _ in self.entradas())
+
+    def recortar(self, objetivo=None):
+        """Borra las entradas menos usadas hasta quedar bajo ``objetivo`` (por defecto, el límite).
+
+        Devuelve el tamaño que queda.
+        """
+        if objetivo is None:
+            objetivo = self.limite_bytes
+        entradas = self.entradas()
+        total = sum(bytes_ for _, bytes_, _ in entradas)
+        for ruta, bytes_, _ in entradas:
+            if total <= objetivo:
+                break
+            try:
+                os.remove(ruta)
+            except FileNotFoundError:
+                pass
+            total -= bytes_
+        return total
+
+    def limpiar(self):
+        for ruta, _, _ in self.entradas():
+            try:
+                os.remove(ruta)
+            except FileNotFoundError:
+                pass
+        self._estimado = 0
+        self._escrituras = 0
@@ -0,0 +1,147 @@
+"""Caché persistente de detecciones de rostros en SQLite.
+
+La clave es el hash del contenido de la imagen (los bytes del archivo, o
+los píxeles si se pasa un arreglo) junto con los parámetros del detector:
+``scaleFactor``, ``minNeighbors``, ``minSize`` y el archivo del
+clasificador. Una imagen repetida con otro nombre o en otra carpeta es un
+acierto; una imagen modificada o detectada con otros parámetros, no.
+
+Con un acierto no se decodifica la imagen ni se corre el clasificador.
+Cada entrada guarda el tamaño de la imagen y lo que costó calcularla, así
+que la caché puede reportar el tiempo ahorrado. La base usa WAL y admite varios procesos.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from procesamiento.rostros import CASCADA_ROSTROS, detect_faces
+
+RUTA_POR_DEFECTO = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+    'procesamiento', 'rostros.sqlite')
+# Se incrementa al cambiar la tabla; una base con otra versión se vacía
+VERSION_ESQUEMA = 2
+
+
+def hash_contenido(origen):
+    """SHA-1 de los bytes del archivo o de los píxeles (con forma y tipo) de un arreglo."""
+    h = hashlib.sha1()
+    if isinstance(origen, np.ndarray):
+        h.update(f'{origen.shape}{origen.dtype}'.encode())
+        h.update(np.ascontiguousarray(origen).data)
+    else:
+        with open(origen, 'rb') as archivo:
+            for bloque in iter(lambda: archivo.read(1 << 20), b''):
+                h.update(bloque)
+    return h.digest()
+
+
+class CacheRostros:
+    def __init__(self, ruta=RUTA_POR_DEFECTO):
+        self.ruta = ruta
+        if os.path.dirname(ruta):
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conexion = sqlite3.connect(ruta, timeout=30, check_same_thread=False)
+        self._conexion.execute('PRAGMA journal_mode=WAL')
+        with self._conexion:
+            version = self._conexion.execute('PRAGMA user_version').fetchone()[0]
+            if version != VERSION_ESQUEMA:
+                self._conexion.execute('DROP TABLE IF EXISTS detecciones')
+                self._conexion.execute(f'PRAGMA user_version = {VERSION_ESQUEMA}')
+            self._conexion.execute(
+                'CREATE TABLE IF NOT EXISTS detecciones ('
+                'clave BLOB PRIMARY KEY, rostros BLOB NOT NULL, ancho INTEGER NOT NULL, '
+                'alto INTEGER NOT NULL, segundos REAL NOT NULL)')
+        self.aciertos = 0
+        self.fallos = 0
+        self.segundos_ahorrados = 0.0
+
+    @staticmethod
+    def clave(contenido, scaleFactor, minNeighbors, minSize, cascada):
+        parametros = f'{scaleFactor!r}\0{minNeighbors!r}\0{minSize!r}\0{cascada}'
+        return hashlib.sha1(contenido + parametros.encode()).digest()
+
+    def consultar(self, clave):
+        """Devuelve (rostros, (ancho, alto), segundos que costó calcularlos) o None."""
+        with self._lock:
+            fila = self._conexion.execute(
+                'SELECT rostros, ancho, alto, segundos FROM detecciones WHERE clave = ?',
+                (clave,)).fetchone()
+        if fila is None:
+            return None
+        return np.frombuffer(fila[0], np.int32).reshape(-1, 4), (fila[1], fila[2]), fila[3]
+
+    def guardar(self, clave, rostros, tamano, segundos):
+        datos = np.ascontiguousarray(rostros, np.int32).reshape(-1, 4).tobytes()
+        with self._lock, self._conexion:
+            self._conexion.execute(
+                'INSERT OR REPLACE INTO detecciones VALUES (?, ?, ?, ?, ?)',
+                (clave, datos, tamano[0], tamano[1], segundos))
+
+    def detectar(self, origen, scaleFactor=1.1, minNeighbors=5, minSize=None,
+                 cascada=CASCADA_ROSTROS):
+        """Rostros de una ruta o arreglo BGR/gris; devuelve (rostros, acierto, datos).
+
+        Los rostros son un arreglo int32 de forma (N, 4). ``datos`` tiene
+        ``ancho``, ``alto``, ``lectura_ms`` (hash, consulta y lectura),
+        ``deteccion_ms`` (0 con un acierto) y ``ahorrado_ms`` (0 con un fallo).
+        """
+        inicio = time.perf_counter()
+        minSize = tuple(minSize) if minSize else None
+        clave = self.clave(hash_contenido(origen), scaleFactor, minNeighbors, minSize, cascada)
+        guardado = self.consultar(clave)
+        if guardado is not None:
+            rostros, (ancho, alto), segundos = guardado
+            lectura = time.perf_counter() - inicio
+            self.aciertos += 1
+            self.segundos_ahorrados += segundos - lectura
+            return rostros, True, {
+                'ancho': ancho, 'alto': alto,
+                'lectura_ms': round(lectura * 1000, 2), 'deteccion_ms': 0.0,
+                'ahorrado_ms': round((segundos - lectura) * 1000, 2),
+            }
+
+        if isinstance(origen, np.ndarray):
+            gray = cv2.cvtColor(origen, cv2.COLOR_BGR2GRAY) if origen.ndim == 3 else origen
+        else:
+            gray = cv2.imread(os.fspath(origen), cv2.IMREAD_GRAYSCALE)
+            if gray is None:
+                raise OSError(f'No se pudo leer la imagen {origen}')
+        lectura = time.perf_counter() - inicio
+        rostros = np.asarray(
+            detect_faces(gray, scaleFactor, minNeighbors, minSize, cascada), np.int32).reshape(-1, 4)
+        deteccion = time.perf_counter() - inicio - lectura
+        alto, ancho = gray.shape[:2]
+        self.guardar(clave, rostros, (ancho, alto), lectura + deteccion)
+        self.fallos += 1
+        return rostros, False, {
+            'ancho': ancho, 'alto': alto,
+            'lectura_ms': round(lectura * 1000, 2), 'deteccion_ms': round(deteccion * 1000, 2),
+            'ahorrado_ms': 0.0,
+        }
+
+    def tasa_aciertos(self):
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+    def resumen(self):
+        return (f'aciertos {self.aciertos}/{self.aciertos + self.fallos} '
+                f'({self.tasa_aciertos():.0%}), {self.segundos_ahorrados:.2f} s ahorrados')
+
+    def entradas(self):
+        with self._lock:
+            return self._conexion.execute('SELECT COUNT(*) FROM detecciones').fetchone()[0]
+
+    def limpiar(self):
+        with self._lock, self._conexion:
+            self._conexion.execute('DELETE FROM detecciones')
+
+    def cerrar(self):
+        with self._lock:
+            self._conexion.close()
@@ -0,0 +1,237 @@
+"""Servicio de detección de rostros por lotes sobre un grupo de procesos.
+
+Cada proceso de trabajo carga el clasificador Haar una sola vez al
+iniciar y lo reutiliza para todas las imágenes que recibe; el grupo se
+mantiene abierto entre lotes. Los lotes pueden mezclar rutas y arreglos
+de NumPy, y cada resultado se entrega en cuanto está listo.
+
+Uso:
+    python -m procesamiento.deteccion ENTRADA [-s resultados.jsonl] -j 8
+
+ENTRADA es un directorio o un archivo de texto con una ruta por línea
+(``-`` lee las rutas de la entrada estándar). Cada línea de salida es un
+objeto JSON con la imagen, los rostros [x, y, ancho, alto] y el tiempo
+de detección; el avance y las imágenes por segundo van a stderr.
+
+Con ``--cache RUTA`` las detecciones se guardan en una ``CacheRostros``
+(SQLite) y las imágenes ya vistas con los mismos parámetros no se vuelven
+a procesar. Cada línea conserva los mismos campos y agrega ``cache`` (si
+fue un acierto) y ``ahorrado_ms``.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+import cv2
+import numpy as np
+
+from procesamiento.cache_rostros import CacheRostros
+from procesamiento.lote import INTERVALO_AVANCE, listar_imagenes
+from procesamiento.rostros import CASCADA_ROSTROS, detect_faces, load_cascade
+
+# Parámetros de detección y caché del proceso de trabajo
+_parametros = None
+_cache = None
+
+
+def _iniciar_trabajador(parametros, ruta_cache=None):
+    global _parametros, _cache
+    # Un hilo de OpenCV por proceso: el paralelismo lo pone el pool
+    cv2.setNumThreads(1)
+    load_cascade(parametros['cascada'])
+    _parametros = parametros
+    if ruta_cache is not None:
+        _cache = CacheRostros(ruta_cache)
+
+
+def _a_grises(imagen):
+    if imagen.ndim == 3:
+        return cv2.cvtColor(imagen, cv2.COLOR_BGR2GRAY)
+    return imagen
+
+
+def _detectar_con_cache(identificador, origen):
+    rostros, acierto, datos = _cache.detectar(origen, **_parametros)
+    resultado = {'imagen': identificador, 'rostros': rostros.tolist()}
+    ahorrado_ms = datos.pop('ahorrado_ms')
+    resultado.update(datos, cache=acierto, ahorrado_ms=ahorrado_ms)
+    return resultado
+
+
+def detectar_imagen(tarea):
+    """Detecta rostros en una ruta o arreglo y devuelve un diccionario JSON."""
+    identificador, origen = tarea
+    if _cache is not None:
+        try:
+            return _detectar_con_cache(identificador, origen)
+        except Exception as e:
+            return {'imagen': identificador, 'error': str(e)}
+    resultado = {'imagen': identificador}
+    try:
+        inicio = time.perf_counter()
+        if isinstance(origen, np.ndarray):
+            gray = _a_grises(origen)
+        else:
+            gray = cv2.imread(os.fspath(origen), cv2.IMREAD_GRAYSCALE)
+            if gray is None:
+                raise OSError('No se pudo leer la imagen')
+        lectura = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        rostros = detect_faces(gray, **_parametros)
+        deteccion = time.perf_counter() - inicio
+    except Exception as e:
+        resultado['error'] = str(e)
+        return resultado
+    resultado.update(
+        rostros=[[int(v) for v in rostro] for rostro in rostros],
+        ancho=gray.shape[1],
+        alto=gray.shape[0],
+        lectura_ms=round(lectura * 1000, 2),
+        deteccion_ms=round(deteccion * 1000, 2),
+    )
+    return resultado
+
+
+def _identificador(indice, origen):
+    if isinstance(origen, np.ndarray):
+        return indice
+    return os.fspath(origen)
+
+
+class ServicioRostros:
+    """Grupo de procesos con el clasificador ya cargado.
+
+    Se usa como contexto::
+
+        with ServicioRostros(4, minSize=(30, 30)) as servicio:
+            for resultado in servicio.detectar(rutas):
+                ...
+    """
+
+    def __init__(self, trabajadores=None, scaleFactor=1.1, minNeighbors=5,
+                 minSize=None, cascada=CASCADA_ROSTROS, cache=None):
+        self.parametros = {
+            'scaleFactor': scaleFactor,
+            'minNeighbors': minNeighbors,
+            'minSize': tuple(minSize) if minSize else None,
+            'cascada': cascada,
+        }
+        # Un clasificador inválido haría morir a cada trabajador al iniciar y
+        # el pool los relanzaría sin fin: se valida aquí antes de crearlo
+        load_cascade(cascada)
+        self._pool = Pool(trabajadores, initializer=_iniciar_trabajador,
+                          initargs=(self.parametros, cache))
+        self.imagenes = 0
+        self._segundos = 0.0
+        self._inicio_lote = None
+
+    def detectar(self, elementos, ordenado=False, chunksize=8):
+        """Genera un resultado por elemento (ruta o arreglo) a medida que terminan.
+
+        Las rutas se identifican por sí mismas y los arreglos por su
+        posición en ``elementos``. Con ``ordenado=True`` los resultados
+        salen en el orden de entrada.
+        """
+        tareas = ((_identificador(indice, origen), origen)
+                  for indice, origen in enumerate(elementos))
+        mapa = self._pool.imap if ordenado else self._pool.imap_unordered
+        self._inicio_lote = time.perf_counter()
+        try:
+            for resultado in mapa(detectar_imagen, tareas, chunksize=chunksize):
+                self.imagenes += 1
+                yield resultado
+        finally:
+            self._segundos += time.perf_counter() - self._inicio_lote
+            self._inicio_lote = None
+
+    @property
+    def segundos(self):
+        """Tiempo total dentro de ``detectar``, incluido el lote en curso."""
+        if self._inicio_lote is None:
+            return self._segundos
+        return self._segundos + time.perf_counter() - self._inicio_lote
+
+    def imagenes_por_segundo(self):
+        segundos = self.segundos
+        return self.imagenes / segundos if segundos else 0.0
+
+    def cerrar(self):
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if exc[0] is None:
+            self.cerrar()
+        else:
+            self._pool.terminate()
+
+
+def leer_rutas(entrada):
+    """Rutas de un directorio, de un archivo con una ruta por línea o de stdin."""
+    if os.path.isdir(entrada):
+        return (os.path.join(entrada, relativa) for relativa in listar_imagenes(entrada))
+    if entrada == '-':
+        return (linea.strip() for linea in sys.stdin if linea.strip())
+    with open(entrada, encoding='utf-8') as archivo:
+        return [linea.strip() for linea in archivo if linea.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Detecta rostros en muchas imágenes y escribe JSON por línea.')
+    parser.add_argument('entrada', help='Directorio, archivo con rutas o - para stdin')
+    parser.add_argument('-s', '--salida', default=None,
+                        help='Archivo JSON lines de salida (por defecto, stdout)')
+    parser.add_argument('-j', '--trabajadores', type=int, default=os.cpu_count(),
+                        help='Número de procesos (por defecto, todos los núcleos)')
+    parser.add_argument('--scale-factor', type=float, default=1.1)
+    parser.add_argument('--min-neighbors', type=int, default=5)
+    parser.add_argument('--min-size', type=int, default=30,
+                        help='Lado mínimo del rostro en píxeles (0 para no limitar)')
+    parser.add_argument('--cascada', default=CASCADA_ROSTROS,
+                        help='Archivo del clasificador dentro de cv2.data.haarcascades')
+    parser.add_argument('--cache', default=None, metavar='RUTA',
+                        help='Base SQLite donde se guardan y reutilizan las detecciones')
+    args = parser.parse_args(argv)
+
+    minimo = (args.min_size, args.min_size) if args.min_size else None
+    try:
+        servicio = ServicioRostros(args.trabajadores, args.scale_factor, args.min_neighbors,
+                                   minimo, args.cascada, args.cache)
+    except OSError as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
+    salida = open(args.salida, 'w', encoding='utf-8') if args.salida else sys.stdout
+    errores = aciertos = 0
+    ahorrado_ms = 0.0
+    try:
+        with servicio:
+            for resultado in servicio.detectar(leer_rutas(args.entrada)):
+                errores += 'error' in resultado
+                aciertos += resultado.get('cache', False)
+                ahorrado_ms += resultado.get('ahorrado_ms', 0.0)
+                salida.write(json.dumps(resultado, ensure_ascii=False) + '\n')
+                salida.flush()
+                if servicio.imagenes % INTERVALO_AVANCE == 0:
+                    print(f'{servicio.imagenes} imágenes, '
+                          f'{servicio.imagenes_por_segundo():.1f} img/s', file=sys.stderr)
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    print(f'Imágenes: {servicio.imagenes}  Errores: {errores}  '
+          f'{servicio.imagenes_por_segundo():.1f} img/s', file=sys.stderr)
+    if args.cache:
+        tasa = aciertos / servicio.imagenes if servicio.imagenes else 0.0
+        print(f'Caché: {aciertos} aciertos ({tasa:.0%}), '
+              f'{ahorrado_ms / 1000:.1f} s ahorrados', file=sys.stderr)
+    return 1 if errores else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
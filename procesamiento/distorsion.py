@@ -0,0 +1,131 @@
+"""Corrección de distorsión de lente de Distorcion.py.
+
+``cv2.undistort`` recalcula el mapa de corrección en cada llamada. Como
+las lentes son fijas, el mapa se calcula una vez por combinación de
+resolución, matriz de cámara y coeficientes de distorsión, se guarda en
+punto fijo (CV_16SC2 + CV_16UC1, la mitad de memoria que dos mapas
+float32) y se aplica con ``cv2.remap`` a cada cuadro.
+
+Uso por lotes:
+    python -m procesamiento.distorsion video_entrada.mp4 video_salida.mp4
+"""
+import argparse
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+DIST_COEFFS = np.array([-0.3, 0.1, 0, 0, 0])
+
+# Mapas que se conservan antes de descartar el usado hace más tiempo
+MAPAS_EN_CACHE = 8
+
+
+def camera_matrix(width, height):
+    """Matriz de cámara con distancia focal igual al ancho y centro óptico al medio."""
+    focal_length = width
+    center = (width / 2, height / 2)
+    return np.array([[focal_length, 0, center[0]],
+                     [0, focal_length, center[1]],
+                     [0, 0, 1]])
+
+
+class CacheCorreccion:
+    """Mapas de ``initUndistortRectifyMap`` con descarte LRU."""
+
+    def __init__(self, maxsize=MAPAS_EN_CACHE):
+        self.maxsize = maxsize
+        self._mapas = OrderedDict()
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def mapas(self, width, height, matriz, dist_coeffs):
+        matriz = np.asarray(matriz, np.float64)
+        dist_coeffs = np.asarray(dist_coeffs, np.float64)
+        clave = (width, height, matriz.tobytes(), dist_coeffs.tobytes())
+        with self._lock:
+            if clave in self._mapas:
+                self._mapas.move_to_end(clave)
+                self.aciertos += 1
+                return self._mapas[clave]
+        # Se calcula fuera del lock; si dos hilos coinciden, ambos dan lo mismo
+        mapas = cv2.initUndistortRectifyMap(
+            matriz, dist_coeffs, None, matriz, (width, height), cv2.CV_16SC2)
+        with self._lock:
+            self.fallos += 1
+            self._mapas[clave] = mapas
+            while len(self._mapas) > self.maxsize:
+                self._mapas.popitem(last=False)
+        return mapas
+
+    def undistort(self, image, dist_coeffs=DIST_COEFFS, matriz=None, dst=None):
+        h, w = image.shape[:2]
+        if matriz is None:
+            matriz = camera_matrix(w, h)
+        mapa1, mapa2 = self.mapas(w, h, matriz, dist_coeffs)
+        return cv2.remap(image, mapa1, mapa2, cv2.INTER_LINEAR, dst=dst)
+
+    def clear(self):
+        with self._lock:
+            self._mapas.clear()
+
+
+_cache = CacheCorreccion()
+
+
+def undistort(image, dist_coeffs=DIST_COEFFS, matriz=None):
+    """Corrige la distorsión usando el mapa en caché para esa resolución."""
+    return _cache.undistort(image, dist_coeffs, matriz)
+
+
+def undistort_frames(cuadros, dist_coeffs=DIST_COEFFS, matriz=None, cache=_cache):
+    """Corrige una secuencia de cuadros; genera los cuadros corregidos."""
+    for cuadro in cuadros:
+        yield cache.undistort(cuadro, dist_coeffs, matriz)
+
+
+def undistort_video(entrada, salida, dist_coeffs=DIST_COEFFS, matriz=None):
+    """Corrige un archivo de video completo; devuelve (cuadros, FPS)."""
+    captura = cv2.VideoCapture(entrada)
+    if not captura.isOpened():
+        raise OSError(f'No se pudo abrir el video {entrada}')
+    fps = captura.get(cv2.CAP_PROP_FPS) or 30
+    width = int(captura.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(captura.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    escritor = cv2.VideoWriter(salida, cv2.VideoWriter_fourcc(*'mp4v'), fps, (width, height))
+
+    def leer():
+        while True:
+            ok, cuadro = captura.read()
+            if not ok:
+                return
+            yield cuadro
+
+    cuadros = 0
+    inicio = time.perf_counter()
+    try:
+        for corregido in undistort_frames(leer(), dist_coeffs, matriz):
+            escritor.write(corregido)
+            cuadros += 1
+    finally:
+        captura.release()
+        escritor.release()
+    transcurrido = time.perf_counter() - inicio
+    return cuadros, cuadros / transcurrido if transcurrido else 0.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Corrige la distorsión de un video.')
+    parser.add_argument('entrada')
+    parser.add_argument('salida')
+    args = parser.parse_args(argv)
+    cuadros, fps = undistort_video(args.entrada, args.salida)
+    print(f'{cuadros} cuadros corregidos a {fps:.1f} FPS')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
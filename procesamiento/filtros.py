@@ -0,0 +1,118 @@
+"""Filtros de fFiltros, filtros2, canny, SUavizado, proyectofinal y BlackandWhite."""
+import cv2
+import numpy as np
+
+from procesamiento.convolucion import filtrar
+
+
+# Filtros de fFiltros.py
+def filtro_promedio(imagen):
+    return cv2.blur(imagen, (5, 5))
+
+
+def filtro_mediano(imagen):
+    return cv2.medianBlur(imagen, 5)
+
+
+def filtro_laplaciano(imagen):
+    laplaciano = cv2.Laplacian(imagen, cv2.CV_64F)
+    return cv2.convertScaleAbs(laplaciano)
+
+
+def filtro_gradiente(imagen):
+    grad_x = cv2.Sobel(imagen, cv2.CV_64F, 1, 0, ksize=5)
+    grad_y = cv2.Sobel(imagen, cv2.CV_64F, 0, 1, ksize=5)
+    grad_x = cv2.convertScaleAbs(grad_x)
+    grad_y = cv2.convertScaleAbs(grad_y)
+    return cv2.addWeighted(grad_x, 0.5, grad_y, 0.5, 0)
+
+
+# Filtros de filtros2.py
+def high_pass(image):
+    kernel = np.array([[-1, -1, -1], [-1, 8, -1], [-1, -1, -1]])
+    return cv2.filter2D(image, -1, kernel)
+
+
+def low_pass(image):
+    kernel = np.ones((5, 5), np.float32) / 25
+    return filtrar(image, kernel)
+
+
+def band_pass(image):
+    low = cv2.GaussianBlur(image, (17, 17), 0)
+    return cv2.subtract(image, low)
+
+
+def band_stop(image):
+    low = cv2.GaussianBlur(image, (17, 17), 0)
+    high = cv2.subtract(image, low)
+    return cv2.add(image, high)
+
+
+# canny.py y BlackandWhite.py
+def grayscale(image):
+    if image.ndim == 2:
+        return image
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+
+def canny(image, threshold1=100, threshold2=200):
+    return cv2.Canny(grayscale(image), threshold1, threshold2)
+
+
+# SUavizado.py
+def suavizado(image, valor):
+    kernel = np.ones((3, 3), np.float32) / valor
+    return filtrar(image, kernel)
+
+
+def bordes_sobel(image):
+    kernel = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]], np.float32)
+    return cv2.filter2D(image, -1, kernel)
+
+
+# Filtros del video en proyectofinal.py (cuadros RGB)
+def gaussian_blur(frame):
+    return cv2.GaussianBlur(frame, (15, 15), 0)
+
+
+def sobel_magnitude(frame):
+    gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+    sobelx = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
+    sobely = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
+    sobel = cv2.magnitude(sobelx, sobely)
+    return cv2.cvtColor(np.uint8(sobel), cv2.COLOR_GRAY2RGB)
+
+
+def laplacian(frame):
+    gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+    laplacian = cv2.Laplacian(gray, cv2.CV_64F)
+    return cv2.cvtColor(np.uint8(np.absolute(laplacian)), cv2.COLOR_GRAY2RGB)
+
+
+FILTROS_VIDEO = {
+    'gaussian_blur': gaussian_blur,
+    'sobel': sobel_magnitude,
+    'laplacian': laplacian,
+}
+
+
+def apply_video_filter(frame, nombre):
+    if nombre is None:
+        return frame
+    return FILTROS_VIDEO[nombre](frame)
+
+
+# Nombre de cada operación en la línea de comandos
+OPERACIONES = {
+    'promedio': filtro_promedio,
+    'mediano': filtro_mediano,
+    'laplaciano': filtro_laplaciano,
+    'gradiente': filtro_gradiente,
+    'pasa_altas': high_pass,
+    'pasa_bajas': low_pass,
+    'pasa_banda': band_pass,
+    'rechaza_banda': band_stop,
+    'canny': canny,
+    'grises': grayscale,
+}
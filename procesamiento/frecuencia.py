@@ -0,0 +1,143 @@
+"""Filtros pasa bajas, pasa altas, pasa banda y rechaza banda en frecuencia.
+
+Las máscaras ideal, Butterworth y Gaussiana se definen con la misma
+escala ``sigma`` en píxeles que ``cv2.GaussianBlur``: la frecuencia de
+corte es 1 / (2 pi sigma) ciclos por píxel, de modo que la máscara
+Gaussiana equivale exactamente a un desenfoque Gaussiano de ese sigma.
+Pasa banda es la diferencia de dos pasa bajas (``sigma`` fino y
+``sigma2`` grueso) y rechaza banda su complemento.
+
+La imagen se rellena reflejando los bordes (como hace OpenCV) hasta un
+tamaño rápido para la FFT; ese tamaño y las máscaras se guardan por
+forma de imagen. Con ``metodo='auto'`` los filtros Gaussianos con
+kernel pequeño se hacen en el dominio espacial, que ahí es más rápido.
+"""
+import math
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+TIPOS = ('bajas', 'altas', 'banda', 'rechaza_banda')
+FORMAS = ('ideal', 'butterworth', 'gaussiano')
+
+# Lado del kernel Gaussiano a partir del cual conviene la FFT
+# (medido con benchmarks/bench_frecuencia.py)
+KSIZE_FFT = 121
+
+
+def ksize_gaussiano(sigma):
+    """Lado del kernel que usa cv2.GaussianBlur para imágenes float32."""
+    return int(round(sigma * 4 * 2 + 1)) | 1
+
+
+@lru_cache(maxsize=64)
+def tamano_fft(alto, ancho, relleno):
+    """Alto y ancho rellenados hasta un tamaño eficiente para la FFT."""
+    return (cv2.getOptimalDFTSize(alto + 2 * relleno),
+            cv2.getOptimalDFTSize(ancho + 2 * relleno))
+
+
+def _validar_sigma(sigma, sigma2=None):
+    if not sigma > 0:
+        raise ValueError('sigma debe ser positivo')
+    if sigma2 is not None and not sigma2 > 0:
+        raise ValueError('sigma2 debe ser positivo')
+
+
+def _pasa_bajas(frecuencia, sigma, forma, orden):
+    corte = 1 / (2 * math.pi * sigma)
+    if forma == 'ideal':
+        return (frecuencia <= corte).astype(np.float32)
+    if forma == 'butterworth':
+        return 1 / (1 + (frecuencia / corte) ** (2 * orden))
+    return np.exp(-0.5 * (frecuencia / corte) ** 2)
+
+
+@lru_cache(maxsize=8)
+def mascara(alto, ancho, tipo, sigma, sigma2=None, forma='gaussiano', orden=2):
+    """Máscara real de forma (alto, ancho // 2 + 1, 1) para ``np.fft.rfft2``.
+
+    Se devuelve de solo lectura porque se comparte entre llamadas.
+    """
+    if tipo not in TIPOS:
+        raise ValueError(f'Tipo de filtro desconocido: {tipo}')
+    if forma not in FORMAS:
+        raise ValueError(f'Forma de máscara desconocida: {forma}')
+    _validar_sigma(sigma, sigma2)
+    fy = np.fft.fftfreq(alto).astype(np.float32)[:, None]
+    fx = np.fft.rfftfreq(ancho).astype(np.float32)[None, :]
+    frecuencia = np.sqrt(fy * fy + fx * fx)
+
+    if tipo in ('bajas', 'altas'):
+        valores = _pasa_bajas(frecuencia, sigma, forma, orden)
+    else:
+        if sigma2 is None or sigma2 <= sigma:
+            raise ValueError('Pasa banda y rechaza banda requieren sigma2 > sigma')
+        valores = (_pasa_bajas(frecuencia, sigma, forma, orden)
+                   - _pasa_bajas(frecuencia, sigma2, forma, orden))
+    if tipo in ('altas', 'rechaza_banda'):
+        valores = 1 - valores
+    valores = np.ascontiguousarray(valores, np.float32)[:, :, None]
+    valores.setflags(write=False)
+    return valores
+
+
+def _a_tipo(resultado, dtype):
+    if np.issubdtype(dtype, np.integer):
+        # Los negativos de pasa altas se saturan a 0, igual que cv2.subtract
+        limites = np.iinfo(dtype)
+        resultado = np.clip(np.rint(resultado), limites.min, limites.max)
+    return resultado.astype(dtype)
+
+
+def filtrar_fft(image, tipo, sigma, sigma2=None, forma='gaussiano', orden=2):
+    _validar_sigma(sigma, sigma2)
+    alto, ancho = image.shape[:2]
+    relleno = int(math.ceil(4 * max(sigma, sigma2 or 0)))
+    alto_fft, ancho_fft = tamano_fft(alto, ancho, relleno)
+    extendida = cv2.copyMakeBorder(
+        image.astype(np.float32, copy=False), relleno, alto_fft - alto - relleno,
+        relleno, ancho_fft - ancho - relleno, cv2.BORDER_REFLECT_101)
+    if extendida.ndim == 2:
+        extendida = extendida[:, :, None]
+    espectro = np.fft.rfft2(extendida, axes=(0, 1))
+    espectro *= mascara(alto_fft, ancho_fft, tipo, sigma, sigma2, forma, orden)
+    resultado = np.fft.irfft2(espectro, s=(alto_fft, ancho_fft), axes=(0, 1))
+    resultado = resultado[relleno:relleno + alto, relleno:relleno + ancho]
+    return _a_tipo(resultado.reshape(image.shape), image.dtype)
+
+
+def filtrar_espacial(image, tipo, sigma, sigma2=None):
+    """Los mismos filtros con máscara Gaussiana, mediante cv2.GaussianBlur."""
+    if tipo not in TIPOS:
+        raise ValueError(f'Tipo de filtro desconocido: {tipo}')
+    _validar_sigma(sigma, sigma2)
+    imagen = image.astype(np.float32, copy=False)
+    resultado = cv2.GaussianBlur(imagen, (0, 0), sigma)
+    if tipo in ('banda', 'rechaza_banda'):
+        if sigma2 is None or sigma2 <= sigma:
+            raise ValueError('Pasa banda y rechaza banda requieren sigma2 > sigma')
+        resultado = resultado - cv2.GaussianBlur(imagen, (0, 0), sigma2)
+    if tipo in ('altas', 'rechaza_banda'):
+        resultado = imagen - resultado
+    return _a_tipo(resultado, image.dtype)
+
+
+def filtrar(image, tipo, sigma, sigma2=None, forma='gaussiano', orden=2, metodo='auto'):
+    """Filtra en el dominio espacial o en frecuencia según ``metodo``.
+
+    ``metodo`` es 'espacial', 'fft' o 'auto'. Las máscaras ideal y
+    Butterworth no tienen un kernel espacial compacto y siempre usan la FFT.
+    """
+    _validar_sigma(sigma, sigma2)
+    if metodo == 'auto':
+        ksize = ksize_gaussiano(max(sigma, sigma2 or 0))
+        metodo = 'espacial' if forma == 'gaussiano' and ksize < KSIZE_FFT else 'fft'
+    if metodo == 'espacial':
+        if forma != 'gaussiano':
+            raise ValueError(f'La máscara {forma} solo está disponible en frecuencia')
+        return filtrar_espacial(image, tipo, sigma, sigma2)
+    if metodo == 'fft':
+        return filtrar_fft(image, tipo, sigma, sigma2, forma, orden)
+    raise ValueError(f'Método desconocido: {metodo}')
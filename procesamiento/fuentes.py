@@ -0,0 +1,167 @@
+"""Fuentes de cuadros intercambiables para el detector en vivo.
+
+Todas exponen la misma interfaz que ``cv2.VideoCapture`` (``read``,
+``isOpened`` y ``release``), así que el pipeline no distingue entre una
+cámara y una repetición. Las fuentes grabadas o sintéticas tienen dos
+modos: lo más rápido posible (``tiempo_real=False``) para medir
+rendimiento, o a ritmo de ``fps`` (``tiempo_real=True``) para medir
+latencia como si fueran una cámara.
+"""
+import glob
+import os
+import time
+
+import cv2
+import numpy as np
+
+FPS_POR_DEFECTO = 30
+
+EXTENSIONES = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff')
+
+
+class Fuente:
+    """Base de las fuentes: las subclases implementan ``_leer``."""
+
+    def __init__(self, fps=FPS_POR_DEFECTO, tiempo_real=False):
+        self.fps = fps
+        self.tiempo_real = tiempo_real
+        self._siguiente = None
+
+    def _leer(self):
+        raise NotImplementedError
+
+    def read(self):
+        if self.tiempo_real:
+            self._esperar_turno()
+        return self._leer()
+
+    def _esperar_turno(self):
+        ahora = time.perf_counter()
+        if self._siguiente is None:
+            self._siguiente = ahora
+        elif self._siguiente > ahora:
+            time.sleep(self._siguiente - ahora)
+        else:
+            # Si el consumidor se atrasó no se acumulan cuadros pendientes
+            self._siguiente = ahora
+        self._siguiente += 1.0 / self.fps
+
+    def isOpened(self):
+        return True
+
+    def release(self):
+        pass
+
+
+class FuenteCamara(Fuente):
+    """Cámara web; la propia cámara marca el ritmo."""
+
+    def __init__(self, indice=0):
+        super().__init__(tiempo_real=False)
+        self._captura = cv2.VideoCapture(indice)
+        self.fps = self._captura.get(cv2.CAP_PROP_FPS) or FPS_POR_DEFECTO
+
+    def _leer(self):
+        return self._captura.read()
+
+    def isOpened(self):
+        return self._captura.isOpened()
+
+    def release(self):
+        self._captura.release()
+
+
+class FuenteArchivo(Fuente):
+    """Archivo de video; con ``repetir`` vuelve al inicio al terminar."""
+
+    def __init__(self, ruta, tiempo_real=False, repetir=False):
+        self._captura = cv2.VideoCapture(ruta)
+        if not self._captura.isOpened():
+            raise OSError(f'No se pudo abrir el video {ruta}')
+        fps = self._captura.get(cv2.CAP_PROP_FPS) or FPS_POR_DEFECTO
+        super().__init__(fps, tiempo_real)
+        self.repetir = repetir
+
+    def _leer(self):
+        ok, cuadro = self._captura.read()
+        if not ok and self.repetir:
+            self._captura.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, cuadro = self._captura.read()
+        return ok, cuadro
+
+    def isOpened(self):
+        return self._captura.isOpened()
+
+    def release(self):
+        self._captura.release()
+
+
+class FuenteSecuencia(Fuente):
+    """Imágenes de un directorio o patrón glob, en orden alfabético."""
+
+    def __init__(self, origen, fps=FPS_POR_DEFECTO, tiempo_real=False, repetir=False):
+        super().__init__(fps, tiempo_real)
+        if os.path.isdir(origen):
+            rutas = [os.path.join(origen, nombre) for nombre in os.listdir(origen)]
+        else:
+            rutas = glob.glob(origen)
+        self.rutas = sorted(r for r in rutas if r.lower().endswith(EXTENSIONES))
+        if not self.rutas:
+            raise OSError(f'No hay imágenes en {origen}')
+        self.repetir = repetir
+        self.indice = 0
+
+    def _leer(self):
+        if self.indice >= len(self.rutas):
+            if not self.repetir:
+                return False, None
+            self.indice = 0
+        cuadro = cv2.imread(self.rutas[self.indice])
+        self.indice += 1
+        return cuadro is not None, cuadro
+
+
+class FuenteSintetica(Fuente):
+    """Genera cuadros BGR deterministas: un fondo fijo con un círculo que se mueve."""
+
+    def __init__(self, ancho=640, alto=480, cuadros=None, semilla=0,
+                 fps=FPS_POR_DEFECTO, tiempo_real=False):
+        super().__init__(fps, tiempo_real)
+        self.ancho = ancho
+        self.alto = alto
+        self.cuadros = cuadros
+        self.indice = 0
+        rng = np.random.default_rng(semilla)
+        ruido = rng.integers(0, 64, (alto, ancho, 3), dtype=np.uint8)
+        gradiente = np.linspace(0, 191, ancho, dtype=np.uint8)[None, :, None]
+        self._fondo = cv2.add(ruido, np.broadcast_to(gradiente, ruido.shape).copy())
+
+    def _leer(self):
+        if self.cuadros is not None and self.indice >= self.cuadros:
+            return False, None
+        cuadro = self._fondo.copy()
+        radio = self.alto // 8
+        x = radio + (self.indice * 7) % (self.ancho - 2 * radio)
+        y = radio + (self.indice * 3) % (self.alto - 2 * radio)
+        cv2.circle(cuadro, (x, y), radio, (0, 0, 255), -1)
+        self.indice += 1
+        return True, cuadro
+
+
+def abrir_fuente(especificacion, tiempo_real=True, repetir=False):
+    """Crea la fuente que corresponde a una especificación de texto.
+
+    - ``"0"``, ``"1"``, ...: cámara con ese índice
+    - ``"sintetico"`` o ``"sintetico:300"``: generador con 300 cuadros
+    - un directorio o patrón glob: secuencia de imágenes
+    - cualquier otra ruta: archivo de video
+    """
+    if especificacion.isdigit():
+        return FuenteCamara(int(especificacion))
+    if especificacion.split(':')[0] == 'sintetico':
+        _, _, cuadros = especificacion.partition(':')
+        return FuenteSintetica(cuadros=int(cuadros) if cuadros else None,
+                               tiempo_real=tiempo_real)
+    if os.path.isdir(especificacion) or any(c in especificacion for c in '*?['):
+        return FuenteSecuencia(especificacion, tiempo_real=tiempo_real, repetir=repetir)
+    return FuenteArchivo(especificacion, tiempo_real=tiempo_real, repetir=repetir)
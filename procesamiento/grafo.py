@@ -0,0 +1,92 @@
+"""Bancos de filtros descritos como un grafo de operaciones.
+
+Cada nodo es una función de los resultados de sus dependencias; el nodo
+``'entrada'`` es la imagen original. Un nodo se calcula una sola vez
+aunque varios lo usen (el Gaussiano 17x17 es común a pasa banda y
+rechaza banda) y los nodos independientes corren en hilos distintos,
+ya que OpenCV libera el GIL.
+"""
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import cv2
+
+from procesamiento import filtros
+
+ENTRADA = 'entrada'
+
+
+class Grafo:
+    """Grafo acíclico de operaciones sobre una imagen."""
+
+    def __init__(self):
+        self._nodos = {}
+
+    def agregar(self, nombre, funcion, *dependencias):
+        if nombre == ENTRADA or nombre in self._nodos:
+            raise ValueError(f'El nodo {nombre} ya existe')
+        for dependencia in dependencias:
+            if dependencia != ENTRADA and dependencia not in self._nodos:
+                raise ValueError(f'El nodo {nombre} depende de {dependencia}, que no existe')
+        # Solo se puede depender de nodos ya agregados, así que no hay ciclos
+        self._nodos[nombre] = (funcion, dependencias)
+        return self
+
+    @property
+    def nodos(self):
+        return list(self._nodos)
+
+    def _necesarios(self, salidas):
+        pendientes, necesarios = list(salidas), set()
+        while pendientes:
+            nombre = pendientes.pop()
+            if nombre == ENTRADA or nombre in necesarios:
+                continue
+            if nombre not in self._nodos:
+                raise ValueError(f'El nodo {nombre} no existe')
+            necesarios.add(nombre)
+            pendientes.extend(self._nodos[nombre][1])
+        return necesarios
+
+    def ejecutar(self, imagen, salidas=None, hilos=4):
+        """Devuelve un diccionario nombre -> resultado de los nodos pedidos.
+
+        Con ``hilos=1`` los nodos se calculan en orden en el hilo actual.
+        """
+        salidas = list(self._nodos) if salidas is None else list(salidas)
+        necesarios = self._necesarios(salidas)
+        resultados = {ENTRADA: imagen}
+        orden = [nombre for nombre in self._nodos if nombre in necesarios]
+
+        if hilos <= 1:
+            for nombre in orden:
+                funcion, dependencias = self._nodos[nombre]
+                resultados[nombre] = funcion(*(resultados[d] for d in dependencias))
+            return {nombre: resultados[nombre] for nombre in salidas}
+
+        with ThreadPoolExecutor(max_workers=hilos) as ejecutor:
+            en_curso = {}
+            while orden or en_curso:
+                # Lanzar todos los nodos cuyas dependencias ya están listas
+                for nombre in [n for n in orden
+                               if all(d in resultados for d in self._nodos[n][1])]:
+                    funcion, dependencias = self._nodos[nombre]
+                    futuro = ejecutor.submit(funcion, *(resultados[d] for d in dependencias))
+                    en_curso[futuro] = nombre
+                    orden.remove(nombre)
+                terminados, _ = wait(en_curso, return_when=FIRST_COMPLETED)
+                for futuro in terminados:
+                    resultados[en_curso.pop(futuro)] = futuro.result()
+        return {nombre: resultados[nombre] for nombre in salidas}
+
+
+def banco_filtros2():
+    """Los cuatro filtros de filtros2.py, con el Gaussiano y el residuo compartidos.
+
+    Cada salida es idéntica a la función equivalente de ``filtros``.
+    """
+    return (Grafo()
+            .agregar('pasa_altas', filtros.high_pass, ENTRADA)
+            .agregar('pasa_bajas', filtros.low_pass, ENTRADA)
+            .agregar('gaussiano', lambda image: cv2.GaussianBlur(image, (17, 17), 0), ENTRADA)
+            .agregar('pasa_banda', cv2.subtract, ENTRADA, 'gaussiano')
+            .agregar('rechaza_banda', cv2.add, ENTRADA, 'pasa_banda'))
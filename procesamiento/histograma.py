@@ -0,0 +1,92 @@
+"""Histogramas en memoria: conteos con cv2.calcHist y dibujo directo a un arreglo.
+
+Los conteos son arreglos (canales, bins) de enteros, listos para
+exportarse o analizarse; ``histogramas`` los calcula para un lote de
+imágenes en un solo arreglo (imágenes, canales, bins). El dibujo se hace
+con NumPy sobre un lienzo BGR, sin matplotlib ni archivos intermedios.
+"""
+import csv
+
+import cv2
+import numpy as np
+
+# Colores BGR del dibujo: azul de matplotlib para un canal, B, G y R para tres
+COLOR_UNICO = (180, 119, 31)
+COLORES_BGR = ((255, 0, 0), (0, 160, 0), (0, 0, 255))
+
+
+def _rango(dtype):
+    if dtype == np.uint8:
+        return 256
+    if dtype == np.uint16:
+        return 65536
+    raise ValueError(f'Tipo de imagen no soportado para histogramas: {dtype}')
+
+
+def histograma(image, bins=256, mascara=None):
+    """Conteos por canal, de forma (canales, bins) y tipo int64.
+
+    Acepta imágenes de 8 o 16 bits, en grises o con varios canales.
+    """
+    rango = _rango(image.dtype)
+    canales = 1 if image.ndim == 2 else image.shape[2]
+    conteos = np.empty((canales, bins), np.int64)
+    for c in range(canales):
+        conteos[c] = cv2.calcHist([image], [c], mascara, [bins], [0, rango]).ravel()
+    return conteos
+
+
+def histograma_grises(image, bins=256):
+    """Conteos (1, bins) de la imagen en grises, como el histograma de transformaciones.py."""
+    if image.ndim == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    return histograma(image, bins)
+
+
+def histogramas(imagenes, bins=256, grises=False):
+    """Conteos de un lote, de forma (imágenes, canales, bins).
+
+    Todas las imágenes deben tener el mismo número de canales; con
+    ``grises=True`` se convierten antes a grises.
+    """
+    funcion = histograma_grises if grises else histograma
+    return np.stack([funcion(image, bins) for image in imagenes])
+
+
+def dibujar_histograma(conteos, ancho=640, alto=480, colores=None, fondo=255):
+    """Dibuja los conteos como barras sobre un lienzo BGR de ``alto`` x ``ancho``.
+
+    Con varios canales las barras se mezclan con transparencia.
+    """
+    conteos = np.atleast_2d(np.asarray(conteos, np.float64))
+    if colores is None:
+        colores = (COLOR_UNICO,) if len(conteos) == 1 else COLORES_BGR
+    lienzo = np.full((alto, ancho, 3), fondo, np.float32)
+    maximo = conteos.max() or 1
+    # Bin que cae en cada columna del lienzo
+    columnas = np.arange(ancho) * conteos.shape[1] // ancho
+    alturas = np.rint(conteos[:, columnas] / maximo * (alto - 1)).astype(np.int64)
+    filas = np.arange(alto)[:, None]
+    alfa = 1.0 if len(conteos) == 1 else 0.5
+    for altura, color in zip(alturas, colores):
+        barra = filas >= alto - altura
+        lienzo[barra] += alfa * (np.float32(color) - lienzo[barra])
+    return lienzo.astype(np.uint8)
+
+
+def guardar_conteos(ruta, conteos, nombres=None):
+    """Guarda los conteos en ``.npy`` o, con cualquier otra extensión, en CSV.
+
+    En CSV hay una fila por bin y una columna por canal.
+    """
+    conteos = np.atleast_2d(conteos)
+    if ruta.endswith('.npy'):
+        np.save(ruta, conteos)
+        return
+    if nombres is None:
+        nombres = [f'canal_{c}' for c in range(len(conteos))]
+    with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(['bin', *nombres])
+        for indice, fila in enumerate(conteos.T):
+            escritor.writerow([indice, *fila.tolist()])
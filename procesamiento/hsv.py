@@ -0,0 +1,116 @@
+"""Ajustes en el espacio HSV de HSV.py y proyectofinal.py.
+
+Los ajustes son funciones de cada valor 0-255 por canal, así que se
+resuelven con una tabla de 256 entradas por canal aplicada con
+``cv2.LUT`` en una sola pasada. ``AjusteHSV`` guarda los buffers de
+trabajo y de salida para no reservar memoria en cada llamada.
+"""
+import threading
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+from procesamiento.mascaras import MascaraBinaria
+
+# Rango de rojo usado por la segmentación de proyectofinal.py
+ROJO_BAJO = np.array([0, 100, 100])
+ROJO_ALTO = np.array([10, 255, 255])
+
+_NIVELES = np.arange(256)
+
+
+@lru_cache(maxsize=512)
+def _tabla_constante(valor):
+    return np.full(256, valor, np.uint8)
+
+
+@lru_cache(maxsize=512)
+def _tabla_escala(valor):
+    # Misma operación que np.clip(canal * (valor / 255.0), 0, 255) truncado a uint8
+    return np.clip(_NIVELES * (valor / 255.0), 0, 255).astype(np.uint8)
+
+
+@lru_cache(maxsize=512)
+def _tabla_suma(valor):
+    # Suma con saturación, como cv2.add
+    return np.clip(_NIVELES + valor, 0, 255).astype(np.uint8)
+
+
+class AjusteHSV:
+    """Aplica ajustes HSV reutilizando buffers del tamaño de la última imagen.
+
+    El arreglo devuelto se sobrescribe en la siguiente llamada; hay que
+    copiarlo si se quiere conservar. Una instancia no debe compartirse
+    entre hilos (ver ``ajuste_local``).
+    """
+
+    def __init__(self):
+        self._tabla = np.empty((1, 256, 3), np.uint8)
+        self._buffers = {}
+
+    def _buffer(self, nombre, forma):
+        buffer = self._buffers.get(nombre)
+        if buffer is None or buffer.shape != forma:
+            buffer = self._buffers[nombre] = np.empty(forma, np.uint8)
+        return buffer
+
+    def _cargar_tabla(self, h, s, v):
+        self._tabla[0, :, 0] = h
+        self._tabla[0, :, 1] = s
+        self._tabla[0, :, 2] = v
+        return self._tabla
+
+    def escalar(self, hsv_image, hue, saturation, value, out=None):
+        """Fija la tonalidad y escala saturación y brillo (0-255); devuelve BGR."""
+        tabla = self._cargar_tabla(_tabla_constante(int(np.clip(hue, 0, 179))),
+                                   _tabla_escala(saturation), _tabla_escala(value))
+        hsv = self._buffer('hsv', hsv_image.shape)
+        cv2.LUT(hsv_image, tabla, dst=hsv)
+        if out is None:
+            out = self._buffer('salida', hsv_image.shape)
+        return cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR, dst=out)
+
+    def tono_brillo(self, frame, hue, brightness, out=None):
+        """Fija la tonalidad y suma ``brightness`` al brillo de un cuadro RGB."""
+        tabla = self._cargar_tabla(_tabla_constante(hue), _tabla_escala(255),
+                                   _tabla_suma(brightness))
+        hsv = self._buffer('hsv', frame.shape)
+        cv2.cvtColor(frame, cv2.COLOR_RGB2HSV, dst=hsv)
+        cv2.LUT(hsv, tabla, dst=hsv)
+        if out is None:
+            out = self._buffer('salida', frame.shape)
+        return cv2.cvtColor(hsv, cv2.COLOR_HSV2RGB, dst=out)
+
+
+_local = threading.local()
+
+
+def ajuste_local():
+    """Instancia de ``AjusteHSV`` propia del hilo actual."""
+    ajuste = getattr(_local, 'ajuste', None)
+    if ajuste is None:
+        ajuste = _local.ajuste = AjusteHSV()
+    return ajuste
+
+
+def adjust_hsv(hsv_image, hue, saturation, value):
+    """Fija la tonalidad y escala saturación y brillo (0-255); devuelve BGR.
+
+    El resultado vive en un buffer del hilo que se reutiliza en la siguiente llamada.
+    """
+    return ajuste_local().escalar(hsv_image, hue, saturation, value)
+
+
+def set_hue_brightness(frame, hue, brightness):
+    """Fija la tonalidad y suma ``brightness`` al brillo de un cuadro RGB.
+
+    El resultado vive en un buffer del hilo que se reutiliza en la siguiente llamada.
+    """
+    return ajuste_local().tono_brillo(frame, hue, brightness)
+
+
+def color_mask(frame, lower=ROJO_BAJO, upper=ROJO_ALTO):
+    """Máscara empacada de los píxeles de un cuadro RGB dentro del rango HSV."""
+    hsv = cv2.cvtColor(frame, cv2.COLOR_RGB2HSV)
+    return MascaraBinaria.desde_arreglo(cv2.inRange(hsv, lower, upper))
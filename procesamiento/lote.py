@@ -0,0 +1,228 @@
+"""Aplica filtros a directorios completos de imágenes sin interfaz gráfica.
+
+Uso:
+    python -m procesamiento.lote ENTRADA SALIDA -o promedio -o canny -j 8
+
+Cada operación escribe en SALIDA/<operación>/ con la misma ruta relativa
+que la imagen de entrada. Las salidas se escriben primero con un nombre
+temporal y luego se renombran, así que una ejecución interrumpida se
+reanuda saltando las imágenes que ya tienen su salida completa.
+
+Con ``--cache DIR`` las imágenes decodificadas se guardan en un
+``AlmacenPixeles`` y las ejecuciones siguientes las leen mapeadas en
+memoria en lugar de volver a decodificarlas.
+"""
+import argparse
+import os
+import queue
+import sys
+import threading
+import time
+from collections import defaultdict
+from multiprocessing import Pool
+
+import cv2
+
+from procesamiento.almacen import LIMITE_POR_DEFECTO, AlmacenPixeles
+from procesamiento.filtros import OPERACIONES
+
+EXTENSIONES = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff')
+
+# Cada cuántas imágenes se imprime el avance
+INTERVALO_AVANCE = 500
+
+
+def listar_imagenes(entrada, extensiones=EXTENSIONES):
+    """Recorre ``entrada`` y genera las rutas relativas de las imágenes."""
+    for raiz, carpetas, archivos in os.walk(entrada):
+        carpetas.sort()
+        for nombre in sorted(archivos):
+            if nombre.lower().endswith(extensiones):
+                yield os.path.relpath(os.path.join(raiz, nombre), entrada)
+
+
+def ruta_salida(salida, operacion, relativa):
+    return os.path.join(salida, operacion, relativa)
+
+
+def escribir_atomico(ruta, imagen):
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    base, extension = os.path.splitext(ruta)
+    temporal = f'{base}.parcial{extension}'
+    if not cv2.imwrite(temporal, imagen):
+        raise OSError(f'No se pudo escribir {ruta}')
+    os.replace(temporal, ruta)
+
+
+class EscritorFondo:
+    """Escribe imágenes en un hilo aparte para no bloquear a quien las produce.
+
+    ``guardar`` solo encola; los errores de escritura se acumulan en
+    ``errores`` como (ruta, mensaje) y ``tomar_errores`` los entrega una vez.
+    """
+
+    def __init__(self, capacidad=8):
+        self._cola = queue.Queue(capacidad)
+        self._lock = threading.Lock()
+        self.errores = []
+        self._hilo = threading.Thread(target=self._escribir, daemon=True)
+        self._hilo.start()
+
+    def _escribir(self):
+        while True:
+            tarea = self._cola.get()
+            try:
+                if tarea is None:
+                    return
+                ruta, imagen = tarea
+                try:
+                    escribir_atomico(ruta, imagen)
+                except Exception as e:
+                    with self._lock:
+                        self.errores.append((ruta, str(e)))
+            finally:
+                self._cola.task_done()
+
+    def guardar(self, ruta, imagen):
+        self._cola.put((ruta, imagen))
+
+    def pendientes(self):
+        """Imágenes encoladas o en escritura."""
+        return self._cola.unfinished_tasks
+
+    def tomar_errores(self):
+        """Devuelve los errores acumulados y vacía la lista."""
+        with self._lock:
+            errores, self.errores = self.errores, []
+        return errores
+
+    def esperar(self):
+        """Bloquea hasta que se escriban todas las imágenes encoladas."""
+        self._cola.join()
+
+    def cerrar(self):
+        self._cola.put(None)
+        self._hilo.join()
+
+
+# Caché de píxeles del proceso de trabajo, si se pidió una
+_almacen = None
+
+
+def _iniciar_trabajador(directorio_cache=None, limite_cache=LIMITE_POR_DEFECTO):
+    global _almacen
+    # Un hilo de OpenCV por proceso: el paralelismo lo pone el pool
+    cv2.setNumThreads(1)
+    if directorio_cache is not None:
+        _almacen = AlmacenPixeles(directorio_cache, limite_cache)
+
+
+def leer_imagen(ruta):
+    if _almacen is not None:
+        return _almacen.imread(ruta)
+    return cv2.imread(ruta)
+
+
+def procesar_imagen(tarea):
+    """Lee una imagen, aplica las operaciones pendientes y las guarda.
+
+    Devuelve (ruta relativa, error o None, megapíxeles, tiempos por etapa).
+    """
+    entrada, salida, relativa, operaciones = tarea
+    tiempos = {}
+    pendientes = [op for op in operaciones
+                  if not os.path.exists(ruta_salida(salida, op, relativa))]
+    if not pendientes:
+        return relativa, None, 0.0, tiempos
+
+    try:
+        inicio = time.perf_counter()
+        imagen = leer_imagen(os.path.join(entrada, relativa))
+        if imagen is None:
+            raise OSError('No se pudo leer la imagen')
+        tiempos['lectura'] = time.perf_counter() - inicio
+        escritura = 0.0
+        for op in pendientes:
+            inicio = time.perf_counter()
+            resultado = OPERACIONES[op](imagen)
+            tiempos[op] = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            escribir_atomico(ruta_salida(salida, op, relativa), resultado)
+            escritura += time.perf_counter() - inicio
+        tiempos['escritura'] = escritura
+    except Exception as e:
+        return relativa, str(e), 0.0, tiempos
+    return relativa, None, imagen.shape[0] * imagen.shape[1] / 1e6, tiempos
+
+
+def ejecutar(entrada, salida, operaciones, trabajadores=None, salida_log=sys.stdout,
+             directorio_cache=None, limite_cache=LIMITE_POR_DEFECTO):
+    """Procesa el directorio y devuelve el número de imágenes con error."""
+    desconocidas = [op for op in operaciones if op not in OPERACIONES]
+    if desconocidas:
+        raise ValueError(f'Operaciones desconocidas: {", ".join(desconocidas)}')
+
+    tareas = ((entrada, salida, relativa, operaciones)
+              for relativa in listar_imagenes(entrada))
+    tiempo_etapa = defaultdict(float)
+    imagenes_etapa = defaultdict(int)
+    procesadas = saltadas = errores = 0
+    megapixeles = 0.0
+
+    inicio = time.perf_counter()
+    with Pool(trabajadores, initializer=_iniciar_trabajador,
+              initargs=(directorio_cache, limite_cache)) as pool:
+        for relativa, error, mpx, tiempos in pool.imap_unordered(
+                procesar_imagen, tareas, chunksize=16):
+            if error is not None:
+                errores += 1
+                print(f'Error en {relativa}: {error}', file=sys.stderr)
+            elif not tiempos:
+                saltadas += 1
+            else:
+                procesadas += 1
+                megapixeles += mpx
+            for etapa, segundos in tiempos.items():
+                tiempo_etapa[etapa] += segundos
+                imagenes_etapa[etapa] += 1
+            total = procesadas + saltadas + errores
+            if total % INTERVALO_AVANCE == 0:
+                transcurrido = time.perf_counter() - inicio
+                print(f'{total} imágenes, {procesadas / transcurrido:.1f} img/s',
+                      file=salida_log)
+    transcurrido = time.perf_counter() - inicio
+
+    print(f'Procesadas: {procesadas}  Saltadas: {saltadas}  Errores: {errores}',
+          file=salida_log)
+    print(f'Total: {transcurrido:.1f} s, {procesadas / transcurrido:.1f} img/s, '
+          f'{megapixeles / transcurrido:.1f} MP/s', file=salida_log)
+    # img/s por etapa medidos en un solo núcleo
+    for etapa, segundos in tiempo_etapa.items():
+        velocidad = imagenes_etapa[etapa] / segundos if segundos else float('inf')
+        print(f'  {etapa:>14}: {segundos:8.2f} s acumulados, {velocidad:8.1f} img/s por núcleo',
+              file=salida_log)
+    return errores
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Aplica filtros a todas las imágenes de un directorio.')
+    parser.add_argument('entrada', help='Directorio con las imágenes de entrada')
+    parser.add_argument('salida', help='Directorio donde se guardan los resultados')
+    parser.add_argument('-o', '--operacion', action='append', required=True,
+                        choices=sorted(OPERACIONES), dest='operaciones',
+                        help='Operación a aplicar (se puede repetir)')
+    parser.add_argument('-j', '--trabajadores', type=int, default=os.cpu_count(),
+                        help='Número de procesos (por defecto, todos los núcleos)')
+    parser.add_argument('--cache', default=None, metavar='DIR',
+                        help='Directorio para guardar los píxeles decodificados')
+    parser.add_argument('--cache-mb', type=int, default=LIMITE_POR_DEFECTO // 2**20,
+                        help='Tamaño máximo de la caché en MB')
+    args = parser.parse_args(argv)
+    errores = ejecutar(args.entrada, args.salida, args.operaciones, args.trabajadores,
+                       directorio_cache=args.cache, limite_cache=args.cache_mb * 2**20)
+    return 1 if errores else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
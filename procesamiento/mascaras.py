@@ -0,0 +1,147 @@
+"""Máscaras binarias empacadas: un bit por píxel en lugar de un byte.
+
+``MascaraBinaria`` guarda las filas con ``np.packbits`` (el bit más
+significativo es el primer píxel). AND, OR, XOR, NOT y el área se
+calculan sobre los bytes empacados, 8 píxeles por operación; solo
+``a_uint8`` desempaca, para mostrar o pasar la máscara a OpenCV. Los
+bits de relleno al final de cada fila se mantienen en 0.
+
+En disco se guarda como ``.npz`` (opcionalmente con RLE sobre los bytes
+empacados, útil para máscaras con grandes zonas vacías o llenas) o como
+PBM binario (P4), que cualquier visor abre.
+"""
+import os
+
+import numpy as np
+
+# Bits en 1 de cada valor de byte; NumPy 2 tiene np.bitwise_count, más rápido
+_POBLACION = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+_contar_bits = getattr(np, 'bitwise_count', _POBLACION.__getitem__)
+
+
+def _escribir_atomico(ruta, escribir):
+    os.makedirs(os.path.dirname(ruta) or '.', exist_ok=True)
+    temporal = ruta + '.parcial'
+    with open(temporal, 'wb') as archivo:
+        escribir(archivo)
+    os.replace(temporal, ruta)
+
+
+class MascaraBinaria:
+    __slots__ = ('datos', 'forma')
+
+    def __init__(self, datos, forma):
+        alto, ancho = forma
+        if datos.dtype != np.uint8 or datos.shape != (alto, (ancho + 7) // 8):
+            raise ValueError(f'Datos empacados con forma {datos.shape} no corresponden a {forma}')
+        self.datos = datos
+        self.forma = (alto, ancho)
+
+    @classmethod
+    def desde_arreglo(cls, arreglo):
+        """Empaca un arreglo 2D; cualquier valor distinto de 0 cuenta como 1."""
+        if arreglo.ndim != 2:
+            raise ValueError('La máscara debe ser un arreglo 2D')
+        return cls(np.packbits(arreglo != 0, axis=1), arreglo.shape)
+
+    @classmethod
+    def vacia(cls, forma):
+        alto, ancho = forma
+        return cls(np.zeros((alto, (ancho + 7) // 8), np.uint8), forma)
+
+    @property
+    def nbytes(self):
+        return self.datos.nbytes
+
+    def a_uint8(self, valor=255):
+        """Arreglo uint8 con 0 y ``valor``, para mostrar o usar con OpenCV."""
+        bits = np.unpackbits(self.datos, axis=1, count=self.forma[1])
+        return bits * np.uint8(valor) if valor != 1 else bits
+
+    def area(self):
+        """Número de píxeles en 1."""
+        return int(_contar_bits(self.datos).sum(dtype=np.int64))
+
+    def _compatible(self, otra):
+        if otra.forma != self.forma:
+            raise ValueError(f'Máscaras de formas distintas: {self.forma} y {otra.forma}')
+
+    def __and__(self, otra):
+        if not isinstance(otra, MascaraBinaria):
+            return NotImplemented
+        self._compatible(otra)
+        return MascaraBinaria(np.bitwise_and(self.datos, otra.datos), self.forma)
+
+    def __or__(self, otra):
+        if not isinstance(otra, MascaraBinaria):
+            return NotImplemented
+        self._compatible(otra)
+        return MascaraBinaria(np.bitwise_or(self.datos, otra.datos), self.forma)
+
+    def __xor__(self, otra):
+        if not isinstance(otra, MascaraBinaria):
+            return NotImplemented
+        self._compatible(otra)
+        return MascaraBinaria(np.bitwise_xor(self.datos, otra.datos), self.forma)
+
+    def __invert__(self):
+        datos = np.bitwise_not(self.datos)
+        sobrantes = -self.forma[1] % 8
+        if sobrantes:
+            # Los bits de relleno del último byte deben seguir en 0
+            datos[:, -1] &= np.uint8((0xFF << sobrantes) & 0xFF)
+        return MascaraBinaria(datos, self.forma)
+
+    def __eq__(self, otra):
+        if not isinstance(otra, MascaraBinaria):
+            return NotImplemented
+        return self.forma == otra.forma and np.array_equal(self.datos, otra.datos)
+
+    def __repr__(self):
+        return f'MascaraBinaria(forma={self.forma}, area={self.area()})'
+
+    def guardar(self, ruta, rle=False):
+        """Guarda en ``.npz``; con ``rle`` los bytes se guardan como corridas."""
+        if not rle:
+            campos = {'forma': np.array(self.forma), 'datos': self.datos}
+        else:
+            plano = self.datos.ravel()
+            inicios = np.flatnonzero(np.diff(plano)) + 1
+            inicios = np.concatenate(([0], inicios)) if plano.size else inicios
+            campos = {
+                'forma': np.array(self.forma),
+                'valores': plano[inicios],
+                'longitudes': np.diff(np.append(inicios, plano.size)).astype(np.uint32),
+            }
+        _escribir_atomico(ruta, lambda archivo: np.savez(archivo, **campos))
+
+    @classmethod
+    def cargar(cls, ruta):
+        with np.load(ruta) as campos:
+            alto, ancho = (int(v) for v in campos['forma'])
+            if 'datos' in campos:
+                datos = campos['datos']
+            else:
+                datos = np.repeat(campos['valores'], campos['longitudes'])
+        return cls(datos.reshape(alto, (ancho + 7) // 8), (alto, ancho))
+
+    def guardar_pbm(self, ruta):
+        alto, ancho = self.forma
+
+        def escribir(archivo):
+            archivo.write(f'P4\n{ancho} {alto}\n'.encode('ascii'))
+            archivo.write(self.datos.tobytes())
+
+        _escribir_atomico(ruta, escribir)
+
+    @classmethod
+    def leer_pbm(cls, ruta):
+        with open(ruta, 'rb') as archivo:
+            contenido = archivo.read()
+        campos = contenido.split(maxsplit=3)
+        if campos[0] != b'P4':
+            raise OSError(f'{ruta} no es un PBM binario')
+        ancho, alto = int(campos[1]), int(campos[2])
+        tamano = alto * ((ancho + 7) // 8)
+        datos = np.frombuffer(contenido[len(contenido) - tamano:], np.uint8)
+        return cls(datos.reshape(alto, -1).copy(), (alto, ancho))
@@ -0,0 +1,243 @@
+"""Operaciones morfológicas de images/tareita.py y cadenas de operaciones.
+
+Una cadena se describe como texto, por ejemplo ``"erosion:5,dilatacion:5,
+gradiente:3:elipse"`` (operación:tamaño:forma), y ``compilar`` la
+convierte en una función. Las erosiones y dilataciones seguidas con el
+mismo elemento se fusionan en una sola llamada a ``cv2.morphologyEx``
+(erosión + dilatación = apertura, dilatación + erosión = cierre,
+repeticiones = iteraciones). Los elementos estructurantes se guardan por
+tamaño y forma.
+
+Los elementos rectangulares ya los separa OpenCV en una pasada por filas
+y otra por columnas. Los discos grandes son caros (el costo crece con el
+área), así que se ofrece la forma 'octagono': un octágono de lado k es la
+composición exacta de (k - 1) / 2 elementos 3x3 alternando cruz y
+cuadrado, y se aplica como esa secuencia de pasadas pequeñas.
+
+Uso por lotes:
+    python -m procesamiento.morfologia ENTRADA SALIDA -c apertura:5,gradiente:3 -j 8
+"""
+import argparse
+import os
+import sys
+import time
+from functools import lru_cache
+from multiprocessing import Pool
+
+import cv2
+import numpy as np
+
+from procesamiento.lote import escribir_atomico, listar_imagenes
+
+FORMAS = {
+    'rect': cv2.MORPH_RECT,
+    'elipse': cv2.MORPH_ELLIPSE,
+    'cruz': cv2.MORPH_CROSS,
+    'octagono': None,
+}
+
+OPERACIONES = {
+    'erosion': cv2.MORPH_ERODE,
+    'dilatacion': cv2.MORPH_DILATE,
+    'apertura': cv2.MORPH_OPEN,
+    'cierre': cv2.MORPH_CLOSE,
+    'gradiente': cv2.MORPH_GRADIENT,
+    'top_hat': cv2.MORPH_TOPHAT,
+    'black_hat': cv2.MORPH_BLACKHAT,
+}
+
+TAMANO_POR_DEFECTO = 5
+
+
+def _pasos_octagono(tamano):
+    cruz = elemento(3, 'cruz')
+    cuadrado = elemento(3, 'rect')
+    return [cruz if i % 2 == 0 else cuadrado for i in range((tamano - 1) // 2)]
+
+
+@lru_cache(maxsize=64)
+def elemento(tamano=TAMANO_POR_DEFECTO, forma='rect'):
+    """Elemento estructurante cuadrado de lado ``tamano``; de solo lectura."""
+    if forma not in FORMAS:
+        raise ValueError(f'Forma desconocida: {forma}')
+    if tamano < 1:
+        raise ValueError('El tamaño del elemento debe ser positivo')
+    if forma == 'octagono':
+        if tamano % 2 == 0:
+            raise ValueError('El octágono necesita un tamaño impar')
+        # Dilatar un punto con los pasos da el octágono completo
+        kernel = np.zeros((tamano, tamano), np.uint8)
+        kernel[tamano // 2, tamano // 2] = 1
+        for paso in _pasos_octagono(tamano):
+            kernel = cv2.dilate(kernel, paso)
+    else:
+        kernel = cv2.getStructuringElement(FORMAS[forma], (tamano, tamano))
+    kernel.setflags(write=False)
+    return kernel
+
+
+def _octagono(image, operacion, tamano, iteraciones):
+    pasos = _pasos_octagono(tamano) * iteraciones
+
+    def erosionar(img):
+        for paso in pasos:
+            img = cv2.erode(img, paso)
+        return img
+
+    def dilatar(img):
+        for paso in pasos:
+            img = cv2.dilate(img, paso)
+        return img
+
+    if operacion == 'erosion':
+        return erosionar(image)
+    if operacion == 'dilatacion':
+        return dilatar(image)
+    if operacion == 'apertura':
+        return dilatar(erosionar(image))
+    if operacion == 'cierre':
+        return erosionar(dilatar(image))
+    if operacion == 'gradiente':
+        return cv2.subtract(dilatar(image), erosionar(image))
+    if operacion == 'top_hat':
+        return cv2.subtract(image, dilatar(erosionar(image)))
+    return cv2.subtract(erosionar(dilatar(image)), image)
+
+
+def interpretar(cadena):
+    """Convierte ``"apertura:5,gradiente:3:elipse"`` en [(operación, tamaño, forma)]."""
+    pasos = []
+    for parte in cadena.split(','):
+        campos = parte.strip().split(':')
+        operacion = campos[0]
+        if operacion not in OPERACIONES:
+            raise ValueError(f'Operación morfológica desconocida: {operacion}')
+        tamano = int(campos[1]) if len(campos) > 1 else TAMANO_POR_DEFECTO
+        forma = campos[2] if len(campos) > 2 else 'rect'
+        elemento(tamano, forma)
+        pasos.append((operacion, tamano, forma))
+    return pasos
+
+
+def fusionar(pasos):
+    """Agrupa los pasos en (operación, tamaño, forma, iteraciones) fusionados."""
+    agrupados = []
+    for operacion, tamano, forma in pasos:
+        previo = agrupados[-1] if agrupados else None
+        if (previo and operacion in ('erosion', 'dilatacion')
+                and previo[:3] == (operacion, tamano, forma)):
+            agrupados[-1] = previo[:3] + (previo[3] + 1,)
+        else:
+            agrupados.append((operacion, tamano, forma, 1))
+
+    fusionados = []
+    for paso in agrupados:
+        previo = fusionados[-1] if fusionados else None
+        if previo and previo[1:] == paso[1:]:
+            if (previo[0], paso[0]) == ('erosion', 'dilatacion'):
+                fusionados[-1] = ('apertura',) + paso[1:]
+                continue
+            if (previo[0], paso[0]) == ('dilatacion', 'erosion'):
+                fusionados[-1] = ('cierre',) + paso[1:]
+                continue
+        fusionados.append(paso)
+    return fusionados
+
+
+def aplicar(image, operacion, tamano=TAMANO_POR_DEFECTO, forma='rect', iteraciones=1):
+    if forma == 'octagono':
+        return _octagono(image, operacion, tamano, iteraciones)
+    return cv2.morphologyEx(image, OPERACIONES[operacion], elemento(tamano, forma),
+                            iterations=iteraciones)
+
+
+def compilar(cadena):
+    """Devuelve una función imagen -> imagen que aplica la cadena fusionada."""
+    pasos = fusionar(interpretar(cadena) if isinstance(cadena, str) else cadena)
+
+    def funcion(image):
+        for operacion, tamano, forma, iteraciones in pasos:
+            image = aplicar(image, operacion, tamano, forma, iteraciones)
+        return image
+
+    funcion.pasos = pasos
+    return funcion
+
+
+def erosion(image):
+    return aplicar(image, 'erosion')
+
+
+def dilation(image):
+    return aplicar(image, 'dilatacion')
+
+
+def clean_noise(image):
+    # Erosión y luego dilatación: una apertura
+    return aplicar(image, 'apertura')
+
+
+def edge_detection(image):
+    # Dilatación y luego erosión: un cierre
+    return aplicar(image, 'cierre')
+
+
+# Cadena compilada del proceso de trabajo en modo por lotes
+_funcion = None
+
+
+def _iniciar_trabajador(cadena):
+    global _funcion
+    # Un hilo de OpenCV por proceso: el paralelismo lo pone el pool
+    cv2.setNumThreads(1)
+    _funcion = compilar(cadena)
+
+
+def _procesar(tarea):
+    entrada, salida, flags = tarea
+    imagen = cv2.imread(entrada, flags)
+    if imagen is None:
+        return entrada, 'No se pudo leer la imagen'
+    try:
+        escribir_atomico(salida, _funcion(imagen))
+    except Exception as e:
+        return entrada, str(e)
+    return entrada, None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Aplica una cadena morfológica a todas las imágenes de un directorio.')
+    parser.add_argument('entrada', help='Directorio con las imágenes de entrada')
+    parser.add_argument('salida', help='Directorio donde se guardan los resultados')
+    parser.add_argument('-c', '--cadena', required=True,
+                        help='Operaciones separadas por comas, p. ej. apertura:5,gradiente:3:elipse')
+    parser.add_argument('-j', '--trabajadores', type=int, default=os.cpu_count(),
+                        help='Número de procesos (por defecto, todos los núcleos)')
+    parser.add_argument('--color', action='store_true',
+                        help='Procesar en color en lugar de escala de grises')
+    args = parser.parse_args(argv)
+    print('Pasos:', ', '.join(f'{op}:{t}:{f} x{i}' for op, t, f, i in compilar(args.cadena).pasos))
+
+    flags = cv2.IMREAD_COLOR if args.color else cv2.IMREAD_GRAYSCALE
+    tareas = ((os.path.join(args.entrada, relativa), os.path.join(args.salida, relativa), flags)
+              for relativa in listar_imagenes(args.entrada)
+              if not os.path.exists(os.path.join(args.salida, relativa)))
+    procesadas = errores = 0
+    inicio = time.perf_counter()
+    with Pool(args.trabajadores, initializer=_iniciar_trabajador,
+              initargs=(args.cadena,)) as pool:
+        for ruta, error in pool.imap_unordered(_procesar, tareas, chunksize=16):
+            if error is not None:
+                errores += 1
+                print(f'Error en {ruta}: {error}', file=sys.stderr)
+            else:
+                procesadas += 1
+    transcurrido = time.perf_counter() - inicio
+    print(f'Procesadas: {procesadas}  Errores: {errores}  '
+          f'{procesadas / transcurrido if transcurrido else 0:.1f} img/s')
+    return 1 if errores else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
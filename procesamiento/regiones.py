@@ -0,0 +1,122 @@
+"""Regiones conectadas de RegionsandPixelAnalizis.py.
+
+``connected_region`` inunda desde una semilla en cada llamada.
+``IndiceRegiones`` etiqueta la imagen completa una sola vez: los grises
+se cuantizan en niveles de ``2 * tolerancia + 1`` valores y cada nivel se
+etiqueta con ``cv2.connectedComponentsWithStats``. Se guarda el mapa de
+etiquetas y una tabla por región (nivel, área, caja, centroide e
+intensidad media), así que consultar la región de un píxel es un acceso
+al arreglo. A diferencia del floodFill, cuya tolerancia es relativa a los
+vecinos, los límites de las regiones son los de los niveles fijos: un
+degradado suave queda partido en franjas en lugar de formar una región.
+"""
+import csv
+
+import cv2
+import numpy as np
+
+from procesamiento.filtros import grayscale
+from procesamiento.mascaras import MascaraBinaria
+
+CAMPOS = np.dtype([
+    ('nivel', np.int32),
+    ('area', np.int64),
+    ('x', np.int32),
+    ('y', np.int32),
+    ('ancho', np.int32),
+    ('alto', np.int32),
+    ('cx', np.float64),
+    ('cy', np.float64),
+    ('media', np.float64),
+])
+
+
+def connected_region(image, semilla, tolerancia=10, connectivity=8):
+    """Inunda desde ``semilla`` (x, y) con la tolerancia dada y devuelve la imagen."""
+    _, resultado, _, _ = cv2.floodFill(
+        image.copy(), None, semilla, 255,
+        loDiff=tolerancia, upDiff=tolerancia, flags=connectivity)
+    return resultado
+
+
+class IndiceRegiones:
+    """Mapa de etiquetas y tabla de estadísticas de todas las regiones de una imagen.
+
+    Las etiquetas van de 0 a ``len(indice) - 1`` y cada píxel pertenece a
+    exactamente una región; la fila ``tabla[e]`` describe la región ``e``.
+    """
+
+    def __init__(self, image, tolerancia=10, connectivity=8):
+        if not 0 <= tolerancia <= 127:
+            raise ValueError(f'La tolerancia debe estar entre 0 y 127, no {tolerancia}')
+        gray = grayscale(image)
+        if gray.dtype != np.uint8:
+            raise ValueError(f'Tipo de imagen no soportado: {gray.dtype}; se esperaba uint8')
+        self.paso = 2 * tolerancia + 1
+        niveles = gray // np.uint8(self.paso)
+        etiquetas = np.zeros(gray.shape, np.int32)
+        tablas = []
+        total = 0
+        for nivel in np.flatnonzero(np.bincount(niveles.ravel(), minlength=256)):
+            binaria = (niveles == nivel).view(np.uint8)
+            n, locales, stats, centroides = cv2.connectedComponentsWithStats(
+                binaria, connectivity=connectivity, ltype=cv2.CV_32S)
+            # La etiqueta local 0 es el resto de la imagen (otros niveles)
+            np.add(locales, total - 1, out=etiquetas, where=binaria.view(bool))
+            tabla = np.empty(n - 1, CAMPOS)
+            tabla['nivel'] = nivel
+            tabla['x'], tabla['y'], tabla['ancho'], tabla['alto'], tabla['area'] = stats[1:].T
+            tabla['cx'], tabla['cy'] = centroides[1:].T
+            tablas.append(tabla)
+            total += n - 1
+        self.tabla = np.concatenate(tablas)
+        sumas = np.bincount(etiquetas.ravel(), weights=gray.ravel(), minlength=total)
+        self.tabla['media'] = sumas / self.tabla['area']
+        etiquetas.setflags(write=False)
+        self.tabla.setflags(write=False)
+        self.etiquetas = etiquetas
+
+    def __len__(self):
+        return len(self.tabla)
+
+    def etiqueta(self, x, y):
+        return int(self.etiquetas[y, x])
+
+    def estadisticas(self, etiqueta):
+        """Fila de la tabla como diccionario de valores de Python."""
+        fila = self.tabla[etiqueta]
+        return {campo: fila[campo].item() for campo in CAMPOS.names}
+
+    def caja(self, etiqueta):
+        fila = self.tabla[etiqueta]
+        return int(fila['x']), int(fila['y']), int(fila['ancho']), int(fila['alto'])
+
+    def recorte(self, etiqueta):
+        """Caja (x, y, ancho, alto) y máscara booleana de la región dentro de ella."""
+        x, y, ancho, alto = self.caja(etiqueta)
+        return (x, y, ancho, alto), self.etiquetas[y:y + alto, x:x + ancho] == etiqueta
+
+    def mascara(self, etiqueta):
+        """Región completa como ``MascaraBinaria``; solo se recorre su caja."""
+        (x, y, ancho, alto), dentro = self.recorte(etiqueta)
+        bits = np.zeros(self.etiquetas.shape, bool)
+        bits[y:y + alto, x:x + ancho] = dentro
+        return MascaraBinaria.desde_arreglo(bits)
+
+    def resaltar(self, image, etiqueta, valor=255):
+        """Copia de ``image`` con la región pintada de ``valor``, como ``connected_region``."""
+        resultado = image.copy()
+        (x, y, ancho, alto), dentro = self.recorte(etiqueta)
+        resultado[y:y + alto, x:x + ancho][dentro] = valor
+        return resultado
+
+    def exportar(self, ruta):
+        """Guarda la tabla en ``.npy`` o, con cualquier otra extensión, en CSV."""
+        if ruta.endswith('.npy'):
+            np.save(ruta, self.tabla)
+            return
+        with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(['etiqueta', *CAMPOS.names])
+            for etiqueta, fila in enumerate(self.tabla.tolist()):
+                escritor.writerow([etiqueta, *fila])
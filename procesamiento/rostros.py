@@ -0,0 +1,40 @@
+"""Detección de rostros con clasificadores Haar de personas.py y proyectofinal.py."""
+import threading
+
+import cv2
+
+CASCADA_ROSTROS = 'haarcascade_frontalface_default.xml'
+
+_local = threading.local()
+
+
+def load_cascade(nombre=CASCADA_ROSTROS):
+    """Carga el clasificador una sola vez por hilo.
+
+    ``detectMultiScale`` no garantiza ser seguro entre hilos, así que cada
+    hilo de procesamiento tiene su propia copia.
+    """
+    cascadas = getattr(_local, 'cascadas', None)
+    if cascadas is None:
+        cascadas = _local.cascadas = {}
+    if nombre not in cascadas:
+        cascade = cv2.CascadeClassifier(cv2.data.haarcascades + nombre)
+        if cascade.empty():
+            raise OSError(f'No se pudo cargar el clasificador {nombre}')
+        cascadas[nombre] = cascade
+    return cascadas[nombre]
+
+
+def detect_faces(gray, scaleFactor=1.1, minNeighbors=5, minSize=None,
+                 cascada=CASCADA_ROSTROS):
+    if minSize is None:
+        return load_cascade(cascada).detectMultiScale(
+            gray, scaleFactor=scaleFactor, minNeighbors=minNeighbors)
+    return load_cascade(cascada).detectMultiScale(
+        gray, scaleFactor=scaleFactor, minNeighbors=minNeighbors, minSize=minSize)
+
+
+def draw_faces(image, rostros, color=(255, 0, 0)):
+    for (x, y, w, h) in rostros:
+        cv2.rectangle(image, (x, y), (x + w, y + h), color, 2)
+    return image
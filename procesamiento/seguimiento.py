@@ -0,0 +1,127 @@
+"""Detección de rostros en tiempo real: imagen reducida, intervalo y seguimiento.
+
+``SeguidorRostros`` hace la detección completa sobre una copia reducida
+del cuadro (``escala``) solo cada ``intervalo`` cuadros. En los cuadros
+intermedios busca cada rostro conocido dentro de una región alrededor de
+su última posición (``margen`` veces su tamaño), con un rango de tamaños
+estrecho, lo que cuesta una fracción de la detección completa. Los
+rostros perdidos y los nuevos aparecen en la siguiente detección completa.
+
+Con el perfil 'preciso' (escala 1, intervalo 1) el resultado es el mismo
+que llamar a ``detect_faces`` en cada cuadro.
+"""
+import threading
+
+import cv2
+import numpy as np
+
+from procesamiento.rostros import CASCADA_ROSTROS, load_cascade
+
+PERFILES = {
+    'preciso': {'escala': 1.0, 'intervalo': 1, 'minSize': None},
+    'equilibrado': {'escala': 0.5, 'intervalo': 5, 'margen': 0.5},
+    'rapido': {'escala': 0.4, 'intervalo': 10, 'margen': 0.4, 'scaleFactor': 1.15},
+}
+
+# Rango de tamaños, relativo al último tamaño, en que se busca un rostro seguido
+CRECIMIENTO_MAXIMO = 1.4
+
+
+class SeguidorRostros:
+    """Detecta y sigue rostros cuadro a cuadro; seguro entre hilos.
+
+    ``minSize`` se da en píxeles del cuadro completo. Con ``escala`` < 1
+    los rostros menores que la ventana del clasificador dividida por la
+    escala (24 / 0.5 = 48 px con el clasificador por defecto) no se detectan.
+    """
+
+    def __init__(self, escala=0.5, intervalo=5, margen=0.5, scaleFactor=1.1,
+                 minNeighbors=5, minSize=(30, 30), cascada=CASCADA_ROSTROS):
+        if not 0 < escala <= 1:
+            raise ValueError('La escala debe estar entre 0 y 1')
+        if intervalo < 1:
+            raise ValueError('El intervalo debe ser al menos 1')
+        self.escala = escala
+        self.intervalo = intervalo
+        self.margen = margen
+        self.scaleFactor = scaleFactor
+        self.minNeighbors = minNeighbors
+        self.minSize = minSize
+        self.cascada = cascada
+        self._lock = threading.Lock()
+        self._rostros = np.empty((0, 4), np.int32)
+        self._cuadro = 0
+        self.detecciones_completas = 0
+        self.busquedas = 0
+
+    @classmethod
+    def perfil(cls, nombre, **opciones):
+        return cls(**{**PERFILES[nombre], **opciones})
+
+    def reiniciar(self):
+        with self._lock:
+            self._rostros = np.empty((0, 4), np.int32)
+            self._cuadro = 0
+
+    def _reducir(self, gray):
+        if self.escala == 1:
+            return gray
+        return cv2.resize(gray, None, fx=self.escala, fy=self.escala,
+                          interpolation=cv2.INTER_AREA)
+
+    def _detectar(self, gray, minSize=None, maxSize=None):
+        opciones = {}
+        if minSize is not None:
+            opciones['minSize'] = minSize
+        if maxSize is not None:
+            opciones['maxSize'] = maxSize
+        rostros = load_cascade(self.cascada).detectMultiScale(
+            gray, scaleFactor=self.scaleFactor, minNeighbors=self.minNeighbors, **opciones)
+        return np.asarray(rostros, np.float64).reshape(-1, 4)
+
+    def _deteccion_completa(self, reducida):
+        minimo = None
+        if self.minSize is not None:
+            minimo = tuple(max(1, round(lado * self.escala)) for lado in self.minSize)
+        return self._detectar(reducida, minimo) / self.escala
+
+    def _buscar(self, reducida, rostro):
+        """Busca un rostro cerca de su posición anterior; None si se perdió."""
+        x, y, w, h = np.asarray(rostro, np.float64) * self.escala
+        alto, ancho = reducida.shape[:2]
+        x0, y0 = int(max(0, x - self.margen * w)), int(max(0, y - self.margen * h))
+        x1 = int(min(ancho, x + w + self.margen * w))
+        y1 = int(min(alto, y + h + self.margen * h))
+        minimo = (int(w / CRECIMIENTO_MAXIMO), int(h / CRECIMIENTO_MAXIMO))
+        maximo = (int(w * CRECIMIENTO_MAXIMO) + 1, int(h * CRECIMIENTO_MAXIMO) + 1)
+        if x1 - x0 < minimo[0] or y1 - y0 < minimo[1]:
+            return None
+        encontrados = self._detectar(reducida[y0:y1, x0:x1], minimo, maximo)
+        if not len(encontrados):
+            return None
+        # El más cercano al centro anterior
+        centros = encontrados[:, :2] + encontrados[:, 2:] / 2 + (x0, y0)
+        distancias = np.hypot(*(centros - (x + w / 2, y + h / 2)).T)
+        mejor = encontrados[np.argmin(distancias)]
+        return (mejor + (x0, y0, 0, 0)) / self.escala
+
+    def procesar(self, gray):
+        """Devuelve los rostros del cuadro en coordenadas del cuadro completo."""
+        with self._lock:
+            completa = self._cuadro % self.intervalo == 0
+            anteriores = self._rostros
+            self._cuadro += 1
+        reducida = self._reducir(gray)
+        if completa:
+            rostros = self._deteccion_completa(reducida)
+        else:
+            seguidos = [self._buscar(reducida, rostro) for rostro in anteriores]
+            rostros = np.array([r for r in seguidos if r is not None]).reshape(-1, 4)
+        rostros = np.rint(rostros).astype(np.int32)
+        with self._lock:
+            self._rostros = rostros
+            if completa:
+                self.detecciones_completas += 1
+            else:
+                self.busquedas += 1
+        return rostros
@@ -0,0 +1,159 @@
+"""Procesamiento por teselas de imágenes que no caben en memoria.
+
+Cada operación de ``filtros.OPERACIONES`` tiene un halo: los píxeles
+vecinos que necesita a cada lado (2 para un promedio 5x5, 8 para el
+Gaussiano 17x17, 2 para Sobel con ksize=5). Cada tesela se lee con su
+halo, se filtra y solo se escribe su parte central, así que el resultado
+es idéntico al de filtrar la imagen completa. El tamaño de tesela se
+elige para que la tesela, su salida y los intermedios del filtro quepan
+en el presupuesto de memoria.
+
+Las imágenes se leen y escriben como ``.npy`` mapeados en memoria; otros
+formatos se decodifican completos con OpenCV.
+
+Uso:
+    python -m procesamiento.teselas entrada.npy salida.npy -o pasa_banda --memoria 256
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from procesamiento.filtros import OPERACIONES
+
+# Píxeles de vecindad que cada operación necesita a cada lado
+HALOS = {
+    'promedio': 2,
+    'mediano': 2,
+    'laplaciano': 1,
+    'gradiente': 2,
+    'pasa_altas': 1,
+    'pasa_bajas': 2,
+    'pasa_banda': 8,
+    'rechaza_banda': 8,
+    'grises': 0,
+}
+
+# Bytes de trabajo por valor de entrada: entrada, salida e intermedios
+# (Laplaciano y Sobel trabajan en float64)
+BYTES_POR_VALOR = {
+    'laplaciano': 10,
+    'gradiente': 20,
+}
+BYTES_POR_VALOR_DEFECTO = 4
+
+MEMORIA_POR_DEFECTO = 256 * 2**20
+
+# Altura mínima de una franja de ancho completo antes de pasar a teselas cuadradas
+FILAS_MINIMAS = 64
+
+
+def halo(operacion):
+    if operacion not in HALOS:
+        # Canny depende de bordes conectados en toda la imagen (histéresis)
+        raise ValueError(f'La operación {operacion} no se puede procesar por teselas')
+    return HALOS[operacion]
+
+
+def tamano_tesela(forma, halo, bytes_por_pixel, memoria=MEMORIA_POR_DEFECTO):
+    """Alto y ancho de tesela (sin halo) que respetan el presupuesto de memoria.
+
+    Se prefieren franjas de ancho completo porque se leen de forma contigua.
+    """
+    alto, ancho = forma[:2]
+    pixeles = memoria // bytes_por_pixel
+    filas = pixeles // (ancho + 2 * halo) - 2 * halo
+    if filas >= min(FILAS_MINIMAS, alto):
+        return min(filas, alto), ancho
+    lado = math.isqrt(pixeles) - 2 * halo
+    if lado < 1:
+        raise ValueError('El presupuesto de memoria no alcanza para una tesela')
+    return min(lado, alto), min(lado, ancho)
+
+
+def teselas(forma, alto_tesela, ancho_tesela):
+    alto, ancho = forma[:2]
+    for y in range(0, alto, alto_tesela):
+        for x in range(0, ancho, ancho_tesela):
+            yield y, min(y + alto_tesela, alto), x, min(x + ancho_tesela, ancho)
+
+
+def _forma_salida(funcion, entrada, halo):
+    # Se prueba la operación en un recorte pequeño para saber canales y tipo
+    lado = 2 * halo + 8
+    muestra = funcion(np.ascontiguousarray(entrada[:lado, :lado]))
+    return entrada.shape[:2] + muestra.shape[2:], muestra.dtype
+
+
+def procesar_por_teselas(funcion, entrada, salida=None, halo=0,
+                         memoria=MEMORIA_POR_DEFECTO, bytes_por_valor=BYTES_POR_VALOR_DEFECTO):
+    """Aplica ``funcion`` a ``entrada`` por teselas y devuelve (salida, MP/s).
+
+    ``entrada`` puede ser un ``np.memmap``. ``salida`` puede ser un arreglo
+    o memmap ya creado, una ruta ``.npy`` o None para reservarla en memoria.
+    """
+    forma, tipo = _forma_salida(funcion, entrada, halo)
+    if salida is None:
+        salida = np.empty(forma, tipo)
+    elif isinstance(salida, (str, os.PathLike)):
+        salida = np.lib.format.open_memmap(salida, 'w+', tipo, forma)
+    canales = entrada.shape[2] if entrada.ndim == 3 else 1
+    alto_tesela, ancho_tesela = tamano_tesela(
+        entrada.shape, halo, canales * entrada.itemsize * bytes_por_valor, memoria)
+
+    alto, ancho = entrada.shape[:2]
+    inicio = time.perf_counter()
+    for y0, y1, x0, x1 in teselas(entrada.shape, alto_tesela, ancho_tesela):
+        ya, yb = max(0, y0 - halo), min(alto, y1 + halo)
+        xa, xb = max(0, x0 - halo), min(ancho, x1 + halo)
+        # En los bordes de la imagen no hay halo y OpenCV refleja igual
+        # que al filtrar la imagen completa
+        resultado = funcion(np.ascontiguousarray(entrada[ya:yb, xa:xb]))
+        salida[y0:y1, x0:x1] = resultado[y0 - ya:y1 - ya, x0 - xa:x1 - xa]
+    transcurrido = time.perf_counter() - inicio
+    if isinstance(salida, np.memmap):
+        salida.flush()
+    return salida, (alto * ancho / 1e6) / transcurrido if transcurrido else float('inf')
+
+
+def aplicar_operacion(operacion, entrada, salida=None, memoria=MEMORIA_POR_DEFECTO):
+    """Aplica una operación de ``filtros.OPERACIONES`` por teselas."""
+    return procesar_por_teselas(
+        OPERACIONES[operacion], entrada, salida, halo(operacion), memoria,
+        BYTES_POR_VALOR.get(operacion, BYTES_POR_VALOR_DEFECTO))
+
+
+def abrir_imagen(ruta):
+    """Abre ``.npy`` sin cargarlo (memmap); otros formatos se decodifican completos."""
+    if ruta.endswith('.npy'):
+        return np.load(ruta, mmap_mode='r')
+    imagen = cv2.imread(ruta, cv2.IMREAD_UNCHANGED)
+    if imagen is None:
+        raise OSError(f'No se pudo leer la imagen {ruta}')
+    return imagen
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Aplica un filtro por teselas con memoria acotada.')
+    parser.add_argument('entrada', help='Imagen de entrada (.npy para no cargarla completa)')
+    parser.add_argument('salida', help='Imagen de salida (.npy para escribir por teselas)')
+    parser.add_argument('-o', '--operacion', required=True, choices=sorted(HALOS))
+    parser.add_argument('--memoria', type=int, default=MEMORIA_POR_DEFECTO // 2**20,
+                        help='Presupuesto de memoria por tesela en MB')
+    args = parser.parse_args(argv)
+
+    entrada = abrir_imagen(args.entrada)
+    destino = args.salida if args.salida.endswith('.npy') else None
+    salida, mpx = aplicar_operacion(args.operacion, entrada, destino, args.memoria * 2**20)
+    if destino is None:
+        cv2.imwrite(args.salida, salida)
+    print(f'{args.operacion}: {entrada.shape[1]}x{entrada.shape[0]} a {mpx:.1f} MP/s')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
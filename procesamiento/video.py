@@ -0,0 +1,197 @@
+"""Pipeline de video en hilos: captura, procesamiento y entrega del último cuadro.
+
+La captura corre en su propio hilo y deja los cuadros en una cola acotada;
+un grupo de hilos los procesa (OpenCV libera el GIL) y deja los resultados
+en otra cola acotada. Cuando una cola está llena se descarta el cuadro más
+viejo en lugar de bloquear, de modo que una etapa lenta pierde cuadros pero
+nunca congela la interfaz. Si una etapa falla con un cuadro, ese cuadro
+se descarta, el error se cuenta en ``estadisticas`` y el hilo sigue.
+"""
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+
+
+class Estadisticas:
+    """Contadores de FPS y latencia por etapa, seguros entre hilos."""
+
+    def __init__(self, ventana=60):
+        self._lock = threading.Lock()
+        self._latencias = defaultdict(lambda: deque(maxlen=ventana))
+        self._marcas = defaultdict(lambda: deque(maxlen=ventana))
+        self.descartados = defaultdict(int)
+        self.cuadros = defaultdict(int)
+        self.errores = defaultdict(int)
+        self.ultimo_error = None
+
+    def registrar_latencia(self, etapa, segundos):
+        with self._lock:
+            self._latencias[etapa].append(segundos)
+
+    def registrar_cuadro(self, punto):
+        with self._lock:
+            self._marcas[punto].append(time.perf_counter())
+            self.cuadros[punto] += 1
+
+    def registrar_descarte(self, cola):
+        with self._lock:
+            self.descartados[cola] += 1
+
+    def registrar_error(self, etapa, error):
+        with self._lock:
+            self.errores[etapa] += 1
+            self.ultimo_error = (etapa, error)
+
+    def fps(self, punto):
+        with self._lock:
+            marcas = self._marcas[punto]
+            if len(marcas) < 2 or marcas[-1] == marcas[0]:
+                return 0.0
+            return (len(marcas) - 1) / (marcas[-1] - marcas[0])
+
+    def latencia_ms(self, etapa):
+        """Promedio de la ventana más reciente, en milisegundos."""
+        with self._lock:
+            valores = self._latencias[etapa]
+            return 1000 * sum(valores) / len(valores) if valores else 0.0
+
+    def resumen(self):
+        with self._lock:
+            etapas = list(self._latencias)
+            puntos = list(self._marcas)
+            descartados = dict(self.descartados)
+            errores = dict(self.errores)
+        return {
+            'fps': {punto: self.fps(punto) for punto in puntos},
+            'latencia_ms': {etapa: self.latencia_ms(etapa) for etapa in etapas},
+            'descartados': descartados,
+            'errores': errores,
+        }
+
+    def texto(self):
+        resumen = self.resumen()
+        fps = '  '.join(f'{p}: {v:.1f}' for p, v in resumen['fps'].items())
+        latencias = '  '.join(f'{e}: {v:.1f}' for e, v in resumen['latencia_ms'].items())
+        texto = f'FPS  {fps}\nms   {latencias}'
+        if resumen['errores']:
+            errores = '  '.join(f'{e}: {n}' for e, n in resumen['errores'].items())
+            etapa, error = self.ultimo_error
+            texto += f'\nErrores  {errores}  (último en {etapa}: {error})'
+        return texto
+
+
+def _poner_descartando(cola, elemento, estadisticas, nombre):
+    while True:
+        try:
+            cola.put_nowait(elemento)
+            return
+        except queue.Full:
+            try:
+                cola.get_nowait()
+                estadisticas.registrar_descarte(nombre)
+            except queue.Empty:
+                pass
+
+
+class PipelineVideo:
+    """Lee de ``fuente`` y aplica ``etapas`` en ``trabajadores`` hilos.
+
+    ``fuente`` es cualquier objeto con ``read() -> (ok, cuadro)`` como
+    ``cv2.VideoCapture``. ``etapas`` es una lista de ``(nombre, funcion)``
+    que se aplican en orden a cada cuadro; la latencia de cada una queda en
+    ``estadisticas``.
+    """
+
+    def __init__(self, fuente, etapas, trabajadores=2, capacidad=2):
+        self.fuente = fuente
+        self.etapas = etapas
+        self.estadisticas = Estadisticas()
+        self._entrada = queue.Queue(maxsize=capacidad)
+        self._salida = queue.Queue(maxsize=capacidad)
+        self._detener = threading.Event()
+        self._fin_captura = threading.Event()
+        self._ultimo_entregado = -1
+        self._hilos = [threading.Thread(target=self._capturar, daemon=True)]
+        self._hilos += [threading.Thread(target=self._procesar, daemon=True)
+                        for _ in range(trabajadores)]
+
+    def iniciar(self):
+        for hilo in self._hilos:
+            hilo.start()
+
+    def detener(self):
+        self._detener.set()
+        self.esperar()
+
+    def esperar(self):
+        """Bloquea hasta que la fuente se agota y se procesan los cuadros restantes."""
+        for hilo in self._hilos:
+            hilo.join()
+
+    @property
+    def activo(self):
+        return any(hilo.is_alive() for hilo in self._hilos)
+
+    def _capturar(self):
+        secuencia = 0
+        try:
+            while not self._detener.is_set():
+                inicio = time.perf_counter()
+                ok, cuadro = self.fuente.read()
+                if not ok:
+                    break
+                self.estadisticas.registrar_latencia('captura', time.perf_counter() - inicio)
+                self.estadisticas.registrar_cuadro('captura')
+                _poner_descartando(self._entrada, (secuencia, inicio, cuadro),
+                                   self.estadisticas, 'entrada')
+                secuencia += 1
+        except Exception as e:
+            # Una fuente que falla termina la captura como si se agotara
+            self.estadisticas.registrar_error('captura', e)
+        finally:
+            self._fin_captura.set()
+
+    def _procesar(self):
+        while not self._detener.is_set():
+            try:
+                secuencia, capturado, cuadro = self._entrada.get(timeout=0.05)
+            except queue.Empty:
+                if self._fin_captura.is_set():
+                    return
+                continue
+            try:
+                for nombre, funcion in self.etapas:
+                    inicio = time.perf_counter()
+                    cuadro = funcion(cuadro)
+                    self.estadisticas.registrar_latencia(nombre, time.perf_counter() - inicio)
+            except Exception as e:
+                # Se pierde solo este cuadro; el hilo sigue con los siguientes
+                self.estadisticas.registrar_error(nombre, e)
+                continue
+            self.estadisticas.registrar_cuadro('procesado')
+            _poner_descartando(self._salida, (secuencia, capturado, cuadro),
+                               self.estadisticas, 'salida')
+
+    def resultado(self):
+        """Devuelve el cuadro procesado más reciente, o None si no hay uno nuevo.
+
+        Los resultados que llegan fuera de orden desde otros hilos se descartan.
+        """
+        ultimo = None
+        while True:
+            try:
+                secuencia, capturado, cuadro = self._salida.get_nowait()
+            except queue.Empty:
+                break
+            if secuencia > self._ultimo_entregado:
+                self._ultimo_entregado = secuencia
+                ultimo = (capturado, cuadro)
+            else:
+                self.estadisticas.registrar_descarte('desordenados')
+        if ultimo is None:
+            return None
+        capturado, cuadro = ultimo
+        self.estadisticas.registrar_latencia('total', time.perf_counter() - capturado)
+        self.estadisticas.registrar_cuadro('mostrado')
+        return cuadro
@@ -1,22 +1,28 @@
 import sys
 import cv2
-import numpy as np
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import QApplication, QLabel, QMainWindow, QVBoxLayout, QPushButton, QWidget, QSlider, QHBoxLayout, QComboBox
 
+from interfaz.imagenes import array_to_qpixmap
+from procesamiento import hsv
+from procesamiento.filtros import apply_video_filter
+from procesamiento.fuentes import FuenteCamara, abrir_fuente
+from procesamiento.rostros import draw_faces
+from procesamiento.seguimiento import PERFILES, SeguidorRostros
+from procesamiento.video import PipelineVideo
+
 # Clase principal de la aplicación de detección de objetos
 
 
 class ObjectDetectionApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, source=None):
         super().__init__()
         self.setWindowTitle(
             "Sistema de Detección y Modificación Inteligente de Objetos")
         self.setGeometry(100, 100, 1000, 800)
 
-        # Captura de video con OpenCV
-        self.cap = cv2.VideoCapture(0)
+        # Cámara por defecto, o cualquier fuente de procesamiento.fuentes
+        self.cap = source if source is not None else FuenteCamara(0)
 
         # Widget principal
         self.central_widget = QWidget()
@@ -31,11 +37,22 @@ class ObjectDetectionApp(QMainWindow):
         self.video_label.setFixedSize(640, 480)
         self.layout.addWidget(self.video_label)
 
+        # FPS y latencia por etapa del pipeline
+        self.stats_label = QLabel(self)
+        self.layout.addWidget(self.stats_label)
+
         # Botones para detección y filtros
         self.haar_button = QPushButton("Detectar Rostros", self)
         self.haar_button.clicked.connect(self.toggle_haar_detection)
         self.control_layout.addWidget(self.haar_button)
 
+        # Precisión contra velocidad de la detección de rostros
+        self.face_mode_selector = QComboBox(self)
+        self.face_mode_selector.addItems(list(PERFILES))
+        self.face_mode_selector.setCurrentText("equilibrado")
+        self.face_mode_selector.currentTextChanged.connect(self.set_face_mode)
+        self.control_layout.addWidget(self.face_mode_selector)
+
         self.segment_color_button = QPushButton("Segmentar por Color", self)
         self.segment_color_button.clicked.connect(
             self.toggle_color_segmentation)
@@ -72,14 +89,29 @@ class ObjectDetectionApp(QMainWindow):
 
         # Variables
         self.apply_haar = False
+        self.face_tracker = SeguidorRostros.perfil("equilibrado")
         self.apply_color_segmentation = False
+        # Última máscara de color, empacada a un bit por píxel
+        self.color_mask = None
         self.hue_value = 90
         self.brightness_value = 0
         self.active_filter = None  # Filtro actual
-        self.haar_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + "haarcascade_frontalface_default.xml")
-
-        # Temporizador para el feed de video
+        # Los hilos de procesamiento no pueden consultar el QLabel
+        self.display_size = (self.video_label.width(),
+                             self.video_label.height())
+
+        # Captura y procesamiento en hilos; la GUI solo muestra el resultado
+        self.pipeline = PipelineVideo(self.cap, [
+            ("color", self.convert_color),
+            ("rostros", self.apply_haar_detection),
+            ("segmentacion", self.apply_segmentation),
+            ("hsv", self.apply_hsv_modifications),
+            ("filtro", self.apply_filter),
+            ("redimension", self.resize_frame),
+        ], trabajadores=2)
+        self.pipeline.iniciar()
+
+        # Temporizador para mostrar el último cuadro procesado
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_frame)
         self.timer.start(30)
@@ -88,10 +120,15 @@ class ObjectDetectionApp(QMainWindow):
     def toggle_haar_detection(self):
         self.apply_haar = not self.apply_haar
         if self.apply_haar:
+            self.face_tracker.reiniciar()
             self.haar_button.setText("Desactivar Rostros")
         else:
             self.haar_button.setText("Detectar Rostros")
 
+    # Método para cambiar el perfil de detección de rostros
+    def set_face_mode(self, name):
+        self.face_tracker = SeguidorRostros.perfil(name)
+
     # Método para activar/desactivar la segmentación por color
     def toggle_color_segmentation(self):
         self.apply_color_segmentation = not self.apply_color_segmentation
@@ -116,85 +153,67 @@ class ObjectDetectionApp(QMainWindow):
 
     # Método para aplicar el filtro seleccionado
     def apply_filter(self, frame):
-        if self.active_filter == "gaussian_blur":
-            return cv2.GaussianBlur(frame, (15, 15), 0)
-        elif self.active_filter == "sobel":
-            gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-            sobelx = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
-            sobely = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
-            sobel = cv2.magnitude(sobelx, sobely)
-            return cv2.cvtColor(np.uint8(sobel), cv2.COLOR_GRAY2RGB)
-        elif self.active_filter == "laplacian":
-            gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-            laplacian = cv2.Laplacian(gray, cv2.CV_64F)
-            return cv2.cvtColor(np.uint8(np.absolute(laplacian)), cv2.COLOR_GRAY2RGB)
-        return frame
+        return apply_video_filter(frame, self.active_filter)
 
     # Método para aplicar modificaciones HSV (tonalidad y brillo)
     def apply_hsv_modifications(self, frame):
-        hsv = cv2.cvtColor(frame, cv2.COLOR_RGB2HSV)
-        hue, sat, val = cv2.split(hsv)
-        hue[:] = self.hue_value
-        val = cv2.add(val, self.brightness_value)
-        modified_hsv = cv2.merge([hue, sat, val])
-        return cv2.cvtColor(modified_hsv, cv2.COLOR_HSV2RGB)
+        return hsv.set_hue_brightness(frame, self.hue_value, self.brightness_value)
 
     # Método para segmentar por color
     def segment_color(self, frame):
-        hsv = cv2.cvtColor(frame, cv2.COLOR_RGB2HSV)
-        lower_red = np.array([0, 100, 100])
-        upper_red = np.array([10, 255, 255])
-        mask = cv2.inRange(hsv, lower_red, upper_red)
-        segmented = cv2.bitwise_and(frame, frame, mask=mask)
-        return segmented
-
-    # Método para actualizar el frame del video
-    def update_frame(self):
-        ret, frame = self.cap.read()
-        if not ret:
-            return
+        self.color_mask = hsv.color_mask(frame)
+        return cv2.bitwise_and(frame, frame, mask=self.color_mask.a_uint8())
 
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    # Etapas del pipeline; corren en los hilos de procesamiento
+    def convert_color(self, frame):
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
-        # Aplicar detección de rostros con Haar Cascade
+    # Aplicar detección de rostros con Haar Cascade
+    def apply_haar_detection(self, frame):
         if self.apply_haar:
             gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-            faces = self.haar_cascade.detectMultiScale(
-                gray, scaleFactor=1.1, minNeighbors=5)
-            for (x, y, w, h) in faces:
-                cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 0), 2)
+            # Detección reducida cada pocos cuadros y seguimiento entre ellas
+            faces = self.face_tracker.procesar(gray)
+            draw_faces(frame, faces)
+        return frame
 
-        # Aplicar segmentación por color
+    def apply_segmentation(self, frame):
         if self.apply_color_segmentation:
-            frame = self.segment_color(frame)
-
-        # Aplicar modificaciones HSV (tonalidad y brillo)
-        frame = self.apply_hsv_modifications(frame)
+            return self.segment_color(frame)
+        return frame
 
-        # Aplicar filtro seleccionado
-        frame = self.apply_filter(frame)
+    # Redimensionar frame para ajustarlo al QLabel
+    def resize_frame(self, frame):
+        return cv2.resize(frame, self.display_size,
+                          interpolation=cv2.INTER_AREA)
 
-        # Redimensionar frame para ajustarlo al QLabel
-        label_width = self.video_label.width()
-        label_height = self.video_label.height()
-        frame = cv2.resize(frame, (label_width, label_height),
-                           interpolation=cv2.INTER_AREA)
+    # Método para mostrar el último frame procesado
+    def update_frame(self):
+        frame = self.pipeline.resultado()
+        stats = self.pipeline.estadisticas.texto()
+        mask = self.color_mask
+        if self.apply_color_segmentation and mask is not None:
+            # El área se cuenta sobre los bits empacados
+            stats += f"  Segmentado: {mask.area() / (mask.forma[0] * mask.forma[1]):.1%}"
+        self.stats_label.setText(stats)
+        if frame is None:
+            return
 
         # Mostrar frame
-        height, width, channel = frame.shape
-        step = channel * width
-        q_image = QImage(frame.data, width, height, step,
-                         QImage.Format.Format_RGB888)
-        self.video_label.setPixmap(QPixmap.fromImage(q_image))
+        self.video_label.setPixmap(array_to_qpixmap(frame, bgr=False))
 
     # Método para liberar la captura de video al cerrar la aplicación
     def closeEvent(self, event):
+        self.timer.stop()
+        self.pipeline.detener()
         self.cap.release()
 
 
 # Código principal
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    window = ObjectDetectionApp()
+    # proyectofinal.py [cámara | video | directorio de imágenes | sintetico]
+    source = abrir_fuente(sys.argv[1], repetir=True) if len(sys.argv) > 1 else None
+    window = ObjectDetectionApp(source)
     window.show()
     sys.exit(app.exec())
@@ -1,18 +1,20 @@
 import sys
 import cv2
-import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QLabel, QVBoxLayout, QWidget, QFileDialog, QScrollArea, QHBoxLayout, QPushButton
 )
-from PyQt6.QtGui import QPixmap, QImage
 from PyQt6.QtCore import Qt
-from matplotlib import pyplot as plt
+
+from interfaz.imagenes import array_to_qpixmap
+from procesamiento.histograma import dibujar_histograma, guardar_conteos, histograma_grises
+from procesamiento.intensidad import gamma_transform, log_transform
 
 
 class ImageProcessingApp(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Procesamiento de Imágenes")
+        self.hist_counts = None
         self.init_ui()
         self.load_image()
 
@@ -37,11 +39,13 @@ class ImageProcessingApp(QWidget):
             "Guardar Transformación Logarítmica", self)
         self.btn_save_gamma = QPushButton("Guardar Transformación Gamma", self)
         self.btn_save_hist = QPushButton("Guardar Histograma", self)
+        self.btn_export_counts = QPushButton("Exportar Conteos", self)
 
         self.btn_save_original.clicked.connect(self.save_original_image)
         self.btn_save_log.clicked.connect(self.save_log_image)
         self.btn_save_gamma.clicked.connect(self.save_gamma_image)
         self.btn_save_hist.clicked.connect(self.save_hist_image)
+        self.btn_export_counts.clicked.connect(self.export_hist_counts)
 
         top_row_layout = QHBoxLayout()
         top_row_layout.addWidget(self.original_title)
@@ -66,6 +70,7 @@ class ImageProcessingApp(QWidget):
         bottom_row_button_layout = QHBoxLayout()
         bottom_row_button_layout.addWidget(self.btn_save_gamma)
         bottom_row_button_layout.addWidget(self.btn_save_hist)
+        bottom_row_button_layout.addWidget(self.btn_export_counts)
 
         container_layout.addLayout(top_row_layout)
         container_layout.addLayout(top_row_image_layout)
@@ -103,41 +108,23 @@ class ImageProcessingApp(QWidget):
 
     def display_image(self, img, label):
         img = self.resize_image(img)
-        height, width, channel = img.shape
-        bytes_per_line = 3 * width
-        q_img = QImage(img.data, width, height, bytes_per_line,
-                       QImage.Format.Format_RGB888)
-        pixmap = QPixmap.fromImage(q_img)
-        label.setPixmap(pixmap)
+        label.setPixmap(array_to_qpixmap(img))
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
     def apply_log_transform(self):
-        img_float = np.float32(self.image) + 1
-        max_value = np.max(img_float)
-        if max_value == 0:
-            max_value = 1
-        c = 255 / np.log(1 + max_value)
-        log_image = c * (np.log(img_float + 1))
-        log_image[np.isnan(log_image)] = 0
-        log_image[np.isinf(log_image)] = 255
-        log_image = np.clip(log_image, 0, 255)
-        log_image = np.array(log_image, dtype=np.uint8)
+        log_image = log_transform(self.image)
         self.display_image(log_image, self.log_label)
         self.log_image = log_image
 
     def apply_gamma_transform(self):
-        gamma = 2.2
-        gamma_image = np.array(255 * (self.image / 255)
-                               ** gamma, dtype='uint8')
+        gamma_image = gamma_transform(self.image, 2.2)
         self.display_image(gamma_image, self.gamma_label)
         self.gamma_image = gamma_image
 
     def generate_histogram(self):
-        gray = cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY)
-        plt.hist(gray.ravel(), 256, [0, 256])
-        plt.savefig("histogram.png")
-        plt.close()
-        hist_img = cv2.imread("histogram.png")
+        # Conteos y dibujo en memoria; los conteos se pueden exportar
+        self.hist_counts = histograma_grises(self.image)
+        hist_img = dibujar_histograma(self.hist_counts)
         self.display_image(hist_img, self.hist_label)
         self.hist_img = hist_img
 
@@ -159,8 +146,21 @@ class ImageProcessingApp(QWidget):
     def save_hist_image(self):
         self.save_image(self.hist_img, "histogram.png")
 
+    def export_hist_counts(self):
+        if self.hist_counts is None:
+            return
+        file_name, _ = QFileDialog.getSaveFileName(
+            self, "Exportar Conteos", "histogram.csv", "CSV (*.csv);;NumPy (*.npy)")
+        if file_name:
+            guardar_conteos(file_name, self.hist_counts, ["grises"])
+
+
+def main():
+    app = QApplication(sys.argv)
+    window = ImageProcessingApp()
+    window.showMaximized()
+    sys.exit(app.exec())
+
 
-app = QApplication(sys.argv)
-window = ImageProcessingApp()
-window.showMaximized()
-sys.exit(app.exec())
+if __name__ == "__main__":
+    main()